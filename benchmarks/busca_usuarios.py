@@ -0,0 +1,106 @@
+"""
+Benchmark da busca de usuários: latência de buscar_linhas (prefixo,
+substring e filtros) contra um LIKE sem índice sobre lower(nome), com N
+usuários. Por padrão usa SQLite em memória; com --database-url mede no
+PostgreSQL (tabela criada com os índices de trigramas).
+
+Uso:
+    python -m benchmarks.busca_usuarios [--rows 200000] [--iterations 50]
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.config.database import Base, build_async_url
+from src.domain.entities.usuario import PerfilUsuario, Usuario
+from src.domain.repositories.filtro_usuarios import FiltroUsuarios, ModoBusca
+from src.infrastructure.database.models.usuario_model import UsuarioModel
+from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+
+NOMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Giovana", "Heitor", "Isabela", "João"]
+SOBRENOMES = ["Silva", "Souza", "Oliveira", "Pereira", "Lima", "Costa", "Ribeiro", "Almeida", "Nunes"]
+LOTE = 5000
+
+async def popular(session, rows: int) -> None:
+    repo = UsuarioRepository(session)
+    agora = datetime.utcnow()
+    for inicio in range(0, rows, LOTE):
+        await repo.criar_em_lote([
+            Usuario(
+                email=f"usuario{i}@exemplo.com",
+                senha_hash="x" * 60,
+                nome=f"{random.choice(NOMES)} {random.choice(SOBRENOMES)} {i}",
+                perfil=PerfilUsuario.ADMIN if i % 100 == 0 else PerfilUsuario.USUARIO,
+                ativo=i % 10 != 0,
+                ultimo_login=agora - timedelta(minutes=i)
+            )
+            for i in range(inicio, min(rows, inicio + LOTE))
+        ])
+    await session.commit()
+
+async def medir(fn, iterations: int) -> float:
+    await fn()  # aquecimento
+    inicio = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - inicio) / iterations * 1000
+
+async def executar(database_url: str, rows: int, iterations: int) -> None:
+    engine = create_async_engine(build_async_url(database_url))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        await popular(session, rows)
+        repo = UsuarioRepository(session)
+
+        async def sem_indice():
+            # LIKE com curinga no início: nenhum índice se aplica
+            stmt = (
+                select(UsuarioModel.id)
+                .where(func.lower(UsuarioModel.nome).like("%giovana silva 12%"))
+                .order_by(UsuarioModel.data_criacao, UsuarioModel.id)
+                .limit(100)
+            )
+            (await session.execute(stmt)).all()
+
+        cenarios = {
+            "sem índice (LIKE '%termo%')": sem_indice,
+            "prefixo 'usuario12345'": lambda: repo.buscar_linhas(
+                FiltroUsuarios(termo="usuario12345"), 100
+            ),
+            "substring 'silva 12'": lambda: repo.buscar_linhas(
+                FiltroUsuarios(termo="silva 12", modo=ModoBusca.SUBSTRING), 100
+            ),
+            "filtros (admin, ativo, 1 dia)": lambda: repo.buscar_linhas(
+                FiltroUsuarios(
+                    perfil=PerfilUsuario.ADMIN,
+                    ativo=True,
+                    ultimo_login_de=datetime.utcnow() - timedelta(days=1)
+                ),
+                100
+            ),
+        }
+        print(f"busca de usuários ({rows} linhas, {engine.dialect.name})")
+        for nome, fn in cenarios.items():
+            print(f"{nome:<32} {await medir(fn, iterations):8.2f} ms")
+
+    await engine.dispose()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default="sqlite:///:memory:")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(executar(args.database_url, args.rows, args.iterations))
+
+if __name__ == "__main__":
+    main()
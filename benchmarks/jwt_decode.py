@@ -0,0 +1,40 @@
+"""
+Micro-benchmark de decode_token com e sem o cache de tokens verificados.
+
+Uso:
+    python -m benchmarks.jwt_decode [--iterations 50000]
+"""
+import argparse
+import time
+from uuid import uuid4
+
+from src.infrastructure.auth.jwt_handler import create_access_token, decode_token
+
+def medir(token: str, iterations: int, use_cache: bool) -> float:
+    decode_token(token, use_cache=use_cache)  # aquecimento
+    inicio = time.perf_counter()
+    for _ in range(iterations):
+        decode_token(token, use_cache=use_cache)
+    return iterations / (time.perf_counter() - inicio)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+
+    token = create_access_token({
+        "sub": str(uuid4()),
+        "email": "usuario@exemplo.com",
+        "nome": "Usuário Benchmark",
+        "perfil": "usuario"
+    })
+
+    sem_cache = medir(token, args.iterations, use_cache=False)
+    com_cache = medir(token, args.iterations, use_cache=True)
+
+    print(f"decode_token sem cache: {sem_cache:12,.0f} ops/s")
+    print(f"decode_token com cache: {com_cache:12,.0f} ops/s")
+    print(f"ganho:                  {com_cache / sem_cache:12.1f}x")
+
+if __name__ == "__main__":
+    main()
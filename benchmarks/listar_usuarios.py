@@ -0,0 +1,86 @@
+"""
+Benchmark da listagem de usuários (1000 linhas por página): caminho antigo
+(modelo ORM -> entidade -> UsuarioResponse validado -> validação do
+response_model -> JSON) contra o caminho rápido (colunas -> dicts -> orjson).
+
+Uso:
+    python -m benchmarks.listar_usuarios [--rows 1000] [--iterations 200]
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.application.dtos.usuario_dto import UsuarioResponse
+from src.config.database import Base
+from src.domain.entities.usuario import Usuario
+from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+from src.presentation.api.serialization import json_bytes
+
+response_model = TypeAdapter(List[UsuarioResponse])
+
+async def caminho_antigo(repo: UsuarioRepository, rows: int) -> bytes:
+    usuarios = await repo.listar(0, rows)
+    itens = [
+        UsuarioResponse(
+            id=usuario.id,
+            email=usuario.email,
+            nome=usuario.nome,
+            perfil=usuario.perfil,
+            ativo=usuario.ativo,
+            data_criacao=usuario.data_criacao,
+            data_atualizacao=usuario.data_atualizacao,
+            ultimo_login=usuario.ultimo_login
+        )
+        for usuario in usuarios
+    ]
+    # O que o FastAPI faz com o retorno quando há response_model
+    return response_model.dump_json(response_model.validate_python(itens))
+
+async def caminho_rapido(repo: UsuarioRepository, rows: int) -> bytes:
+    return json_bytes(await repo.listar_linhas(0, rows))
+
+async def medir(fn, repo: UsuarioRepository, rows: int, iterations: int) -> float:
+    await fn(repo, rows)  # aquecimento
+    inicio = time.perf_counter()
+    for _ in range(iterations):
+        await fn(repo, rows)
+    return (time.perf_counter() - inicio) / iterations * 1000
+
+async def executar(rows: int, iterations: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        repo = UsuarioRepository(session)
+        await repo.criar_em_lote([
+            Usuario(email=f"usuario{i}@exemplo.com", senha_hash="x" * 60, nome=f"Usuário {i}")
+            for i in range(rows)
+        ])
+        await session.commit()
+
+        antigo = await medir(caminho_antigo, repo, rows, iterations)
+        rapido = await medir(caminho_rapido, repo, rows, iterations)
+
+    await engine.dispose()
+
+    print(f"listar_usuarios ({rows} linhas)")
+    print(f"caminho antigo: {antigo:8.2f} ms/página")
+    print(f"caminho rápido: {rapido:8.2f} ms/página")
+    print(f"ganho:          {antigo / rapido:8.1f}x")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(executar(args.rows, args.iterations))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Latência de verificação de senha por algoritmo: bcrypt em alguns custos e
+argon2id com os parâmetros configurados (PASSWORD_ARGON2_*), em uma thread
+e com o pool do PasswordHasher saturado.
+
+Uso:
+    python -m benchmarks.password_hashers [--iterations 20] [--workers 4]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Tuple
+
+from src.application.interfaces.password_hash_interface import PasswordHashAlgorithm
+from src.application.services.hasher_registry import HasherRegistry
+from src.config.settings import get_settings
+from src.infrastructure.auth.hash_algorithms import Argon2idHashAlgorithm, BcryptHashAlgorithm
+from src.infrastructure.auth.password_hasher import PasswordHasher
+
+SENHA = "senha_de_benchmark"
+
+def medir_sequencial(algoritmo: PasswordHashAlgorithm, senha_hash: str, iterations: int) -> List[float]:
+    algoritmo.verify(SENHA, senha_hash)  # aquecimento
+    amostras = []
+    for _ in range(iterations):
+        inicio = time.perf_counter()
+        algoritmo.verify(SENHA, senha_hash)
+        amostras.append((time.perf_counter() - inicio) * 1000)
+    return amostras
+
+async def medir_pool(algoritmo: PasswordHashAlgorithm, senha_hash: str, iterations: int, workers: int) -> float:
+    hasher = PasswordHasher(
+        max_workers=workers,
+        max_pending=iterations,
+        registry=HasherRegistry(algoritmo)
+    )
+    try:
+        inicio = time.perf_counter()
+        await asyncio.gather(*(hasher.verify(SENHA, senha_hash) for _ in range(iterations)))
+        return iterations / (time.perf_counter() - inicio)
+    finally:
+        hasher.shutdown()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--bcrypt-rounds", type=int, nargs="+", default=[10, 12])
+    args = parser.parse_args()
+
+    settings = get_settings()
+    algoritmos: List[Tuple[str, PasswordHashAlgorithm]] = [
+        (f"bcrypt custo {rounds}", BcryptHashAlgorithm(rounds=rounds)) for rounds in args.bcrypt_rounds
+    ]
+    algoritmos.append((
+        f"argon2id t={settings.PASSWORD_ARGON2_TIME_COST} "
+        f"m={settings.PASSWORD_ARGON2_MEMORY_KIB}KiB p={settings.PASSWORD_ARGON2_PARALLELISM}",
+        Argon2idHashAlgorithm(
+            time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+            memory_cost=settings.PASSWORD_ARGON2_MEMORY_KIB,
+            parallelism=settings.PASSWORD_ARGON2_PARALLELISM
+        )
+    ))
+
+    print(f"{'algoritmo':<36} {'p50 ms':>8} {'p95 ms':>8} {'pool ops/s':>11}")
+    for nome, algoritmo in algoritmos:
+        senha_hash = algoritmo.hash(SENHA)
+        amostras = sorted(medir_sequencial(algoritmo, senha_hash, args.iterations))
+        p95 = amostras[min(len(amostras) - 1, int(len(amostras) * 0.95))]
+        vazao = asyncio.run(medir_pool(algoritmo, senha_hash, args.iterations * args.workers, args.workers))
+        print(f"{nome:<36} {statistics.median(amostras):8.1f} {p95:8.1f} {vazao:11.1f}")
+
+if __name__ == "__main__":
+    main()
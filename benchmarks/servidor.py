@@ -0,0 +1,232 @@
+"""
+Benchmark de vazão do servidor: compara o comando de desenvolvimento do
+docker-compose (uvicorn --reload, um processo, loop asyncio e parser h11)
+com o servidor de produção (python -m src: workers por CPU, uvloop e
+httptools, preload).
+
+Cada modo sobe como um processo à parte contra o mesmo banco (SQLite em
+arquivo temporário ou --database-url). O gerador de carga usa conexões
+HTTP/1.1 persistentes em --load-procs processos, para não disputar o
+event loop com o servidor medido; em máquinas com poucas CPUs o gerador
+e o servidor competem pelos mesmos núcleos, então compare resultados da
+mesma máquina.
+
+Uso:
+    python -m benchmarks.servidor [--requests 20000] [--concurrency 64] [--workers 4]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.api_load import _commit_atual, _percentil
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SENHA = "senha_benchmark"
+
+def _porta_livre() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _comando(modo: str, porta: int, workers: Optional[int]) -> List[str]:
+    if modo == "dev":
+        # Comando do docker-compose, com o loop e o parser de uma imagem sem uvloop/httptools
+        return [
+            sys.executable, "-m", "uvicorn", "src.main:app", "--host", "127.0.0.1",
+            "--port", str(porta), "--reload", "--loop", "asyncio", "--http", "h11"
+        ]
+    comando = [sys.executable, "-m", "src", "--host", "127.0.0.1", "--port", str(porta)]
+    if workers:
+        comando += ["--workers", str(workers)]
+    return comando
+
+def _requisitar(url: str, dados: Optional[Dict] = None) -> Dict:
+    corpo = json.dumps(dados).encode() if dados is not None else None
+    requisicao = urllib.request.Request(url, data=corpo, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(requisicao, timeout=10) as resposta:
+        return json.loads(resposta.read())
+
+def _aguardar(porta: int, prazo: float = 30.0) -> None:
+    limite = time.monotonic() + prazo
+    while True:
+        try:
+            _requisitar(f"http://127.0.0.1:{porta}/")
+            return
+        except OSError:
+            if time.monotonic() > limite:
+                raise
+            time.sleep(0.2)
+
+async def _conexao(porta: int, alvo: bytes, total: int, latencias: List[float]) -> int:
+    reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+    erros = 0
+    try:
+        for _ in range(total):
+            inicio = time.perf_counter()
+            writer.write(alvo)
+            status = int((await reader.readline()).split()[1])
+            tamanho = 0
+            while True:
+                linha = await reader.readline()
+                if linha in (b"\r\n", b""):
+                    break
+                nome, _, valor = linha.partition(b":")
+                if nome.strip().lower() == b"content-length":
+                    tamanho = int(valor)
+            await reader.readexactly(tamanho)
+            latencias.append((time.perf_counter() - inicio) * 1000)
+            erros += status >= 400
+    finally:
+        writer.close()
+    return erros
+
+def _gerar_carga(porta: int, alvo: bytes, conexoes: int, por_conexao: int) -> Tuple[List[float], int]:
+    async def executar() -> Tuple[List[float], int]:
+        latencias: List[float] = []
+        erros = await asyncio.gather(*(
+            _conexao(porta, alvo, por_conexao, latencias) for _ in range(conexoes)
+        ))
+        return latencias, sum(erros)
+
+    return asyncio.run(executar())
+
+def _medir(porta: int, caminho: str, headers: Dict[str, str], args: argparse.Namespace) -> Dict:
+    linhas = [f"GET {caminho} HTTP/1.1", "Host: bench"] + [f"{k}: {v}" for k, v in headers.items()]
+    alvo = ("\r\n".join(linhas) + "\r\n\r\n").encode()
+    conexoes = max(1, args.concurrency // args.load_procs)
+    por_conexao = max(1, args.requests // (conexoes * args.load_procs))
+
+    # Aquecimento (imports tardios, caches e pools de conexão de cada worker)
+    _gerar_carga(porta, alvo, conexoes, 20)
+
+    inicio = time.perf_counter()
+    with multiprocessing.get_context("spawn").Pool(args.load_procs) as pool:
+        partes = pool.starmap(_gerar_carga, [(porta, alvo, conexoes, por_conexao)] * args.load_procs)
+    duracao = time.perf_counter() - inicio
+
+    latencias = [latencia for parte, _ in partes for latencia in parte]
+    return {
+        "requisicoes": len(latencias),
+        "erros": sum(erros for _, erros in partes),
+        "duracao_s": round(duracao, 3),
+        "vazao_rps": round(len(latencias) / duracao, 1),
+        "p50_ms": round(_percentil(latencias, 50), 2),
+        "p95_ms": round(_percentil(latencias, 95), 2),
+        "p99_ms": round(_percentil(latencias, 99), 2),
+    }
+
+async def _preparar_banco(database_url: str) -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from src.config.database import Base, build_async_url
+    from src.infrastructure.database.models import usuario_contador_model, usuario_model  # noqa: F401
+
+    engine = create_async_engine(build_async_url(database_url))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+def executar_modo(modo: str, args: argparse.Namespace, ambiente: Dict[str, str]) -> Dict:
+    porta = _porta_livre()
+    processo = subprocess.Popen(
+        _comando(modo, porta, args.workers),
+        cwd=RAIZ,
+        env=ambiente,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    try:
+        _aguardar(porta)
+        base = f"http://127.0.0.1:{porta}/api/v1"
+        email = f"bench-{modo}@exemplo.com"
+        _requisitar(f"{base}/usuarios", {"email": email, "nome": "Benchmark", "senha": SENHA})
+        token = _requisitar(f"{base}/auth/login", {"email": email, "senha": SENHA})["access_token"]
+
+        resultados = {}
+        for cenario, caminho, headers in (
+            ("health", "/", {}),
+            ("usuarios_me", "/api/v1/usuarios/me", {"Authorization": f"Bearer {token}"}),
+        ):
+            resultados[cenario] = _medir(porta, caminho, headers, args)
+            item = resultados[cenario]
+            print(
+                f"{modo:9} {cenario:12} {item['vazao_rps']:9.1f} req/s  p50 {item['p50_ms']:7.2f} ms  "
+                f"p95 {item['p95_ms']:7.2f} ms  p99 {item['p99_ms']:7.2f} ms  erros {item['erros']}",
+                flush=True
+            )
+        return resultados
+    finally:
+        # O reloader e o supervisor encerram os próprios filhos
+        os.killpg(processo.pid, signal.SIGTERM)
+        try:
+            processo.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            os.killpg(processo.pid, signal.SIGKILL)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="padrão: SQLite em arquivo temporário")
+    parser.add_argument("--requests", type=int, default=20000, help="requisições por cenário")
+    parser.add_argument("--concurrency", type=int, default=64, help="conexões simultâneas")
+    parser.add_argument("--workers", type=int, default=None, help="workers do modo produção (padrão: por CPU)")
+    parser.add_argument("--load-procs", type=int, default=2, help="processos do gerador de carga")
+    parser.add_argument("--modes", nargs="*", default=["dev", "producao"])
+    parser.add_argument("--output", default=None, help="arquivo JSON de saída")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        database_url = args.database_url or f"sqlite:///{os.path.join(diretorio, 'bench.db')}"
+        ambiente = {
+            **os.environ,
+            "DATABASE_URL": database_url,
+            "DEBUG": "false",
+            "PASSWORD_HASH_ROUNDS": "4",
+            "LOGIN_RATE_LIMIT_ENABLED": "false",
+        }
+        resultados = {}
+        for modo in args.modes:
+            asyncio.run(_preparar_banco(database_url))
+            resultados[modo] = executar_modo(modo, args, ambiente)
+
+    if "dev" in resultados and "producao" in resultados:
+        print()
+        for cenario, item in resultados["producao"].items():
+            base = resultados["dev"][cenario]["vazao_rps"]
+            print(f"{cenario:12} produção / dev: {item['vazao_rps'] / base:5.2f}x")
+
+    resultado = {
+        "commit": _commit_atual(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "cpus": os.cpu_count(),
+        "parametros": {
+            "database": (args.database_url or "sqlite").split("://")[0],
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+            "load_procs": args.load_procs,
+        },
+        "resultados": resultados,
+    }
+    saida = args.output or os.path.join(
+        os.path.dirname(__file__), "results", f"servidor-{resultado['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, "w") as arquivo:
+        json.dump(resultado, arquivo, indent=2)
+    print(f"\nResultados gravados em {saida}")
+
+if __name__ == "__main__":
+    main()
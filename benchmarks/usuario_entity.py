@@ -0,0 +1,96 @@
+"""
+Benchmark de materialização de entidades Usuario: tempo e memória para
+montar N entidades a partir de linhas do banco com o dataclass antigo (sem
+__slots__, __post_init__ a cada instância), com o construtor atual e com
+Usuario.from_persistence.
+
+Uso:
+    python -m benchmarks.usuario_entity [--count 100000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from src.domain.entities.usuario import PerfilUsuario, Usuario
+
+@dataclass
+class UsuarioLegado:
+    """Cópia da entidade antes de __slots__/from_persistence, para comparação."""
+    email: str
+    senha_hash: str
+    nome: str
+    perfil: PerfilUsuario = PerfilUsuario.USUARIO
+    id: UUID = None
+    ativo: bool = True
+    data_criacao: datetime = None
+    data_atualizacao: datetime = None
+    ultimo_login: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.id is None:
+            self.id = uuid4()
+        if self.data_criacao is None:
+            self.data_criacao = datetime.utcnow()
+        self.data_atualizacao = datetime.utcnow()
+        if not self.email or len(self.email.strip()) == 0 or "@" not in self.email:
+            raise ValueError("Email inválido")
+        if not self.nome or len(self.nome.strip()) == 0:
+            raise ValueError("O nome não pode ser vazio")
+
+def gerar_linhas(count: int) -> List[Dict]:
+    agora = datetime.utcnow()
+    return [
+        {
+            "id": uuid4(),
+            "email": f"usuario{i}@exemplo.com",
+            "senha_hash": "$2b$12$" + "x" * 53,
+            "nome": f"Usuário {i}",
+            "perfil": PerfilUsuario.USUARIO,
+            "ativo": True,
+            "data_criacao": agora,
+            "data_atualizacao": agora,
+            "ultimo_login": None,
+        }
+        for i in range(count)
+    ]
+
+def medir(fabrica: Callable[[Dict], object], linhas: List[Dict]) -> Tuple[float, float]:
+    """Retorna (segundos, bytes alocados por entidade)."""
+    gc.collect()
+    inicio = time.perf_counter()
+    entidades = [fabrica(linha) for linha in linhas]
+    duracao = time.perf_counter() - inicio
+    del entidades
+
+    gc.collect()
+    tracemalloc.start()
+    entidades = [fabrica(linha) for linha in linhas]
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entidades
+    return duracao, memoria / len(linhas)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    linhas = gerar_linhas(args.count)
+    cenarios = {
+        "dataclass antigo": lambda linha: UsuarioLegado(**linha),
+        "Usuario(...)": lambda linha: Usuario(**linha),
+        "Usuario.from_persistence": lambda linha: Usuario.from_persistence(**linha),
+    }
+
+    print(f"{args.count} entidades")
+    for nome, fabrica in cenarios.items():
+        duracao, por_entidade = medir(fabrica, linhas)
+        print(f"{nome:26} {duracao * 1000:8.1f} ms  {por_entidade:6.0f} bytes/entidade")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+
+from src.config.server import main
+
+sys.exit(main())
@@ -1,8 +1,8 @@
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Dict, List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, model_validator, validator
 
 from src.domain.entities.usuario import PerfilUsuario
 
@@ -32,6 +32,56 @@ class UsuarioResponse(UsuarioBase):
     class Config:
         orm_mode = True
 
+class UsuarioEstatisticas(BaseModel):
+    total: int
+    # True quando o total veio da estimativa do banco, não dos contadores
+    total_estimado: bool = False
+    por_perfil: Dict[PerfilUsuario, int]
+    ativos: int
+    inativos: int
+    cadastros_por_dia: Dict[date, int]
+    # Janela em dias -> usuários com login nesse período
+    ativos_nos_ultimos_dias: Dict[int, int]
+
+# Limite de IDs por chamada de batch-get
+MAX_IDS_BATCH_GET = 5000
+
+class UsuarioBatchGetRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=MAX_IDS_BATCH_GET)
+
+class UsuarioBatchGetResponse(BaseModel):
+    """Usuários encontrados, na ordem pedida (sem repetições), e os IDs inexistentes."""
+    itens: List[UsuarioResponse]
+    nao_encontrados: List[UUID]
+
+class UsuarioImportItem(UsuarioBase):
+    """
+    Linha de importação em lote: aceita a senha em texto ou um hash já
+    existente de um dos algoritmos suportados (validado na importação).
+    """
+    senha: Optional[str] = Field(None, min_length=8)
+    senha_hash: Optional[str] = Field(None, min_length=1)
+    perfil: PerfilUsuario = PerfilUsuario.USUARIO
+
+    @model_validator(mode="after")
+    def _exigir_senha_ou_hash(self):
+        if (self.senha is None) == (self.senha_hash is None):
+            raise ValueError("Informe exatamente um entre senha e senha_hash")
+        return self
+
+class UsuarioImportResult(BaseModel):
+    linha: int
+    email: Optional[str] = None
+    status: Literal["criado", "duplicado", "invalido"]
+    id: Optional[UUID] = None
+    erro: Optional[str] = None
+
+class UsuarioImportResponse(BaseModel):
+    total: int
+    criados: int
+    falhas: int
+    resultados: List[UsuarioImportResult]
+
 class LoginRequest(BaseModel):
     email: EmailStr
     senha: str
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import List, Mapping, Optional, Sequence
+
+class CacheInterface(ABC):
+    """
+    Porta para um cache chave/valor (bytes), compartilhado ou não entre
+    workers. Falhas do backend não devem derrubar a requisição: leituras
+    viram ausência e escritas são ignoradas.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Lê várias chaves em uma única ida ao backend."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        """Grava várias chaves, com o mesmo TTL, em uma única ida ao backend."""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str, ttl: Optional[float] = None) -> int:
+        """
+        Incrementa um contador (criado com 0 se não existir) e retorna o novo
+        valor. Com `ttl`, o contador expira esse tempo após o incremento.
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+class PasswordHashAlgorithm(ABC):
+    """
+    Porta para um algoritmo de hash de senha. Os métodos são síncronos e
+    custosos: quem chama decide onde executá-los (ver PasswordHasher).
+    """
+
+    nome: str
+
+    @abstractmethod
+    def reconhece(self, senha_hash: str) -> bool:
+        """Indica se o hash armazenado foi gerado por este algoritmo."""
+        pass
+
+    @abstractmethod
+    def hash(self, senha: str) -> str:
+        pass
+
+    @abstractmethod
+    def verify(self, senha: str, senha_hash: str) -> bool:
+        pass
+
+    @abstractmethod
+    def precisa_rehash(self, senha_hash: str) -> bool:
+        """Indica se o hash usa parâmetros diferentes dos configurados."""
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+class RateLimiterInterface(ABC):
+    """
+    Porta para um limitador de taxa por chave. Cada chave tem uma
+    capacidade (rajada permitida) e uma taxa de reposição em unidades
+    por segundo.
+    """
+
+    @abstractmethod
+    async def consumir(self, chave: str, capacidade: int, reposicao_por_segundo: float) -> float:
+        """
+        Consome uma unidade da chave. Retorna 0 se havia saldo, ou quantos
+        segundos faltam para a próxima unidade ficar disponível.
+        """
+        pass
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager
+
+from src.domain.repositories.usuario_repository_interface import UsuarioRepositoryInterface
+
+class UnitOfWorkInterface(ABC):
+    """
+    Unidade de trabalho: agrupa as operações de um caso de uso em uma única
+    transação. Os repositórios apenas enviam as alterações (flush); o commit
+    acontece uma vez, ao final do comando.
+
+    Uso em comandos:
+        async with uow:
+            ...
+            await uow.commit()
+
+    Uso em consultas (sem commit; pode ser atendido por uma réplica):
+        async with uow.somente_leitura():
+            ...
+    """
+
+    usuarios: UsuarioRepositoryInterface
+
+    @abstractmethod
+    async def __aenter__(self) -> "UnitOfWorkInterface":
+        pass
+
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Desfaz a transação se ela não foi confirmada ou se houve erro."""
+        pass
+
+    @abstractmethod
+    def somente_leitura(self) -> AsyncContextManager["UnitOfWorkInterface"]:
+        """Escopo de leitura: nunca faz commit e pode usar uma conexão de réplica."""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
@@ -0,0 +1,27 @@
+from typing import Optional, Sequence
+
+from src.application.interfaces.password_hash_interface import PasswordHashAlgorithm
+
+class HasherRegistry:
+    """
+    Algoritmos de hash de senha aceitos pela aplicação. Novos hashes usam
+    o `padrao`; os demais só verificam senhas antigas, que são refeitas
+    com o padrão no próximo login bem-sucedido.
+    """
+
+    def __init__(self, padrao: PasswordHashAlgorithm, legados: Sequence[PasswordHashAlgorithm] = ()):
+        self.padrao = padrao
+        self.algoritmos = [padrao, *(algoritmo for algoritmo in legados if algoritmo is not padrao)]
+
+    def identificar(self, senha_hash: str) -> Optional[PasswordHashAlgorithm]:
+        """Algoritmo que gerou o hash, ou None se o formato for desconhecido."""
+        for algoritmo in self.algoritmos:
+            if algoritmo.reconhece(senha_hash):
+                return algoritmo
+        return None
+
+    def precisa_rehash(self, senha_hash: str) -> bool:
+        algoritmo = self.identificar(senha_hash)
+        if algoritmo is None:
+            return False
+        return algoritmo is not self.padrao or algoritmo.precisa_rehash(senha_hash)
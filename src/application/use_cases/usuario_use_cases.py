@@ -1,39 +1,66 @@
+import base64
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
 
-import bcrypt
-
+from src.application.interfaces.unit_of_work_interface import UnitOfWorkInterface
 from src.application.dtos.usuario_dto import (
     UsuarioCreate, 
     UsuarioUpdate, 
     UsuarioResponse, 
+    UsuarioBatchGetResponse,
+    UsuarioEstatisticas,
+    UsuarioImportItem,
+    UsuarioImportResult,
     TokenResponse
 )
 from src.config.settings import get_settings
-from src.domain.entities.usuario import Usuario
+from src.domain.entities.usuario import PerfilUsuario, Usuario
+from src.domain.repositories.filtro_usuarios import FiltroUsuarios
 from src.domain.exceptions.domain_exceptions import (
     DomainValidationError, 
     EntityNotFoundError, 
     AuthenticationError
 )
-from src.domain.repositories.usuario_repository_interface import UsuarioRepositoryInterface
-from src.infrastructure.auth.jwt_handler import create_access_token
+from src.infrastructure.auth.jwt_handler import create_access_token, revoke_user_tokens
+from src.infrastructure.auth.password_hasher import PasswordHasher, get_password_hasher
+from src.infrastructure.auth.rate_limiter import LoginRateLimiter, get_login_rate_limiter
+from src.infrastructure.cache.principal_cache import PrincipalCache, get_principal_cache
+from src.infrastructure.database.last_login_recorder import LastLoginRecorder, get_last_login_recorder
+from src.infrastructure.database.password_rehasher import PasswordRehasher, get_password_rehasher
 
 settings = get_settings()
 
+# Limites da consulta de estatísticas
+MAX_DIAS_ESTATISTICAS = 366
+MAX_JANELAS_ATIVOS = 5
+
 class UsuarioUseCases:
-    def __init__(self, usuario_repository: UsuarioRepositoryInterface):
-        self.usuario_repository = usuario_repository
+    def __init__(
+        self, 
+        uow: UnitOfWorkInterface,
+        password_hasher: Optional[PasswordHasher] = None,
+        principal_cache: Optional[PrincipalCache] = None,
+        last_login_recorder: Optional[LastLoginRecorder] = None,
+        login_rate_limiter: Optional[LoginRateLimiter] = None,
+        password_rehasher: Optional[PasswordRehasher] = None
+    ):
+        self.uow = uow
+        self.password_hasher = password_hasher or get_password_hasher()
+        self.principal_cache = principal_cache or get_principal_cache()
+        self.last_login_recorder = last_login_recorder or get_last_login_recorder()
+        self.login_rate_limiter = login_rate_limiter or get_login_rate_limiter()
+        self.password_rehasher = password_rehasher or get_password_rehasher()
     
     async def criar_usuario(self, usuario_create: UsuarioCreate) -> UsuarioResponse:
         # Verificar se já existe usuário com este email
-        usuario_existente = await self.usuario_repository.obter_por_email(usuario_create.email)
+        async with self.uow.somente_leitura():
+            usuario_existente = await self.uow.usuarios.obter_por_email(usuario_create.email)
         if usuario_existente:
             raise DomainValidationError(f"Já existe um usuário com o email {usuario_create.email}")
         
         # Hash da senha
-        senha_hash = self._gerar_hash_senha(usuario_create.senha)
+        senha_hash = await self._gerar_hash_senha(usuario_create.senha)
         
         # Criar entidade de usuário
         usuario = Usuario(
@@ -44,91 +71,316 @@ class UsuarioUseCases:
         )
         
         # Salvar no repositório
-        usuario_criado = await self.usuario_repository.criar(usuario)
+        async with self.uow:
+            usuario_criado = await self.uow.usuarios.criar(usuario)
+            await self.uow.commit()
         
         # Retornar DTO de resposta
         return self._converter_para_dto(usuario_criado)
     
+    async def importar_usuarios(
+        self, 
+        itens: Sequence[Tuple[int, UsuarioImportItem]], 
+        tamanho_lote: int = 1000
+    ) -> List[UsuarioImportResult]:
+        """
+        Importa usuários em lotes: uma consulta de emails existentes e um
+        INSERT multi-linha por lote, com os hashes calculados em paralelo.
+        Recebe pares (número da linha, item) e devolve um resultado por linha.
+        """
+        resultados: List[UsuarioImportResult] = []
+        emails_vistos = set()
+        
+        for inicio in range(0, len(itens), tamanho_lote):
+            lote = []
+            for linha, item in itens[inicio:inicio + tamanho_lote]:
+                if item.senha_hash is not None and not self.password_hasher.reconhece(item.senha_hash):
+                    resultados.append(UsuarioImportResult(
+                        linha=linha, email=item.email, status="invalido",
+                        erro="senha_hash em formato não suportado"
+                    ))
+                    continue
+                if item.email in emails_vistos:
+                    resultados.append(UsuarioImportResult(
+                        linha=linha, email=item.email, status="duplicado",
+                        erro="Email repetido na importação"
+                    ))
+                    continue
+                emails_vistos.add(item.email)
+                lote.append((linha, item))
+            
+            async with self.uow.somente_leitura():
+                existentes = await self.uow.usuarios.obter_emails_existentes(
+                    item.email for _, item in lote
+                )
+            novos = []
+            for linha, item in lote:
+                if item.email in existentes:
+                    resultados.append(UsuarioImportResult(
+                        linha=linha, email=item.email, status="duplicado",
+                        erro=f"Já existe um usuário com o email {item.email}"
+                    ))
+                else:
+                    novos.append((linha, item))
+            
+            # Hash das senhas em texto no pool de workers, em paralelo
+            senhas = [item.senha for _, item in novos if item.senha_hash is None]
+            hashes = iter(await self.password_hasher.hash_many(senhas))
+            
+            usuarios = []
+            for linha, item in novos:
+                try:
+                    usuario = Usuario(
+                        email=item.email,
+                        senha_hash=item.senha_hash or next(hashes),
+                        nome=item.nome,
+                        perfil=item.perfil
+                    )
+                except DomainValidationError as e:
+                    resultados.append(UsuarioImportResult(
+                        linha=linha, email=item.email, status="invalido", erro=str(e)
+                    ))
+                    continue
+                usuarios.append((linha, usuario))
+            
+            # Uma transação por lote
+            async with self.uow:
+                inseridos = await self.uow.usuarios.criar_em_lote(
+                    [usuario for _, usuario in usuarios]
+                )
+                await self.uow.commit()
+            for linha, usuario in usuarios:
+                if usuario.email in inseridos:
+                    resultados.append(UsuarioImportResult(
+                        linha=linha, email=usuario.email, status="criado", id=usuario.id
+                    ))
+                else:
+                    # Inserido concorrentemente por outra requisição
+                    resultados.append(UsuarioImportResult(
+                        linha=linha, email=usuario.email, status="duplicado",
+                        erro=f"Já existe um usuário com o email {usuario.email}"
+                    ))
+        
+        return resultados
+    
     async def atualizar_usuario(
         self, 
         usuario_id: UUID, 
         usuario_update: UsuarioUpdate
     ) -> UsuarioResponse:
-        # Buscar usuário existente
-        usuario = await self.usuario_repository.obter_por_id(usuario_id)
-        if not usuario:
-            raise EntityNotFoundError(f"Usuário com ID {usuario_id} não encontrado")
-        
-        # Atualizar campos
+        # Montar apenas os campos alterados; a unicidade do email é garantida
+        # pela constraint do banco, sem consulta prévia
+        campos = {}
         if usuario_update.email is not None:
-            # Verificar se o novo email já está em uso por outro usuário
-            if usuario_update.email != usuario.email:
-                usuario_existente = await self.usuario_repository.obter_por_email(usuario_update.email)
-                if usuario_existente and usuario_existente.id != usuario_id:
-                    raise DomainValidationError(f"Email {usuario_update.email} já está em uso")
-            usuario.email = usuario_update.email
+            campos["email"] = usuario_update.email
         
         if usuario_update.nome is not None:
-            usuario.nome = usuario_update.nome
+            campos["nome"] = usuario_update.nome
         
         if usuario_update.senha is not None:
-            usuario.senha_hash = self._gerar_hash_senha(usuario_update.senha)
+            campos["senha_hash"] = await self._gerar_hash_senha(usuario_update.senha)
         
         if usuario_update.perfil is not None:
-            usuario.perfil = usuario_update.perfil
+            campos["perfil"] = usuario_update.perfil
         
         if usuario_update.ativo is not None:
-            if usuario_update.ativo:
-                usuario.ativar()
-            else:
-                usuario.desativar()
+            campos["ativo"] = usuario_update.ativo
         
         # Atualizar data de modificação
-        usuario.data_atualizacao = datetime.utcnow()
+        campos["data_atualizacao"] = datetime.utcnow()
         
-        # Salvar no repositório
-        usuario_atualizado = await self.usuario_repository.atualizar(usuario)
+        # Salvar no repositório (UPDATE ... RETURNING)
+        async with self.uow:
+            usuario_atualizado = await self.uow.usuarios.atualizar_campos(usuario_id, campos)
+            if not usuario_atualizado:
+                raise EntityNotFoundError(f"Usuário com ID {usuario_id} não encontrado")
+            await self.uow.commit()
+        
+        self.principal_cache.invalidate(usuario_id)
+        if not usuario_atualizado.ativo:
+            revoke_user_tokens(usuario_id)
         
         # Retornar DTO de resposta
         return self._converter_para_dto(usuario_atualizado)
     
     async def obter_usuario(self, usuario_id: UUID) -> UsuarioResponse:
-        usuario = await self.usuario_repository.obter_por_id(usuario_id)
+        async with self.uow.somente_leitura():
+            usuario = await self.uow.usuarios.obter_por_id(usuario_id)
         if not usuario:
             raise EntityNotFoundError(f"Usuário com ID {usuario_id} não encontrado")
         
         return self._converter_para_dto(usuario)
     
-    async def listar_usuarios(self, skip: int = 0, limit: int = 100) -> List[UsuarioResponse]:
-        usuarios = await self.usuario_repository.listar(skip, limit)
-        return [self._converter_para_dto(usuario) for usuario in usuarios]
+    async def obter_versao_usuario(self, usuario_id: UUID) -> Tuple[datetime, Optional[datetime]]:
+        """
+        Versão do usuário, (data_atualizacao, ultimo_login), para requisições
+        condicionais: não carrega nem converte o registro inteiro.
+        """
+        async with self.uow.somente_leitura():
+            versao = await self.uow.usuarios.obter_versao(usuario_id)
+        if versao is None:
+            raise EntityNotFoundError(f"Usuário com ID {usuario_id} não encontrado")
+        
+        return versao
+    
+    async def obter_usuarios_por_ids(self, usuario_ids: Sequence[UUID]) -> UsuarioBatchGetResponse:
+        """
+        Obtém vários usuários de uma vez: os IDs são deduplicados e buscados
+        em uma chamada a obter_por_ids.
+        """
+        ids = list(dict.fromkeys(usuario_ids))
+        async with self.uow.somente_leitura():
+            encontrados = await self.uow.usuarios.obter_por_ids(ids)
+        
+        itens = []
+        nao_encontrados = []
+        for usuario_id in ids:
+            usuario = encontrados.get(usuario_id)
+            if usuario is None:
+                nao_encontrados.append(usuario_id)
+            else:
+                itens.append(self._converter_para_dto(usuario))
+        return UsuarioBatchGetResponse.model_construct(itens=itens, nao_encontrados=nao_encontrados)
+    
+    async def listar_usuarios_linhas(
+        self, 
+        skip: int = 0, 
+        limit: int = 100, 
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Caminho rápido da listagem: devolve os campos públicos como dicts
+        vindos direto do banco (já no formato de UsuarioResponse), sem montar
+        entidades nem DTOs, e o cursor da próxima página.
+        """
+        # Buscar um registro a mais para saber se existe próxima página
+        apos = self._decodificar_cursor(cursor) if cursor is not None else None
+        async with self.uow.somente_leitura():
+            linhas = await self.uow.usuarios.listar_linhas(skip, limit + 1, apos)
+        
+        return self._paginar_linhas(linhas, limit)
+    
+    async def buscar_usuarios_linhas(
+        self, 
+        filtro: FiltroUsuarios, 
+        limit: int = 100, 
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Busca por nome/email e filtros, no mesmo formato e com a mesma
+        paginação por cursor de listar_usuarios_linhas.
+        """
+        apos = self._decodificar_cursor(cursor) if cursor is not None else None
+        async with self.uow.somente_leitura():
+            linhas = await self.uow.usuarios.buscar_linhas(filtro, limit + 1, apos)
+        
+        return self._paginar_linhas(linhas, limit)
+    
+    async def obter_estatisticas(
+        self, 
+        dias_cadastros: int = 30, 
+        janelas_ativos: Sequence[int] = (1, 7, 30), 
+        total_estimado: bool = False
+    ) -> UsuarioEstatisticas:
+        """
+        Totais por perfil e situação e cadastros por dia, lidos dos contadores
+        mantidos a cada escrita, e usuários ativos (com login) em cada janela.
+        Com `total_estimado`, o total vem da estimativa do banco, quando houver.
+        """
+        janelas = sorted(set(janelas_ativos))
+        if not 1 <= dias_cadastros <= MAX_DIAS_ESTATISTICAS:
+            raise DomainValidationError(f"O período de cadastros deve ter entre 1 e {MAX_DIAS_ESTATISTICAS} dias")
+        if len(janelas) > MAX_JANELAS_ATIVOS or any(not 1 <= dias <= MAX_DIAS_ESTATISTICAS for dias in janelas):
+            raise DomainValidationError(
+                f"Informe até {MAX_JANELAS_ATIVOS} janelas de atividade, de 1 a {MAX_DIAS_ESTATISTICAS} dias"
+            )
+        
+        agora = datetime.utcnow()
+        inicio_cadastros = agora.date() - timedelta(days=dias_cadastros - 1)
+        async with self.uow.somente_leitura():
+            grupos = await self.uow.usuarios.contar_por_grupo()
+            cadastros = await self.uow.usuarios.contar_cadastros_por_dia(inicio_cadastros)
+            ativos_recentes = {
+                dias: await self.uow.usuarios.contar_ativos_desde(agora - timedelta(days=dias))
+                for dias in janelas
+            }
+            estimativa = await self.uow.usuarios.estimar_total() if total_estimado else None
+        
+        por_perfil = {perfil: 0 for perfil in PerfilUsuario}
+        for (perfil, _), total in grupos.items():
+            por_perfil[perfil] += total
+        ativos = sum(total for (_, ativo), total in grupos.items() if ativo)
+        
+        return UsuarioEstatisticas.model_construct(
+            total=estimativa if estimativa is not None else sum(grupos.values()),
+            total_estimado=estimativa is not None,
+            por_perfil=por_perfil,
+            ativos=ativos,
+            inativos=sum(grupos.values()) - ativos,
+            cadastros_por_dia={
+                inicio_cadastros + timedelta(days=i): cadastros.get(inicio_cadastros + timedelta(days=i), 0)
+                for i in range(dias_cadastros)
+            },
+            ativos_nos_ultimos_dias=ativos_recentes
+        )
+    
+    def exportar_usuarios(self, batch_size: int = 1000) -> AsyncIterator[Mapping[str, Any]]:
+        # Linhas entregues direto do banco, sem materializar entidades/DTOs
+        return self.uow.usuarios.exportar(batch_size)
     
     async def remover_usuario(self, usuario_id: UUID) -> bool:
-        usuario = await self.usuario_repository.obter_por_id(usuario_id)
-        if not usuario:
-            raise EntityNotFoundError(f"Usuário com ID {usuario_id} não encontrado")
+        async with self.uow:
+            removido = await self.uow.usuarios.remover(usuario_id)
+            if not removido:
+                raise EntityNotFoundError(f"Usuário com ID {usuario_id} não encontrado")
+            await self.uow.commit()
         
-        return await self.usuario_repository.remover(usuario_id)
+        self.principal_cache.invalidate(usuario_id)
+        revoke_user_tokens(usuario_id)
+        return removido
     
-    async def autenticar_usuario(self, email: str, senha: str) -> TokenResponse:
-        usuario = await self.usuario_repository.obter_por_email(email)
+    async def autenticar_usuario(self, email: str, senha: str, ip: Optional[str] = None) -> TokenResponse:
+        # Tentativas acima do limite são recusadas antes do banco e do bcrypt
+        if self.login_rate_limiter is not None:
+            await self.login_rate_limiter.verificar(email, ip)
+        
+        # A leitura termina antes do bcrypt para não manter uma conexão
+        # do pool presa durante a verificação da senha
+        async with self.uow.somente_leitura():
+            usuario = await self.uow.usuarios.obter_por_email(email)
         if not usuario:
+            # Mesmo custo de uma senha errada: o tempo não revela se o email existe
+            await self.password_hasher.verify_dummy(senha)
+            raise AuthenticationError("Email ou senha inválidos")
+        
+        # A senha é verificada antes do estado da conta: uma conta desativada
+        # custa o mesmo que as demais e só se revela com a senha correta
+        if not await self._verificar_senha(senha, usuario.senha_hash):
             raise AuthenticationError("Email ou senha inválidos")
         
         if not usuario.ativo:
             raise AuthenticationError("Usuário desativado")
         
-        if not self._verificar_senha(senha, usuario.senha_hash):
-            raise AuthenticationError("Email ou senha inválidos")
-        
         # Registrar login
         usuario.registrar_login()
-        await self.usuario_repository.atualizar(usuario)
+        if self.last_login_recorder is not None:
+            # Gravado em lote, fora do caminho crítico do login
+            self.last_login_recorder.registrar(usuario.id, usuario.ultimo_login)
+        else:
+            async with self.uow:
+                await self.uow.usuarios.registrar_logins({usuario.id: usuario.ultimo_login})
+                await self.uow.commit()
+        self.principal_cache.invalidate(usuario.id)
+        
+        # Hash com algoritmo ou custo antigo: refeito em segundo plano
+        if self.password_rehasher is not None and self.password_hasher.needs_rehash(usuario.senha_hash):
+            self.password_rehasher.agendar(usuario.id, senha, usuario.senha_hash)
         
         # Gerar token JWT
         token_data = {
             "sub": str(usuario.id),
             "email": usuario.email,
+            "nome": usuario.nome,
             "perfil": usuario.perfil
         }
         
@@ -143,21 +395,42 @@ class UsuarioUseCases:
             usuario=self._converter_para_dto(usuario)
         )
     
-    def _gerar_hash_senha(self, senha: str) -> str:
-        # Gerar salt e hash da senha
-        senha_bytes = senha.encode('utf-8')
-        salt = bcrypt.gensalt()
-        senha_hash = bcrypt.hashpw(senha_bytes, salt)
-        return senha_hash.decode('utf-8')
+    async def _gerar_hash_senha(self, senha: str) -> str:
+        # Hash executado no pool dedicado para não bloquear o event loop
+        return await self.password_hasher.hash(senha)
     
-    def _verificar_senha(self, senha: str, senha_hash: str) -> bool:
+    async def _verificar_senha(self, senha: str, senha_hash: str) -> bool:
         # Verificar senha
-        senha_bytes = senha.encode('utf-8')
-        senha_hash_bytes = senha_hash.encode('utf-8')
-        return bcrypt.checkpw(senha_bytes, senha_hash_bytes)
+        return await self.password_hasher.verify(senha, senha_hash)
+    
+    def _paginar_linhas(
+        self, 
+        linhas: List[Dict[str, Any]], 
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        # A consulta traz um registro a mais: se ele veio, há próxima página
+        proximo_cursor = None
+        if len(linhas) > limit:
+            linhas = linhas[:limit]
+            proximo_cursor = self._codificar_cursor(linhas[-1]["data_criacao"], linhas[-1]["id"])
+        return linhas, proximo_cursor
+    
+    def _codificar_cursor(self, data_criacao: datetime, usuario_id: UUID) -> str:
+        # Cursor opaco com a chave de ordenação (data_criacao, id)
+        chave = f"{data_criacao.isoformat()}|{usuario_id}"
+        return base64.urlsafe_b64encode(chave.encode('utf-8')).decode('ascii')
+    
+    def _decodificar_cursor(self, cursor: str) -> Tuple[datetime, UUID]:
+        try:
+            chave = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+            data_criacao, usuario_id = chave.split("|")
+            return datetime.fromisoformat(data_criacao), UUID(usuario_id)
+        except (ValueError, UnicodeError):
+            raise DomainValidationError("Cursor de paginação inválido")
     
     def _converter_para_dto(self, usuario: Usuario) -> UsuarioResponse:
-        return UsuarioResponse(
+        # A entidade já foi validada: monta o DTO sem validar de novo
+        return UsuarioResponse.model_construct(
             id=usuario.id,
             email=usuario.email,
             nome=usuario.nome,
@@ -1,20 +1,111 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from typing import Any, AsyncGenerator, Dict, Optional
 
-from src.config.settings import get_settings
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
 
-settings = get_settings()
+from src.config.settings import Settings, get_settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Drivers assíncronos utilizados para cada dialeto suportado
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
 
 Base = declarative_base()
 
+engine: Optional[AsyncEngine] = None
+SessionLocal: Optional[async_sessionmaker] = None
+
+def build_async_url(database_url: str) -> str:
+    """
+    Converte a URL configurada para o driver assíncrono correspondente.
+    Ex.: postgresql://... -> postgresql+asyncpg://...
+    """
+    scheme, separator, rest = database_url.partition("://")
+    backend = scheme.split("+", 1)[0]
+    driver = ASYNC_DRIVERS.get(backend)
+    if not driver:
+        return database_url
+    return f"{backend}+{driver}{separator}{rest}"
+
+def build_engine_options(settings: Settings) -> Dict[str, Any]:
+    """
+    Monta as opções do engine (pool e timeouts) a partir das configurações.
+    """
+    url = make_url(build_async_url(settings.DATABASE_URL))
+    options: Dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+    if url.get_backend_name() == "sqlite":
+        # SQLite não usa QueuePool; os parâmetros de tamanho do pool não se aplicam
+        return options
+
+    options.update(
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    )
+
+    if url.get_backend_name() == "postgresql" and settings.DATABASE_STATEMENT_TIMEOUT_MS > 0:
+        options["connect_args"] = {
+            "server_settings": {
+                "statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT_MS)
+            }
+        }
+
+    return options
+
+def init_engine(settings: Optional[Settings] = None) -> AsyncEngine:
+    """
+    Cria o engine assíncrono e a fábrica de sessões (idempotente).
+    """
+    global engine, SessionLocal
+
+    if engine is None:
+        settings = settings or get_settings()
+        engine = create_async_engine(
+            build_async_url(settings.DATABASE_URL),
+            **build_engine_options(settings)
+        )
+        SessionLocal = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+    return engine
+
+async def dispose_engine() -> None:
+    """
+    Fecha todas as conexões do pool e descarta o engine.
+    """
+    global engine, SessionLocal
+
+    if engine is not None:
+        await engine.dispose()
+    engine = None
+    SessionLocal = None
+
+def get_session_factory() -> async_sessionmaker:
+    """
+    Fábrica de sessões para uso fora do ciclo de uma requisição
+    (ex.: tarefas em segundo plano).
+    """
+    if SessionLocal is None:
+        init_engine()
+    return SessionLocal
+
 # Dependency para obter uma sessão do banco de dados
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_session_factory()() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
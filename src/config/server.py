@@ -0,0 +1,263 @@
+import argparse
+import logging
+import math
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import uvicorn
+
+from src.config.settings import Settings, get_settings
+
+logger = logging.getLogger("uvicorn.error")
+
+APP = "src.main:app"
+
+# Código de saída do uvicorn para falha no startup do lifespan (o módulo que
+# exporta a constante varia entre versões)
+STARTUP_FAILURE = 3
+
+# Worker que sai antes disso é reiniciado só após uma pausa (evita laço de reinício)
+VIDA_MINIMA_WORKER_SECONDS = 1.0
+
+# Definida pelo supervisor no ambiente de cada worker: "1" só no principal
+VARIAVEL_WORKER_PRINCIPAL = "SERVER_WORKER_PRINCIPAL"
+
+def cpus_disponiveis() -> int:
+    """
+    CPUs que o processo pode usar: afinidade do processo e, em containers,
+    a cota do cgroup v2 (cpu.max), que os.cpu_count() ignora.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as arquivo:
+            cota, periodo = arquivo.read().split()
+        if cota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(cota) / int(periodo))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+def worker_principal() -> bool:
+    """
+    Indica se este processo executa as tarefas que devem rodar uma vez por
+    servidor, e não em cada worker (ex.: reconciliação das estatísticas).
+    Fora do supervisor (um worker, testes) é sempre verdadeiro.
+    """
+    return os.environ.get(VARIAVEL_WORKER_PRINCIPAL, "1") == "1"
+
+def numero_de_workers(settings: Settings) -> int:
+    # Aplicação assíncrona: um worker por CPU já ocupa os núcleos
+    return settings.SERVER_WORKERS if settings.SERVER_WORKERS > 0 else cpus_disponiveis()
+
+def build_server_config(settings: Settings, app: str = APP) -> uvicorn.Config:
+    """
+    Configuração do uvicorn para produção: uvloop e httptools quando
+    instalados ("auto"), sem reloader, lifespan obrigatório (falha na
+    subida encerra o worker) e desligamento gracioso limitado.
+    """
+    return uvicorn.Config(
+        app,
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        loop="auto",
+        http="auto",
+        lifespan="on",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY or None,
+        limit_max_requests=settings.SERVER_MAX_REQUESTS or None,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+        access_log=settings.SERVER_ACCESS_LOG,
+        server_header=False,
+    )
+
+class Supervisor:
+    """
+    Processo principal do servidor com vários workers.
+
+    Abre o socket uma vez e, com preload, importa a aplicação antes do
+    fork: os workers herdam os módulos já carregados (subida mais rápida,
+    páginas compartilhadas por copy-on-write) e disputam as conexões no
+    mesmo socket. Conexões, pools e tarefas são criados no lifespan de
+    cada worker, depois do fork.
+
+    O worker da posição 0 (inclusive quando substituído) é o principal,
+    que executa as tarefas únicas do servidor (ver worker_principal).
+
+    SIGTERM/SIGINT são repassados aos workers, que param de aceitar
+    conexões, concluem as requisições em andamento e executam o shutdown
+    do lifespan; quem passar do prazo recebe SIGKILL. Workers que saem
+    fora do desligamento (falha ou SERVER_MAX_REQUESTS) são substituídos;
+    falha na subida de um worker encerra o servidor.
+    """
+
+    def __init__(self, config: uvicorn.Config, workers: int, preload: bool = True):
+        self.config = config
+        self.workers = workers
+        self.preload = preload
+        # pid -> (início, posição)
+        self._pids: Dict[int, Tuple[float, int]] = {}
+        self._socket: Optional[socket.socket] = None
+        self._encerrando = False
+        self._prazo: Optional[float] = None
+        self.codigo_saida = 0
+
+    def run(self) -> int:
+        if self.preload:
+            self.config.load()
+
+        self._socket = self.config.bind_socket()
+        # Conexões esperam na fila do kernel enquanto os workers sobem
+        self._socket.listen(self.config.backlog)
+
+        signal.signal(signal.SIGTERM, self._encerrar)
+        signal.signal(signal.SIGINT, self._encerrar)
+        logger.info("Iniciando %d workers (pid principal %d)", self.workers, os.getpid())
+        try:
+            for posicao in range(self.workers):
+                self._iniciar_worker(posicao)
+            while self._pids:
+                self._recolher_workers()
+                if self._prazo is not None and time.monotonic() > self._prazo:
+                    logger.error("Prazo de desligamento excedido; encerrando %d workers", len(self._pids))
+                    self._sinalizar(signal.SIGKILL)
+                    self._prazo = None
+                time.sleep(0.2)
+        finally:
+            self._socket.close()
+        return self.codigo_saida
+
+    def _iniciar_worker(self, posicao: int) -> None:
+        pid = os.fork()
+        if pid:
+            self._pids[pid] = (time.monotonic(), posicao)
+            return
+
+        os.environ[VARIAVEL_WORKER_PRINCIPAL] = "1" if posicao == 0 else "0"
+
+        # Worker: o uvicorn instala os próprios handlers de sinal durante o run
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        codigo = 0
+        try:
+            server = uvicorn.Server(self.config)
+            server.run(sockets=[self._socket])
+            if not server.started:
+                codigo = STARTUP_FAILURE
+        except SystemExit as exc:
+            codigo = exc.code if isinstance(exc.code, int) else 1
+        except BaseException:
+            logger.exception("Falha no worker %d", os.getpid())
+            codigo = 1
+        finally:
+            os._exit(codigo)
+
+    def _recolher_workers(self) -> None:
+        while self._pids:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._pids.clear()
+                return
+            if pid == 0:
+                return
+
+            worker = self._pids.pop(pid, None)
+            if worker is None:
+                continue
+            inicio, posicao = worker
+            _marcar_worker_encerrado(pid)
+            codigo = os.waitstatus_to_exitcode(status)
+            if self._encerrando:
+                continue
+
+            if codigo == STARTUP_FAILURE:
+                logger.error("Worker %d falhou na inicialização; encerrando o servidor", pid)
+                self.codigo_saida = STARTUP_FAILURE
+                self._encerrar()
+                continue
+
+            logger.warning("Worker %d saiu (código %d); iniciando outro", pid, codigo)
+            if time.monotonic() - inicio < VIDA_MINIMA_WORKER_SECONDS:
+                time.sleep(VIDA_MINIMA_WORKER_SECONDS)
+            self._iniciar_worker(posicao)
+
+    def _encerrar(self, sig: Optional[int] = None, frame=None) -> None:
+        if self._encerrando:
+            return
+        self._encerrando = True
+        graceful = self.config.timeout_graceful_shutdown or 0
+        self._prazo = time.monotonic() + graceful + 5
+        logger.info("Encerrando %d workers", len(self._pids))
+        self._sinalizar(signal.SIGTERM)
+
+    def _sinalizar(self, sig: int) -> None:
+        for pid in list(self._pids):
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+
+def _marcar_worker_encerrado(pid: int) -> None:
+    # Remove os gauges do worker que saiu sem passar pelo shutdown do lifespan
+    try:
+        from src.infrastructure.instrumentation import metrics
+    except Exception:
+        return
+    metrics.marcar_worker_encerrado(pid)
+
+def _preparar_metricas_multiprocesso(settings: Settings) -> Optional[str]:
+    """
+    Métricas de vários workers exigem PROMETHEUS_MULTIPROC_DIR antes da
+    importação da aplicação. Sem diretório configurado, usa um temporário
+    (retornado para ser removido no fim); arquivos de execuções anteriores
+    são apagados.
+    """
+    if not settings.METRICS_ENABLED:
+        return None
+
+    diretorio = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if diretorio is None:
+        diretorio = tempfile.mkdtemp(prefix="fastapi-ddd-metrics-")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = diretorio
+        return diretorio
+
+    os.makedirs(diretorio, exist_ok=True)
+    for nome in os.listdir(diretorio):
+        if nome.endswith(".db"):
+            os.remove(os.path.join(diretorio, nome))
+    return None
+
+def main(argv: Optional[List[str]] = None) -> int:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(prog="python -m src", description="Servidor de produção da API")
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=numero_de_workers(settings), help="padrão: um por CPU")
+    args = parser.parse_args(argv)
+
+    settings = settings.model_copy(update={"SERVER_HOST": args.host, "SERVER_PORT": args.port})
+    config = build_server_config(settings)
+
+    if args.workers <= 1:
+        server = uvicorn.Server(config)
+        server.run()
+        return 0 if server.started else STARTUP_FAILURE
+
+    diretorio_metricas = _preparar_metricas_multiprocesso(settings)
+    try:
+        return Supervisor(config, args.workers, preload=settings.SERVER_PRELOAD).run()
+    finally:
+        if diretorio_metricas is not None:
+            shutil.rmtree(diretorio_metricas, ignore_errors=True)
@@ -10,7 +10,7 @@ class PerfilUsuario(str, Enum):
     ADMIN = "admin"
     USUARIO = "usuario"
 
-@dataclass
+@dataclass(slots=True)
 class Usuario:
     email: str
     senha_hash: str
@@ -31,11 +31,42 @@ class Usuario:
         if self.data_criacao is None:
             self.data_criacao = datetime.utcnow()
         
-        self.data_atualizacao = datetime.utcnow()
+        if self.data_atualizacao is None:
+            self.data_atualizacao = self.data_criacao
             
         # Validações
         self._validar()
     
+    @classmethod
+    def from_persistence(
+        cls,
+        id: UUID,
+        email: str,
+        senha_hash: str,
+        nome: str,
+        perfil: PerfilUsuario,
+        ativo: bool,
+        data_criacao: datetime,
+        data_atualizacao: datetime,
+        ultimo_login: Optional[datetime] = None
+    ) -> "Usuario":
+        """
+        Reconstrói um usuário já persistido. Os dados vieram do banco e já
+        foram validados na criação: não gera ID, não valida e preserva as
+        datas gravadas.
+        """
+        usuario = cls.__new__(cls)
+        usuario.id = id
+        usuario.email = email
+        usuario.senha_hash = senha_hash
+        usuario.nome = nome
+        usuario.perfil = perfil
+        usuario.ativo = ativo
+        usuario.data_criacao = data_criacao
+        usuario.data_atualizacao = data_atualizacao
+        usuario.ultimo_login = ultimo_login
+        return usuario
+    
     def _validar(self) -> None:
         if not self.email or len(self.email.strip()) == 0:
             raise DomainValidationError("O email não pode ser vazio")
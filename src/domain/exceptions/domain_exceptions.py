@@ -16,4 +16,10 @@ class AuthenticationError(DomainException):
 
 class AuthorizationError(DomainException):
     """Exceção lançada quando há um erro de autorização."""
-    pass
\ No newline at end of file
+    pass
+
+class TooManyRequestsError(DomainException):
+    """Exceção lançada quando a capacidade de processamento está esgotada."""
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
\ No newline at end of file
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from src.domain.entities.usuario import PerfilUsuario
+from src.domain.exceptions.domain_exceptions import DomainValidationError
+
+# Abaixo disso a busca por substring não usa índice de trigramas
+TAMANHO_MINIMO_SUBSTRING = 3
+
+class ModoBusca(str, Enum):
+    PREFIXO = "prefixo"
+    SUBSTRING = "substring"
+
+@dataclass(frozen=True)
+class FiltroUsuarios:
+    """
+    Critérios da busca de usuários. `termo` é procurado em nome e email,
+    sem diferenciar maiúsculas (a normalização fica com o repositório, que
+    precisa reproduzir o lower() do banco); os demais campos são filtros
+    combinados com E. Datas são intervalos fechados; None não restringe.
+    """
+    termo: Optional[str] = None
+    modo: ModoBusca = ModoBusca.PREFIXO
+    perfil: Optional[PerfilUsuario] = None
+    ativo: Optional[bool] = None
+    criado_de: Optional[datetime] = None
+    criado_ate: Optional[datetime] = None
+    ultimo_login_de: Optional[datetime] = None
+    ultimo_login_ate: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.termo is not None:
+            object.__setattr__(self, "termo", self.termo.strip() or None)
+        if (
+            self.termo is not None
+            and self.modo == ModoBusca.SUBSTRING
+            and len(self.termo) < TAMANHO_MINIMO_SUBSTRING
+        ):
+            raise DomainValidationError(
+                f"A busca por substring exige ao menos {TAMANHO_MINIMO_SUBSTRING} caracteres"
+            )
+        for inicio, fim in (
+            (self.criado_de, self.criado_ate),
+            (self.ultimo_login_de, self.ultimo_login_ate),
+        ):
+            if inicio is not None and fim is not None and inicio > fim:
+                raise DomainValidationError("Intervalo de datas inválido: início posterior ao fim")
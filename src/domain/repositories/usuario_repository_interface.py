@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 from uuid import UUID
 
-from src.domain.entities.usuario import Usuario
+from src.domain.entities.usuario import PerfilUsuario, Usuario
+from src.domain.repositories.filtro_usuarios import FiltroUsuarios
 
 class UsuarioRepositoryInterface(ABC):
     """Interface para o repositório de usuários seguindo o padrão Repository do DDD."""
@@ -12,27 +14,154 @@ class UsuarioRepositoryInterface(ABC):
         """Cria um novo usuário."""
         pass
     
+    @abstractmethod
+    async def criar_em_lote(self, usuarios: List[Usuario]) -> Set[str]:
+        """
+        Insere vários usuários em um único comando, ignorando emails já
+        existentes. Retorna os emails efetivamente inseridos.
+        """
+        pass
+    
     @abstractmethod
     async def atualizar(self, usuario: Usuario) -> Usuario:
         """Atualiza um usuário existente."""
         pass
     
+    @abstractmethod
+    async def atualizar_campos(self, usuario_id: UUID, campos: Dict[str, Any]) -> Optional[Usuario]:
+        """
+        Atualiza apenas os campos informados em um único comando e retorna o
+        usuário atualizado, ou None se ele não existir.
+        """
+        pass
+    
+    @abstractmethod
+    async def registrar_logins(self, logins: Mapping[UUID, datetime]) -> int:
+        """
+        Atualiza o último login de vários usuários em um único comando, sem
+        alterar data_atualizacao. Retorna o número de linhas atualizadas.
+        """
+        pass
+    
+    @abstractmethod
+    async def substituir_senha_hash(self, usuario_id: UUID, hash_atual: str, novo_hash: str) -> bool:
+        """
+        Troca o hash da senha somente se o armazenado ainda for `hash_atual`
+        (uma troca de senha concorrente prevalece), sem alterar
+        data_atualizacao. Retorna se a linha foi atualizada.
+        """
+        pass
+    
     @abstractmethod
     async def obter_por_id(self, usuario_id: UUID) -> Optional[Usuario]:
         """Obtém um usuário pelo ID."""
         pass
     
+    @abstractmethod
+    async def obter_por_ids(self, usuario_ids: Iterable[UUID]) -> Dict[UUID, Usuario]:
+        """
+        Obtém vários usuários em uma única consulta. IDs inexistentes ficam
+        de fora do dicionário retornado.
+        """
+        pass
+    
+    @abstractmethod
+    async def obter_versao(self, usuario_id: UUID) -> Optional[Tuple[datetime, Optional[datetime]]]:
+        """
+        Obtém só a versão do usuário, (data_atualizacao, ultimo_login), sem
+        carregar o registro inteiro. Retorna None se o usuário não existir.
+        """
+        pass
+    
     @abstractmethod
     async def obter_por_email(self, email: str) -> Optional[Usuario]:
         """Obtém um usuário pelo email."""
         pass
     
+    @abstractmethod
+    async def obter_emails_existentes(self, emails: Iterable[str]) -> Set[str]:
+        """Retorna, dentre os emails informados, os que já estão cadastrados."""
+        pass
+    
     @abstractmethod
     async def listar(self, skip: int = 0, limit: int = 100) -> List[Usuario]:
-        """Lista usuários com paginação."""
+        """Lista usuários com paginação por offset, ordenados por (data_criacao, id)."""
+        pass
+    
+    @abstractmethod
+    async def listar_linhas(
+        self, 
+        skip: int = 0, 
+        limit: int = 100, 
+        apos: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Lista os campos públicos (sem senha_hash) dos usuários, ordenados por
+        (data_criacao, id), sem materializar entidades. Com `apos`, pagina por
+        chave (keyset) e ignora `skip`.
+        """
+        pass
+    
+    @abstractmethod
+    async def buscar_linhas(
+        self,
+        filtro: FiltroUsuarios,
+        limit: int = 100,
+        apos: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca usuários pelos critérios do filtro, na ordem de listar_linhas
+        (data_criacao, id) e com a mesma paginação por cursor.
+        """
+        pass
+    
+    @abstractmethod
+    def exportar(self, batch_size: int = 1000) -> AsyncIterator[Mapping[str, Any]]:
+        """
+        Percorre todos os usuários em streaming, ordenados por (data_criacao, id).
+        Cada item traz apenas os campos públicos (sem senha_hash).
+        """
         pass
     
     @abstractmethod
     async def remover(self, usuario_id: UUID) -> bool:
-        """Remove um usuário pelo ID."""
-        pass
\ No newline at end of file
+        """Remove um usuário pelo ID. Retorna False se ele não existir."""
+        pass
+    
+    @abstractmethod
+    async def contar_por_grupo(self) -> Dict[Tuple[PerfilUsuario, bool], int]:
+        """
+        Total de usuários por (perfil, ativo), lido dos contadores mantidos
+        a cada escrita, sem varrer a tabela.
+        """
+        pass
+    
+    @abstractmethod
+    async def contar_cadastros_por_dia(self, desde: date) -> Dict[date, int]:
+        """
+        Cadastros por dia a partir de `desde`, lidos dos contadores. Dias sem
+        cadastros ficam de fora; usuários removidos deixam de ser contados.
+        """
+        pass
+    
+    @abstractmethod
+    async def contar_ativos_desde(self, momento: datetime) -> int:
+        """Usuários com último login a partir de `momento`."""
+        pass
+    
+    @abstractmethod
+    async def estimar_total(self) -> Optional[int]:
+        """
+        Estimativa do total de usuários pelas estatísticas do banco, sem
+        varrer a tabela. Retorna None se o banco não oferecer estimativa.
+        """
+        pass
+    
+    @abstractmethod
+    async def reconciliar_contadores(self) -> Optional[int]:
+        """
+        Recalcula os contadores a partir da tabela de usuários e retorna
+        quantos estavam divergentes, ou None se outro processo já estiver
+        reconciliando.
+        """
+        pass
@@ -0,0 +1,82 @@
+import argon2
+import bcrypt
+
+from src.application.interfaces.password_hash_interface import PasswordHashAlgorithm
+from src.application.services.hasher_registry import HasherRegistry
+from src.config.settings import Settings
+
+class BcryptHashAlgorithm(PasswordHashAlgorithm):
+    """bcrypt com custo (log2 das iterações) configurável."""
+
+    nome = "bcrypt"
+
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+
+    def reconhece(self, senha_hash: str) -> bool:
+        return senha_hash.startswith(("$2a$", "$2b$", "$2y$"))
+
+    def hash(self, senha: str) -> str:
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        return bcrypt.hashpw(senha.encode('utf-8'), salt).decode('utf-8')
+
+    def verify(self, senha: str, senha_hash: str) -> bool:
+        try:
+            return bcrypt.checkpw(senha.encode('utf-8'), senha_hash.encode('utf-8'))
+        except ValueError:
+            # Hash truncado ou corrompido
+            return False
+
+    def precisa_rehash(self, senha_hash: str) -> bool:
+        # $2b$<custo>$<salt+hash>
+        try:
+            return int(senha_hash.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return False
+
+class Argon2idHashAlgorithm(PasswordHashAlgorithm):
+    """argon2id (argon2-cffi); os parâmetros ficam codificados no próprio hash."""
+
+    nome = "argon2id"
+
+    def __init__(self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4):
+        self._hasher = argon2.PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=argon2.Type.ID
+        )
+
+    def reconhece(self, senha_hash: str) -> bool:
+        return senha_hash.startswith("$argon2id$")
+
+    def hash(self, senha: str) -> str:
+        return self._hasher.hash(senha)
+
+    def verify(self, senha: str, senha_hash: str) -> bool:
+        try:
+            return self._hasher.verify(senha_hash, senha)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            return False
+
+    def precisa_rehash(self, senha_hash: str) -> bool:
+        try:
+            return self._hasher.check_needs_rehash(senha_hash)
+        except argon2.exceptions.InvalidHashError:
+            return False
+
+def criar_registry(settings: Settings) -> HasherRegistry:
+    """Registry com todos os algoritmos; o padrão vem de PASSWORD_HASH_ALGORITHM."""
+    algoritmos = {
+        "bcrypt": BcryptHashAlgorithm(rounds=settings.PASSWORD_HASH_ROUNDS),
+        "argon2id": Argon2idHashAlgorithm(
+            time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+            memory_cost=settings.PASSWORD_ARGON2_MEMORY_KIB,
+            parallelism=settings.PASSWORD_ARGON2_PARALLELISM
+        ),
+    }
+    try:
+        padrao = algoritmos[settings.PASSWORD_HASH_ALGORITHM]
+    except KeyError:
+        raise ValueError(f"PASSWORD_HASH_ALGORITHM desconhecido: {settings.PASSWORD_HASH_ALGORITHM}")
+    return HasherRegistry(padrao, list(algoritmos.values()))
@@ -1,24 +1,31 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional
+from uuid import UUID
 
 import jwt
 
 from src.config.settings import get_settings
+from src.infrastructure.cache.ttl_cache import TTLCache
 
 settings = get_settings()
 
+_token_cache: Optional[TTLCache[Dict]] = None
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Cria um token JWT com os dados fornecidos e validade configurada.
     """
     to_encode = data.copy()
+    agora = datetime.utcnow()
     
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = agora + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRES_MINUTES)
+        expire = agora + timedelta(minutes=settings.JWT_EXPIRES_MINUTES)
     
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": agora})
     
     encoded_jwt = jwt.encode(
         to_encode, 
@@ -28,10 +35,34 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     
     return encoded_jwt
 
-def decode_token(token: str) -> Dict:
+def get_token_cache() -> Optional[TTLCache[Dict]]:
+    """
+    Cache de tokens já verificados (digest do token -> claims). Cada entrada
+    expira junto com o próprio token.
+    """
+    global _token_cache
+    
+    if _token_cache is None and settings.JWT_DECODE_CACHE_SIZE > 0:
+        _token_cache = TTLCache(max_size=settings.JWT_DECODE_CACHE_SIZE, clock=time.time, nome="jwt")
+    return _token_cache
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+def decode_token(token: str, use_cache: bool = True) -> Dict:
     """
     Decodifica e valida um token JWT.
+    
+    Tokens já verificados são servidos do cache até o seu "exp", evitando
+    repetir a verificação HMAC a cada requisição.
     """
+    cache = get_token_cache() if use_cache else None
+    if cache is not None:
+        digest = _token_digest(token)
+        cached = cache.get(digest)
+        if cached is not None:
+            return dict(cached)
+    
     try:
         decoded_token = jwt.decode(
             token, 
@@ -40,9 +71,33 @@ def decode_token(token: str) -> Dict:
         )
         
         # Verificar se o token não expirou
-        if decoded_token["exp"] < datetime.utcnow().timestamp():
+        restante = decoded_token["exp"] - time.time()
+        if restante < 0:
             return None
+        
+        if cache is not None:
+            cache.set(digest, dict(decoded_token), ttl=restante)
             
         return decoded_token
     except jwt.PyJWTError:
-        return None
\ No newline at end of file
+        return None
+
+def revoke_token(token: str) -> None:
+    """
+    Remove um token do cache de verificação (ex.: logout).
+    """
+    cache = get_token_cache()
+    if cache is not None:
+        cache.invalidate(_token_digest(token))
+
+def revoke_user_tokens(usuario_id: UUID) -> int:
+    """
+    Remove do cache todos os tokens de um usuário (ex.: desativação ou remoção).
+    O cache é local ao worker: nos demais, os tokens são recusados ao carregar
+    o usuário (pelo cache compartilhado, quando configurado).
+    """
+    cache = get_token_cache()
+    if cache is None:
+        return 0
+    sub = str(usuario_id)
+    return cache.invalidate_where(lambda claims: claims.get("sub") == sub)
\ No newline at end of file
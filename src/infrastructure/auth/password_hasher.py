@@ -0,0 +1,184 @@
+import asyncio
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+from src.application.services.hasher_registry import HasherRegistry
+from src.config.settings import get_settings
+from src.infrastructure.auth.hash_algorithms import BcryptHashAlgorithm, criar_registry
+from src.domain.exceptions.domain_exceptions import TooManyRequestsError
+from src.infrastructure.instrumentation.contadores import PASSWORD_HASH_REJECTED
+
+T = TypeVar("T")
+
+@dataclass
+class LatencyStats:
+    """Estatísticas acumuladas de latência (em segundos)."""
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    @property
+    def avg(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+class PasswordHasher:
+    """
+    Executa hash e verificação de senhas em um pool de threads dedicado,
+    liberando o event loop. bcrypt e argon2 liberam o GIL, então as
+    threads rodam de fato em paralelo.
+
+    Novos hashes usam o algoritmo padrão do `registry`; a verificação usa
+    o algoritmo identificado no próprio hash armazenado (padrão: só bcrypt
+    com o custo `rounds`).
+
+    O número de operações pendentes (em execução + na fila) é limitado;
+    acima do limite a chamada falha imediatamente com TooManyRequestsError.
+    """
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        max_workers: int = 4,
+        max_pending: int = 64,
+        registry: Optional[HasherRegistry] = None
+    ):
+        self.registry = registry or HasherRegistry(BcryptHashAlgorithm(rounds))
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hasher"
+        )
+        self._pending = 0
+        self.rejected = 0
+        self.hash_latency = LatencyStats()
+        self.verify_latency = LatencyStats()
+        self._dummy_hash: Optional[str] = None
+        self._dummy_lock = asyncio.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Operações aguardando uma thread livre."""
+        return max(0, self._pending - self.max_workers)
+
+    @property
+    def in_flight(self) -> int:
+        """Operações em execução no pool."""
+        return min(self._pending, self.max_workers)
+
+    async def hash(self, senha: str) -> str:
+        return await self._submit(self._hash_sync, self.hash_latency, senha)
+
+    async def verify(self, senha: str, senha_hash: str) -> bool:
+        return await self._submit(self._verify_sync, self.verify_latency, senha, senha_hash)
+
+    def needs_rehash(self, senha_hash: str) -> bool:
+        """Hash de outro algoritmo ou com parâmetros desatualizados (barato: só lê o hash)."""
+        return self.registry.precisa_rehash(senha_hash)
+
+    def reconhece(self, senha_hash: str) -> bool:
+        """Hash de algum algoritmo registrado (barato: só lê o formato)."""
+        return self.registry.identificar(senha_hash) is not None
+
+    async def verify_dummy(self, senha: str) -> bool:
+        """
+        Verificação contra um hash fictício com o mesmo custo, para que um
+        email inexistente leve o mesmo tempo que uma senha errada. O hash é
+        gerado uma única vez por processo. Sempre retorna False.
+        """
+        if self._dummy_hash is None:
+            # Logins simultâneos aguardam o mesmo hash em vez de gerar um cada
+            async with self._dummy_lock:
+                if self._dummy_hash is None:
+                    self._dummy_hash = await self._run(self._hash_sync, self.hash_latency, secrets.token_urlsafe(16))
+        await self.verify(senha, self._dummy_hash)
+        return False
+
+    async def hash_many(self, senhas: Sequence[str]) -> List[str]:
+        """
+        Hash em lote (importações). Mantém no máximo max_workers operações do
+        lote no pool por vez, para que requisições interativas continuem sendo
+        atendidas. Cada operação conta no mesmo limite de pendentes das demais:
+        com o pool saturado, o lote falha com TooManyRequestsError.
+        """
+        semaforo = asyncio.Semaphore(self.max_workers)
+
+        async def _hash(senha: str) -> str:
+            async with semaforo:
+                return await self._submit(self._hash_sync, self.hash_latency, senha)
+
+        return list(await asyncio.gather(*(_hash(senha) for senha in senhas)))
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+            "hash_count": self.hash_latency.count,
+            "hash_avg_seconds": self.hash_latency.avg,
+            "hash_max_seconds": self.hash_latency.max,
+            "verify_count": self.verify_latency.count,
+            "verify_avg_seconds": self.verify_latency.avg,
+            "verify_max_seconds": self.verify_latency.max,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def _submit(self, fn: Callable[..., T], stats: LatencyStats, *args) -> T:
+        if self._pending >= self.max_workers + self.max_pending:
+            self.rejected += 1
+            PASSWORD_HASH_REJECTED.inc()
+            raise TooManyRequestsError("Servidor ocupado, tente novamente em instantes")
+
+        return await self._run(fn, stats, *args)
+
+    async def _run(self, fn: Callable[..., T], stats: LatencyStats, *args) -> T:
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            inicio = time.perf_counter()
+            resultado = await loop.run_in_executor(self._executor, fn, *args)
+            stats.observe(time.perf_counter() - inicio)
+            return resultado
+        finally:
+            self._pending -= 1
+
+    def _hash_sync(self, senha: str) -> str:
+        return self.registry.padrao.hash(senha)
+
+    def _verify_sync(self, senha: str, senha_hash: str) -> bool:
+        algoritmo = self.registry.identificar(senha_hash)
+        if algoritmo is None:
+            return False
+        return algoritmo.verify(senha, senha_hash)
+
+_password_hasher: Optional[PasswordHasher] = None
+
+def get_password_hasher() -> PasswordHasher:
+    global _password_hasher
+
+    if _password_hasher is None:
+        settings = get_settings()
+        _password_hasher = PasswordHasher(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+            registry=criar_registry(settings)
+        )
+    return _password_hasher
+
+def shutdown_password_hasher() -> None:
+    global _password_hasher
+
+    if _password_hasher is not None:
+        _password_hasher.shutdown()
+    _password_hasher = None
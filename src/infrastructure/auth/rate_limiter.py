@@ -0,0 +1,146 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from src.application.interfaces.cache_interface import CacheInterface
+from src.application.interfaces.rate_limiter_interface import RateLimiterInterface
+from src.config.settings import get_settings
+from src.domain.exceptions.domain_exceptions import TooManyRequestsError
+from src.infrastructure.cache.cache_backend import get_cache
+from src.infrastructure.instrumentation.contadores import LOGIN_RATE_LIMITED
+
+logger = logging.getLogger(__name__)
+
+class InMemoryRateLimiter(RateLimiterInterface):
+    """
+    Token bucket em memória, por worker. Guarda no máximo `max_keys`
+    chaves; a menos usada recentemente é descartada (e volta cheia).
+    """
+
+    def __init__(self, max_keys: int = 100000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._baldes: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def consumir(self, chave: str, capacidade: int, reposicao_por_segundo: float) -> float:
+        agora = self._clock()
+        saldo, atualizado_em = self._baldes.get(chave, (float(capacidade), agora))
+        saldo = min(float(capacidade), saldo + (agora - atualizado_em) * reposicao_por_segundo)
+
+        if saldo >= 1:
+            saldo -= 1
+            espera = 0.0
+        else:
+            espera = (1 - saldo) / reposicao_por_segundo
+
+        self._baldes[chave] = (saldo, agora)
+        self._baldes.move_to_end(chave)
+        while len(self._baldes) > self.max_keys:
+            self._baldes.popitem(last=False)
+        return espera
+
+    def limpar(self) -> None:
+        self._baldes.clear()
+
+class CacheRateLimiter(RateLimiterInterface):
+    """
+    Limitador compartilhado entre workers sobre a porta de cache.
+
+    Aproxima o token bucket com janelas fixas de capacidade /
+    reposicao_por_segundo segundos: um INCR por tentativa em uma chave que
+    inclui o número da janela e expira com ela. Se o backend falhar, usa o
+    limitador `reserva` (local) em vez de liberar todas as tentativas.
+    """
+
+    def __init__(
+        self,
+        cache: CacheInterface,
+        prefixo: str = "fastapi-ddd",
+        reserva: Optional[RateLimiterInterface] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        self.cache = cache
+        self.prefixo = prefixo
+        self.reserva = reserva or InMemoryRateLimiter()
+        self._clock = clock
+
+    async def consumir(self, chave: str, capacidade: int, reposicao_por_segundo: float) -> float:
+        janela = capacidade / reposicao_por_segundo
+        agora = self._clock()
+        indice = int(agora // janela)
+        try:
+            tentativas = await self.cache.incr(f"{self.prefixo}:rl:{chave}:{indice}", ttl=janela)
+        except Exception:
+            logger.warning("Falha no limitador compartilhado; usando o limite local", exc_info=True)
+            return await self.reserva.consumir(chave, capacidade, reposicao_por_segundo)
+
+        if tentativas <= capacidade:
+            return 0.0
+        return (indice + 1) * janela - agora
+
+class LoginRateLimiter:
+    """
+    Limites de tentativas de login por IP e por email, verificados antes
+    de qualquer consulta ou bcrypt. O IP é verificado primeiro: uma origem
+    já bloqueada não consome o saldo do email alvo.
+    """
+
+    def __init__(
+        self,
+        limitador: RateLimiterInterface,
+        capacidade_ip: int = 20,
+        por_minuto_ip: float = 20,
+        capacidade_email: int = 5,
+        por_minuto_email: float = 5
+    ):
+        self.limitador = limitador
+        self.capacidade_ip = capacidade_ip
+        self.por_segundo_ip = por_minuto_ip / 60
+        self.capacidade_email = capacidade_email
+        self.por_segundo_email = por_minuto_email / 60
+        self.rejeitadas = 0
+
+    async def verificar(self, email: str, ip: Optional[str] = None) -> None:
+        if ip:
+            espera = await self.limitador.consumir(f"ip:{ip}", self.capacidade_ip, self.por_segundo_ip)
+            if espera:
+                self._rejeitar(espera)
+
+        chave_email = f"email:{email.strip().lower()}"
+        espera = await self.limitador.consumir(chave_email, self.capacidade_email, self.por_segundo_email)
+        if espera:
+            self._rejeitar(espera)
+
+    def _rejeitar(self, espera: float) -> None:
+        self.rejeitadas += 1
+        LOGIN_RATE_LIMITED.inc()
+        raise TooManyRequestsError(
+            "Muitas tentativas de login, tente novamente mais tarde",
+            retry_after=max(1, math.ceil(espera))
+        )
+
+_login_rate_limiter: Optional[LoginRateLimiter] = None
+
+def get_login_rate_limiter() -> Optional[LoginRateLimiter]:
+    """Limitador configurado; None quando LOGIN_RATE_LIMIT_ENABLED é falso."""
+    global _login_rate_limiter
+
+    settings = get_settings()
+    if not settings.LOGIN_RATE_LIMIT_ENABLED:
+        return None
+    if _login_rate_limiter is None:
+        local = InMemoryRateLimiter(max_keys=settings.LOGIN_RATE_LIMIT_MAX_KEYS)
+        limitador: RateLimiterInterface = local
+        cache = get_cache() if settings.LOGIN_RATE_LIMIT_BACKEND == "cache" else None
+        if cache is not None:
+            limitador = CacheRateLimiter(cache, prefixo=settings.CACHE_KEY_PREFIX, reserva=local)
+        _login_rate_limiter = LoginRateLimiter(
+            limitador,
+            capacidade_ip=settings.LOGIN_RATE_LIMIT_IP_CAPACITY,
+            por_minuto_ip=settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE,
+            capacidade_email=settings.LOGIN_RATE_LIMIT_EMAIL_CAPACITY,
+            por_minuto_email=settings.LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE
+        )
+    return _login_rate_limiter
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from src.application.interfaces.cache_interface import CacheInterface
+from src.config.settings import get_settings
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.cache.redis_cache import RedisCache
+
+_cache: Optional[CacheInterface] = None
+
+def get_cache() -> Optional[CacheInterface]:
+    """
+    Backend de cache configurado em CACHE_BACKEND (none, memory ou redis).
+    Retorna None quando o cache está desativado.
+    """
+    global _cache
+
+    settings = get_settings()
+    if _cache is None and settings.CACHE_BACKEND != "none":
+        if settings.CACHE_BACKEND == "redis":
+            _cache = RedisCache.from_url(
+                settings.CACHE_URL,
+                pool_size=settings.CACHE_POOL_SIZE,
+                timeout=settings.CACHE_TIMEOUT_SECONDS
+            )
+        elif settings.CACHE_BACKEND == "memory":
+            _cache = InMemoryCache()
+        else:
+            raise ValueError(f"CACHE_BACKEND desconhecido: {settings.CACHE_BACKEND}")
+    return _cache
+
+async def close_cache() -> None:
+    global _cache
+
+    if _cache is not None:
+        await _cache.close()
+    _cache = None
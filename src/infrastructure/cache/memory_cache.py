@@ -0,0 +1,46 @@
+from typing import List, Mapping, Optional, Sequence
+
+from src.application.interfaces.cache_interface import CacheInterface
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+# Contadores de versão não expiram por tempo; o TTL apenas os mantém no LRU
+TTL_CONTADOR = 365 * 24 * 3600.0
+
+class InMemoryCache(CacheInterface):
+    """
+    Implementação local (por worker) da porta de cache, sobre o TTLCache.
+    Útil em desenvolvimento e com um único worker; com vários workers as
+    invalidações não se propagam.
+    """
+
+    def __init__(self, max_size: int = 100000):
+        self._cache: TTLCache[bytes] = TTLCache(max_size=max_size)
+
+    @property
+    def stats(self):
+        return self._cache.stats()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return [self._cache.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        for key, value in items.items():
+            self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.invalidate(key)
+
+    async def incr(self, key: str, ttl: Optional[float] = None) -> int:
+        valor = int(self._cache.get(key) or 0) + 1
+        self._cache.set(key, str(valor).encode(), ttl=ttl or TTL_CONTADOR)
+        return valor
+
+    async def close(self) -> None:
+        self._cache.clear()
@@ -0,0 +1,49 @@
+import copy
+from typing import Optional
+from uuid import UUID
+
+from src.config.settings import get_settings
+from src.domain.entities.usuario import Usuario
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+class PrincipalCache:
+    """
+    Cache dos usuários autenticados, indexado pelo ID, usado por
+    get_current_user para evitar uma consulta ao banco a cada requisição.
+    As entradas são cópias, para que alterações feitas em uma requisição não
+    vazem para as demais.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 30.0, nome: Optional[str] = None):
+        self._cache: TTLCache[Usuario] = TTLCache(max_size=max_size, ttl=ttl, nome=nome)
+
+    @property
+    def stats(self):
+        return self._cache.stats()
+
+    def get(self, usuario_id: UUID) -> Optional[Usuario]:
+        usuario = self._cache.get(usuario_id)
+        return copy.copy(usuario) if usuario is not None else None
+
+    def set(self, usuario: Usuario) -> None:
+        self._cache.set(usuario.id, copy.copy(usuario))
+
+    def invalidate(self, usuario_id: UUID) -> None:
+        self._cache.invalidate(usuario_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+_principal_cache: Optional[PrincipalCache] = None
+
+def get_principal_cache() -> PrincipalCache:
+    global _principal_cache
+
+    if _principal_cache is None:
+        settings = get_settings()
+        _principal_cache = PrincipalCache(
+            max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+            ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+            nome="principal"
+        )
+    return _principal_cache
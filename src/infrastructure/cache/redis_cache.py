@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Mapping, Optional, Sequence
+from urllib.parse import urlparse
+
+from src.application.interfaces.cache_interface import CacheInterface
+
+logger = logging.getLogger(__name__)
+
+class RedisError(Exception):
+    """Resposta de erro do servidor (-ERR ...)."""
+
+class _Conexao:
+    """Conexão RESP2 com o servidor; um comando por vez."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def executar(self, *args: Any) -> Any:
+        self.writer.write(_codificar(args))
+        await self.writer.drain()
+        return await self._ler_resposta()
+
+    async def executar_varios(self, comandos: Sequence[Sequence[Any]]) -> List[Any]:
+        """Envia os comandos de uma vez (pipeline) e lê as respostas em ordem."""
+        self.writer.write(b"".join(_codificar(args) for args in comandos))
+        await self.writer.drain()
+        respostas = []
+        erro = None
+        for _ in comandos:
+            try:
+                respostas.append(await self._ler_resposta())
+            except RedisError as exc:
+                # Lê as demais respostas para manter a conexão sincronizada
+                erro = erro or exc
+                respostas.append(None)
+        if erro is not None:
+            raise erro
+        return respostas
+
+    async def _ler_resposta(self) -> Any:
+        linha = await self.reader.readline()
+        if not linha:
+            raise ConnectionError("Conexão fechada pelo servidor")
+        tipo, conteudo = linha[:1], linha[1:-2]
+        if tipo == b"+":
+            return conteudo.decode()
+        if tipo == b"-":
+            raise RedisError(conteudo.decode())
+        if tipo == b":":
+            return int(conteudo)
+        if tipo == b"$":
+            tamanho = int(conteudo)
+            if tamanho < 0:
+                return None
+            dados = await self.reader.readexactly(tamanho + 2)
+            return dados[:-2]
+        if tipo == b"*":
+            quantidade = int(conteudo)
+            if quantidade < 0:
+                return None
+            return [await self._ler_resposta() for _ in range(quantidade)]
+        raise ConnectionError(f"Resposta RESP inválida: {linha!r}")
+
+    def fechar(self) -> None:
+        self.writer.close()
+
+def _codificar(args: Sequence[Any]) -> bytes:
+    partes = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        partes.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(partes)
+
+class RedisCache(CacheInterface):
+    """
+    Implementação da porta de cache sobre o protocolo do Redis (RESP2), sem
+    dependências externas. Mantém um pool de até `pool_size` conexões; erros
+    de rede ou timeout são registrados em log e tratados como ausência no
+    cache, para que uma indisponibilidade do Redis não derrube a API.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        pool_size: int = 10,
+        timeout: float = 0.5
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._livres: List[_Conexao] = []
+        self._vagas = asyncio.Semaphore(pool_size)
+        self.erros = 0
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCache":
+        """redis://[:senha@]host[:porta][/db]"""
+        partes = urlparse(url)
+        db = partes.path.lstrip("/")
+        return cls(
+            host=partes.hostname or "localhost",
+            port=partes.port or 6379,
+            db=int(db) if db else 0,
+            password=partes.password,
+            **kwargs
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._executar_seguro(None, "GET", key)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        return await self._executar_seguro([None] * len(keys), "MGET", *keys)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._executar_seguro(None, "SET", key, value, "PX", max(1, int(ttl * 1000)))
+
+    async def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        if not items:
+            return
+        px = max(1, int(ttl * 1000))
+        try:
+            await self._executar_pipeline(*(("SET", key, value, "PX", px) for key, value in items.items()))
+        except (OSError, ConnectionError, asyncio.TimeoutError, RedisError) as exc:
+            self.erros += 1
+            logger.warning("Falha no cache Redis (SET): %s", exc)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._executar_seguro(None, "DEL", *keys)
+
+    async def incr(self, key: str, ttl: Optional[float] = None) -> int:
+        # Sem resposta não há como saber o valor: propaga o erro para quem chamou
+        if ttl is None:
+            return await self._executar("INCR", key)
+        valor, _ = await self._executar_pipeline(
+            ("INCR", key), ("PEXPIRE", key, max(1, int(ttl * 1000)))
+        )
+        return valor
+
+    async def close(self) -> None:
+        while self._livres:
+            self._livres.pop().fechar()
+
+    async def _executar_seguro(self, padrao: Any, *args: Any) -> Any:
+        try:
+            return await self._executar(*args)
+        except (OSError, ConnectionError, asyncio.TimeoutError, RedisError) as exc:
+            self.erros += 1
+            logger.warning("Falha no cache Redis (%s): %s", args[0], exc)
+            return padrao
+
+    async def _executar(self, *args: Any) -> Any:
+        return await self._usar_conexao(lambda conexao: conexao.executar(*args))
+
+    async def _executar_pipeline(self, *comandos: Sequence[Any]) -> List[Any]:
+        return await self._usar_conexao(lambda conexao: conexao.executar_varios(comandos))
+
+    async def _usar_conexao(self, operacao: Callable[[_Conexao], Awaitable[Any]]) -> Any:
+        async with self._vagas:
+            conexao = self._livres.pop() if self._livres else await self._conectar()
+            try:
+                resultado = await asyncio.wait_for(operacao(conexao), self.timeout)
+            except RedisError:
+                # Erro do comando: a conexão continua utilizável
+                self._livres.append(conexao)
+                raise
+            except BaseException:
+                # Estado do protocolo desconhecido (timeout/cancelamento): descarta
+                conexao.fechar()
+                raise
+            self._livres.append(conexao)
+            return resultado
+
+    async def _conectar(self) -> _Conexao:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        conexao = _Conexao(reader, writer)
+        try:
+            if self.password:
+                await asyncio.wait_for(conexao.executar("AUTH", self.password), self.timeout)
+            if self.db:
+                await asyncio.wait_for(conexao.executar("SELECT", self.db), self.timeout)
+        except BaseException:
+            conexao.fechar()
+            raise
+        return conexao
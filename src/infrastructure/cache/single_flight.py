@@ -0,0 +1,71 @@
+import asyncio
+import copy
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from src.infrastructure.instrumentation.contadores import SINGLE_FLIGHT_COALESCED, SINGLE_FLIGHT_EXECUTIONS
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes com a mesma chave: a primeira executa a
+    função e as demais aguardam o mesmo resultado (cada uma recebe uma
+    cópia rasa, para não compartilhar objetos mutáveis entre requisições).
+    Não guarda resultados: assim que a chamada termina, a próxima executa
+    de novo. Não é thread-safe: foi feito para um único event loop.
+    Com um nome, execuções e coalescências também são exportadas como
+    contadores do Prometheus com o rótulo group=<nome>.
+    """
+
+    def __init__(self, nome: Optional[str] = None):
+        self._em_andamento: Dict[Hashable, asyncio.Future] = {}
+        self.execucoes = 0
+        self.coalescidas = 0
+        self._metrica_execucoes = SINGLE_FLIGHT_EXECUTIONS.labels(nome) if nome else None
+        self._metrica_coalescidas = SINGLE_FLIGHT_COALESCED.labels(nome) if nome else None
+
+    @property
+    def em_andamento(self) -> int:
+        return len(self._em_andamento)
+
+    async def executar(self, chave: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        futuro = self._em_andamento.get(chave)
+        if futuro is not None:
+            self.coalescidas += 1
+            if self._metrica_coalescidas is not None:
+                self._metrica_coalescidas.inc()
+            try:
+                return copy.copy(await asyncio.shield(futuro))
+            except asyncio.CancelledError:
+                if not futuro.cancelled():
+                    raise
+                # A chamada líder foi cancelada (não esta): executa por conta própria
+                return await self.executar(chave, fn)
+
+        futuro = asyncio.get_running_loop().create_future()
+        # Evita o aviso de exceção nunca lida quando ninguém estava aguardando
+        futuro.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._em_andamento[chave] = futuro
+        self.execucoes += 1
+        if self._metrica_execucoes is not None:
+            self._metrica_execucoes.inc()
+        try:
+            resultado = await fn()
+        except asyncio.CancelledError:
+            futuro.cancel()
+            raise
+        except BaseException as exc:
+            futuro.set_exception(exc)
+            raise
+        else:
+            futuro.set_result(resultado)
+            return resultado
+        finally:
+            del self._em_andamento[chave]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "execucoes": self.execucoes,
+            "coalescidas": self.coalescidas,
+            "em_andamento": self.em_andamento,
+        }
@@ -0,0 +1,98 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from src.infrastructure.instrumentation.contadores import CACHE_HITS, CACHE_MISSES
+
+V = TypeVar("V")
+
+class TTLCache(Generic[V]):
+    """
+    Cache em memória com expiração por tempo (TTL) e descarte LRU quando o
+    tamanho máximo é atingido. Não é thread-safe: foi feito para ser usado a
+    partir do event loop de um único worker.
+    Com um nome, acertos e faltas também são exportados como contadores do
+    Prometheus com o rótulo cache=<nome>.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        nome: Optional[str] = None
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._metrica_hits = CACHE_HITS.labels(nome) if nome else None
+        self._metrica_misses = CACHE_MISSES.labels(nome) if nome else None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        item = self._data.get(key)
+        if item is None:
+            self._contar_miss()
+            return None
+
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._data[key]
+            self._contar_miss()
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        if self._metrica_hits is not None:
+            self._metrica_hits.inc()
+        return value
+
+    def _contar_miss(self) -> None:
+        self.misses += 1
+        if self._metrica_misses is not None:
+            self._metrica_misses.inc()
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._data[key] = (self._clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[V], bool]) -> int:
+        """Remove todas as entradas cujo valor satisfaz o predicado."""
+        keys = [key for key, (_, value) in self._data.items() if predicate(value)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hit_ratio,
+        }
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import get_settings
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+class EstatisticasReconciler:
+    """
+    Reconcilia periodicamente os contadores das estatísticas de usuários
+    com a tabela. A primeira execução acontece na subida, o que também
+    preenche os contadores de uma base que já tinha usuários; as seguintes,
+    a cada `intervalo` segundos. Divergências indicam escritas feitas por
+    fora do repositório e são registradas em log.
+
+    Deve rodar em um único processo por servidor (ver worker_principal);
+    entre servidores, uma execução concorrente com outra é pulada.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession], intervalo: float = 3600.0):
+        self.session_factory = session_factory
+        self.intervalo = intervalo
+        self._task: Optional[asyncio.Task] = None
+        self.execucoes = 0
+        self.puladas = 0
+        self.divergentes = 0
+
+    @property
+    def ativo(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.ativo:
+            self._task = asyncio.create_task(self._executar())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def reconciliar(self) -> Optional[int]:
+        async with self.session_factory() as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            async with uow:
+                divergentes = await uow.usuarios.reconciliar_contadores()
+                await uow.commit()
+
+        if divergentes is None:
+            self.puladas += 1
+            logger.info("Reconciliação dos contadores em andamento em outro processo; pulada")
+            return None
+        self.execucoes += 1
+        self.divergentes += divergentes
+        if divergentes:
+            logger.warning("Reconciliação corrigiu %d contadores de usuários", divergentes)
+        return divergentes
+
+    async def _executar(self) -> None:
+        while True:
+            try:
+                await self.reconciliar()
+            except Exception:
+                logger.exception("Falha na reconciliação dos contadores de usuários")
+            await asyncio.sleep(self.intervalo)
+
+_estatisticas_reconciler: Optional[EstatisticasReconciler] = None
+
+def get_estatisticas_reconciler() -> Optional[EstatisticasReconciler]:
+    return _estatisticas_reconciler
+
+def start_estatisticas_reconciler(
+    session_factory: Callable[[], AsyncSession]
+) -> Optional[EstatisticasReconciler]:
+    global _estatisticas_reconciler
+
+    intervalo = get_settings().USER_STATS_RECONCILE_INTERVAL_SECONDS
+    if intervalo <= 0:
+        return None
+
+    _estatisticas_reconciler = EstatisticasReconciler(session_factory, intervalo)
+    _estatisticas_reconciler.start()
+    return _estatisticas_reconciler
+
+async def stop_estatisticas_reconciler() -> None:
+    global _estatisticas_reconciler
+
+    if _estatisticas_reconciler is not None:
+        await _estatisticas_reconciler.stop()
+    _estatisticas_reconciler = None
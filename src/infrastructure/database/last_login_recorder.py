@@ -0,0 +1,156 @@
+import asyncio
+import heapq
+import logging
+from datetime import datetime
+from operator import itemgetter
+from typing import Callable, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import get_settings
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+# Limite de linhas por UPDATE (2 parâmetros por linha)
+TAMANHO_LOTE = 5000
+
+class LastLoginRecorder:
+    """
+    Registra o último login fora do caminho crítico da autenticação.
+
+    Os logins ficam em memória, agrupados por usuário (vale o mais recente),
+    e são gravados periodicamente com um UPDATE em lote. No desligamento
+    da aplicação o buffer é esvaziado antes de o engine ser descartado.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        flush_interval: float = 5.0,
+        max_pending: int = 5000
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pendentes: Dict[UUID, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._flush_antecipado: Optional[asyncio.Task] = None
+        self.registrados = 0
+        self.gravados = 0
+        self.descartados = 0
+
+    @property
+    def ativo(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pendentes(self) -> int:
+        return len(self._pendentes)
+
+    def registrar(self, usuario_id: UUID, momento: datetime) -> None:
+        atual = self._pendentes.get(usuario_id)
+        if atual is None or momento > atual:
+            self._pendentes[usuario_id] = momento
+        self.registrados += 1
+
+        if len(self._pendentes) >= self.max_pending and not self._flush_em_andamento():
+            self._flush_antecipado = asyncio.create_task(self.flush())
+
+    def start(self) -> None:
+        if not self.ativo:
+            self._task = asyncio.create_task(self._executar())
+
+    async def stop(self) -> None:
+        """Interrompe o agendamento e grava o que estiver pendente."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            if not self._pendentes:
+                return 0
+
+            lote, self._pendentes = self._pendentes, {}
+            try:
+                itens = list(lote.items())
+                async with self.session_factory() as session:
+                    uow = SqlAlchemyUnitOfWork(session)
+                    async with uow:
+                        for inicio in range(0, len(itens), TAMANHO_LOTE):
+                            await uow.usuarios.registrar_logins(
+                                dict(itens[inicio:inicio + TAMANHO_LOTE])
+                            )
+                        await uow.commit()
+            except Exception:
+                logger.exception("Falha ao gravar %d últimos logins; nova tentativa no próximo ciclo", len(lote))
+                self._devolver(lote)
+                return 0
+
+            self.gravados += len(lote)
+            return len(lote)
+
+    def _devolver(self, lote: Dict[UUID, datetime]) -> None:
+        """
+        Devolve ao buffer um lote que não foi gravado, mantendo o login mais
+        recente de cada usuário. Com o banco indisponível por vários ciclos o
+        buffer não passa de max_pending: os logins mais antigos são descartados.
+        """
+        for usuario_id, momento in lote.items():
+            atual = self._pendentes.get(usuario_id)
+            if atual is None or momento > atual:
+                self._pendentes[usuario_id] = momento
+
+        excedente = len(self._pendentes) - self.max_pending
+        if excedente > 0:
+            mantidos = heapq.nlargest(self.max_pending, self._pendentes.items(), key=itemgetter(1))
+            self._pendentes = dict(mantidos)
+            self.descartados += excedente
+            logger.warning(
+                "Buffer de últimos logins acima de %d; %d registros mais antigos descartados",
+                self.max_pending, excedente
+            )
+
+    def _flush_em_andamento(self) -> bool:
+        return self._flush_antecipado is not None and not self._flush_antecipado.done()
+
+    async def _executar(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+_last_login_recorder: Optional[LastLoginRecorder] = None
+
+def get_last_login_recorder() -> Optional[LastLoginRecorder]:
+    """Retorna o gravador em execução, ou None se a gravação for síncrona."""
+    return _last_login_recorder
+
+def start_last_login_recorder(session_factory: Callable[[], AsyncSession]) -> Optional[LastLoginRecorder]:
+    global _last_login_recorder
+
+    settings = get_settings()
+    if settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS <= 0:
+        return None
+
+    _last_login_recorder = LastLoginRecorder(
+        session_factory,
+        flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS,
+        max_pending=settings.LAST_LOGIN_MAX_PENDING
+    )
+    _last_login_recorder.start()
+    return _last_login_recorder
+
+async def stop_last_login_recorder() -> None:
+    global _last_login_recorder
+
+    if _last_login_recorder is not None:
+        await _last_login_recorder.stop()
+    _last_login_recorder = None
@@ -0,0 +1,30 @@
+from datetime import date
+
+from sqlalchemy import BigInteger, Column, Integer, String
+
+from src.config.database import Base
+from src.domain.entities.usuario import PerfilUsuario
+
+class UsuarioContadorModel(Base):
+    """
+    Contadores das estatísticas de usuários, mantidos pelo repositório na
+    mesma transação das escritas em `usuarios`. Cada chave é dividida em
+    fatias: escritas concorrentes incrementam fatias diferentes e não
+    disputam o bloqueio da mesma linha; o valor é a soma das fatias.
+    """
+    __tablename__ = "usuario_contadores"
+
+    chave = Column(String(64), primary_key=True)
+    fatia = Column(Integer, primary_key=True, default=0)
+    total = Column(BigInteger, nullable=False, default=0)
+
+PREFIXO_GRUPO = "grupo:"
+PREFIXO_CADASTROS = "cadastros:"
+
+def chave_grupo(perfil: PerfilUsuario, ativo: bool) -> str:
+    """Usuários por perfil e situação, ex.: grupo:admin:1."""
+    return f"{PREFIXO_GRUPO}{perfil.value}:{int(ativo)}"
+
+def chave_cadastros(dia: date) -> str:
+    """Cadastros por dia (UTC), ex.: cadastros:2024-01-31; ordenável como texto."""
+    return f"{PREFIXO_CADASTROS}{dia.isoformat()}"
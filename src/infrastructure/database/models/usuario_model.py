@@ -1,15 +1,20 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Enum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DDL, Column, String, Boolean, DateTime, Enum, Index, Uuid, event, func
 
 from src.config.database import Base
 from src.domain.entities.usuario import PerfilUsuario
 
 class UsuarioModel(Base):
     __tablename__ = "usuarios"
+    __table_args__ = (
+        # Suporta a paginação por cursor (ORDER BY data_criacao, id)
+        Index("ix_usuarios_data_criacao_id", "data_criacao", "id"),
+        # Filtro por período de último login na busca
+        Index("ix_usuarios_ultimo_login", "ultimo_login"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String, unique=True, index=True, nullable=False)
     senha_hash = Column(String, nullable=False)
     nome = Column(String, nullable=False)
@@ -17,4 +22,32 @@ class UsuarioModel(Base):
     ativo = Column(Boolean, default=True)
     data_criacao = Column(DateTime, default=datetime.utcnow)
     data_atualizacao = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    ultimo_login = Column(DateTime, nullable=True)
\ No newline at end of file
+    ultimo_login = Column(DateTime, nullable=True)
+
+# Índices da busca por nome/email (ver UsuarioQueryBuilder). Em todos os
+# bancos, um índice funcional em lower(coluna) atende a busca por prefixo
+# (no PostgreSQL com text_pattern_ops, para LIKE 'termo%' em qualquer
+# collation); no PostgreSQL, um índice GIN de trigramas atende a busca
+# por substring.
+def _indices_de_busca(coluna: Column) -> None:
+    expressao = func.lower(coluna).label(f"{coluna.key}_lower")
+    Index(
+        f"ix_usuarios_{coluna.key}_lower",
+        expressao,
+        postgresql_ops={expressao.name: "text_pattern_ops"}
+    )
+    Index(
+        f"ix_usuarios_{coluna.key}_trgm",
+        expressao,
+        postgresql_using="gin",
+        postgresql_ops={expressao.name: "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql")
+
+_indices_de_busca(UsuarioModel.nome)
+_indices_de_busca(UsuarioModel.email)
+
+event.listen(
+    UsuarioModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
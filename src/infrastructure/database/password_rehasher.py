@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import Callable, Optional, Set
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.cache_interface import CacheInterface
+from src.config.settings import get_settings
+from src.domain.exceptions.domain_exceptions import TooManyRequestsError
+from src.infrastructure.auth.password_hasher import PasswordHasher
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+class PasswordRehasher:
+    """
+    Refaz, fora do caminho crítico do login, hashes de senha gerados com
+    outro algoritmo ou com parâmetros desatualizados.
+
+    Cada rehash roda em uma tarefa própria: calcula o novo hash no pool
+    do hasher e o grava com uma sessão própria, apenas se o hash
+    armazenado ainda for o verificado no login. Se o pool estiver cheio
+    ou a gravação falhar, o rehash fica para o próximo login.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        password_hasher: PasswordHasher,
+        cache: Optional[CacheInterface] = None
+    ):
+        self.session_factory = session_factory
+        self.password_hasher = password_hasher
+        self.cache = cache
+        self._em_andamento: Set[UUID] = set()
+        self._tarefas: Set[asyncio.Task] = set()
+        self.agendados = 0
+        self.gravados = 0
+
+    @property
+    def pendentes(self) -> int:
+        return len(self._tarefas)
+
+    def agendar(self, usuario_id: UUID, senha: str, hash_atual: str) -> None:
+        if usuario_id in self._em_andamento:
+            return
+
+        self._em_andamento.add(usuario_id)
+        self.agendados += 1
+        tarefa = asyncio.create_task(self._rehash(usuario_id, senha, hash_atual))
+        self._tarefas.add(tarefa)
+        tarefa.add_done_callback(self._tarefas.discard)
+
+    async def stop(self) -> None:
+        """Aguarda os rehashes em andamento (chamado no desligamento)."""
+        if self._tarefas:
+            await asyncio.gather(*self._tarefas, return_exceptions=True)
+
+    async def _rehash(self, usuario_id: UUID, senha: str, hash_atual: str) -> None:
+        try:
+            novo_hash = await self.password_hasher.hash(senha)
+            async with self.session_factory() as session:
+                uow = SqlAlchemyUnitOfWork(session, cache=self.cache)
+                async with uow:
+                    if await uow.usuarios.substituir_senha_hash(usuario_id, hash_atual, novo_hash):
+                        self.gravados += 1
+                    await uow.commit()
+        except TooManyRequestsError:
+            logger.debug("Pool de hash ocupado; rehash do usuário %s adiado", usuario_id)
+        except Exception:
+            logger.exception("Falha no rehash da senha do usuário %s", usuario_id)
+        finally:
+            self._em_andamento.discard(usuario_id)
+
+_password_rehasher: Optional[PasswordRehasher] = None
+
+def get_password_rehasher() -> Optional[PasswordRehasher]:
+    """Retorna o rehasher em execução, ou None se o rehash no login estiver desativado."""
+    return _password_rehasher
+
+def start_password_rehasher(
+    session_factory: Callable[[], AsyncSession],
+    password_hasher: PasswordHasher,
+    cache: Optional[CacheInterface] = None
+) -> Optional[PasswordRehasher]:
+    global _password_rehasher
+
+    if not get_settings().PASSWORD_REHASH_ON_LOGIN:
+        return None
+
+    _password_rehasher = PasswordRehasher(session_factory, password_hasher, cache)
+    return _password_rehasher
+
+async def stop_password_rehasher() -> None:
+    global _password_rehasher
+
+    if _password_rehasher is not None:
+        await _password_rehasher.stop()
+    _password_rehasher = None
@@ -0,0 +1,163 @@
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.config.database import build_async_url, build_engine_options
+from src.config.settings import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+ESTRATEGIAS = ("round_robin", "least_connections")
+
+@dataclass
+class Replica:
+    nome: str
+    engine: AsyncEngine
+    session_factory: async_sessionmaker
+    em_uso: int = 0
+    indisponivel_ate: float = 0.0
+    falhas: int = 0
+
+    def disponivel(self, agora: float) -> bool:
+        return self.indisponivel_ate <= agora
+
+@dataclass
+class ReplicaStats:
+    leituras: int = 0
+    fallbacks: int = 0
+    por_replica: Dict[str, int] = field(default_factory=dict)
+
+class ReplicaRouter:
+    """
+    Escolhe a réplica que atende cada escopo somente leitura.
+
+    - round_robin: alterna entre as réplicas disponíveis;
+    - least_connections: a réplica com menos sessões abertas por este worker.
+
+    Uma réplica que falha ao conectar fica em quarentena por
+    `tempo_quarentena` segundos; sem réplicas disponíveis, abrir_sessao
+    devolve None e a leitura vai para o primário.
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[Replica],
+        estrategia: str = "round_robin",
+        tempo_quarentena: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if estrategia not in ESTRATEGIAS:
+            raise ValueError(f"Estratégia de réplica desconhecida: {estrategia}")
+        self.replicas = list(replicas)
+        self.estrategia = estrategia
+        self.tempo_quarentena = tempo_quarentena
+        self._clock = clock
+        self._rodizio = itertools.count()
+        self.stats = ReplicaStats()
+
+    def candidatas(self) -> List[Replica]:
+        """Réplicas disponíveis, na ordem em que devem ser tentadas."""
+        agora = self._clock()
+        disponiveis = [replica for replica in self.replicas if replica.disponivel(agora)]
+        if not disponiveis:
+            return []
+
+        if self.estrategia == "least_connections":
+            return sorted(disponiveis, key=lambda replica: replica.em_uso)
+
+        inicio = next(self._rodizio) % len(disponiveis)
+        return disponiveis[inicio:] + disponiveis[:inicio]
+
+    async def abrir_sessao(self) -> Optional[Tuple[Replica, AsyncSession]]:
+        """
+        Abre uma sessão já conectada em uma réplica saudável. Falhas de
+        conexão colocam a réplica em quarentena e passam para a próxima.
+        """
+        for replica in self.candidatas():
+            sessao = replica.session_factory()
+            replica.em_uso += 1
+            try:
+                await sessao.connection()
+            except Exception:
+                replica.em_uso -= 1
+                await sessao.close()
+                self.marcar_falha(replica)
+                continue
+
+            self.stats.leituras += 1
+            self.stats.por_replica[replica.nome] = self.stats.por_replica.get(replica.nome, 0) + 1
+            return replica, sessao
+
+        self.stats.fallbacks += 1
+        return None
+
+    async def liberar(self, replica: Replica, sessao: AsyncSession) -> None:
+        replica.em_uso -= 1
+        await sessao.close()
+
+    def marcar_falha(self, replica: Replica) -> None:
+        replica.falhas += 1
+        replica.indisponivel_ate = self._clock() + self.tempo_quarentena
+        logger.warning(
+            "Réplica %s indisponível; leituras no primário por %.0f s",
+            replica.nome, self.tempo_quarentena
+        )
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+def criar_replica(nome: str, engine: AsyncEngine) -> Replica:
+    return Replica(
+        nome=nome,
+        engine=engine,
+        session_factory=async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    )
+
+_replica_router: Optional[ReplicaRouter] = None
+
+def init_replica_router(settings: Optional[Settings] = None) -> Optional[ReplicaRouter]:
+    """
+    Cria os engines das réplicas configuradas em DATABASE_REPLICA_URLS
+    (idempotente). Sem réplicas configuradas, retorna None.
+    """
+    global _replica_router
+
+    settings = settings or get_settings()
+    urls = [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+    if _replica_router is None and urls:
+        opcoes = build_engine_options(settings)
+        replicas = []
+        for indice, url in enumerate(urls):
+            engine = create_async_engine(build_async_url(url), **opcoes)
+            replicas.append(criar_replica(f"replica-{indice}", engine))
+        _replica_router = ReplicaRouter(
+            replicas,
+            estrategia=settings.DATABASE_REPLICA_STRATEGY,
+            tempo_quarentena=settings.DATABASE_REPLICA_QUARANTINE_SECONDS
+        )
+    return _replica_router
+
+def get_replica_router() -> Optional[ReplicaRouter]:
+    return _replica_router
+
+async def dispose_replica_router() -> None:
+    global _replica_router
+
+    if _replica_router is not None:
+        await _replica_router.dispose()
+    _replica_router = None
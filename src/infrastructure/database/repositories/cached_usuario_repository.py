@@ -0,0 +1,241 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from uuid import UUID
+
+import orjson
+
+from src.application.interfaces.cache_interface import CacheInterface
+from src.domain.entities.usuario import Usuario, PerfilUsuario
+from src.domain.repositories.usuario_repository_interface import UsuarioRepositoryInterface
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.database.repositories.usuario_repository_decorator import UsuarioRepositoryDecorator
+
+logger = logging.getLogger(__name__)
+
+# Agrupa leituras concorrentes que erraram o cache, entre todas as requisições do worker
+_single_flight = SingleFlight("cache")
+
+def get_cache_single_flight() -> SingleFlight:
+    return _single_flight
+
+class CachedUsuarioRepository(UsuarioRepositoryDecorator):
+    """
+    Decorador do repositório com leitura através do cache (read-through)
+    para obter_por_id e obter_por_email.
+
+    Cada usuário tem um contador de versão no cache; a entrada guarda a
+    versão vigente quando foi lida do banco e só é aceita se ainda for a
+    atual. Alterações incrementam a versão depois do commit (via
+    publicar_invalidacoes), o que invalida a entrada em todos os workers
+    e descarta gravações atrasadas de leituras anteriores à alteração.
+
+    Usuários alterados no comando em andamento são lidos direto do
+    repositório até o commit, para que o comando enxergue as próprias
+    alterações.
+
+    O ultimo_login gravado em lote não invalida o cache e pode ficar
+    defasado até o TTL.
+
+    Sobre uma sessão de réplica (`preencher=False`) o repositório só lê do
+    cache: uma réplica atrasada gravaria a linha antiga sob a versão atual,
+    e todos os workers a aceitariam até o TTL.
+    """
+
+    def __init__(
+        self,
+        repositorio: UsuarioRepositoryInterface,
+        cache: CacheInterface,
+        ttl: float = 300.0,
+        prefixo: str = "fastapi-ddd",
+        single_flight: Optional[SingleFlight] = None,
+        preencher: bool = True
+    ):
+        super().__init__(repositorio)
+        self.cache = cache
+        self.ttl = ttl
+        self.prefixo = prefixo
+        self.single_flight = single_flight or _single_flight
+        self.preencher = preencher
+        self._pendentes: Set[UUID] = set()
+
+    # -- Leituras com cache --
+
+    async def obter_por_id(self, usuario_id: UUID) -> Optional[Usuario]:
+        if usuario_id in self._pendentes:
+            return await self.repositorio.obter_por_id(usuario_id)
+
+        versao_atual, dados = await self.cache.get_many([
+            self._chave_versao(usuario_id), self._chave_usuario(usuario_id)
+        ])
+        versao = int(versao_atual or 0)
+        if dados is not None:
+            usuario = self._desserializar(dados, versao)
+            if usuario is not None:
+                return usuario
+
+        if not self.preencher:
+            return await self.repositorio.obter_por_id(usuario_id)
+        return await self.single_flight.executar(
+            ("id", usuario_id), lambda: self._carregar_por_id(usuario_id, versao)
+        )
+
+    async def obter_por_email(self, email: str) -> Optional[Usuario]:
+        if self._pendentes:
+            return await self.repositorio.obter_por_email(email)
+
+        usuario_id = await self.cache.get(self._chave_email(email))
+        if usuario_id is not None:
+            usuario = await self.obter_por_id(UUID(usuario_id.decode()))
+            # O email pode ter mudado desde que o mapeamento foi gravado
+            if usuario is not None and usuario.email == email:
+                return usuario
+
+        if not self.preencher:
+            return await self.repositorio.obter_por_email(email)
+        return await self.single_flight.executar(
+            ("email", email), lambda: self._carregar_por_email(email)
+        )
+
+    async def obter_por_ids(self, usuario_ids: Iterable[UUID]) -> Dict[UUID, Usuario]:
+        ids = list(dict.fromkeys(usuario_ids))
+        em_cache = [usuario_id for usuario_id in ids if usuario_id not in self._pendentes]
+
+        # Versões e dados de todos os IDs em uma ida ao cache
+        chaves = []
+        for usuario_id in em_cache:
+            chaves += [self._chave_versao(usuario_id), self._chave_usuario(usuario_id)]
+        valores = await self.cache.get_many(chaves)
+
+        usuarios: Dict[UUID, Usuario] = {}
+        versoes: Dict[UUID, int] = {}
+        for indice, usuario_id in enumerate(em_cache):
+            versao, dados = int(valores[2 * indice] or 0), valores[2 * indice + 1]
+            usuario = self._desserializar(dados, versao) if dados is not None else None
+            if usuario is None:
+                versoes[usuario_id] = versao
+            else:
+                usuarios[usuario_id] = usuario
+
+        faltantes = [usuario_id for usuario_id in ids if usuario_id not in usuarios]
+        if faltantes:
+            encontrados = await self.repositorio.obter_por_ids(faltantes)
+            usuarios.update(encontrados)
+            if not self.preencher:
+                return usuarios
+            await self.cache.set_many({
+                self._chave_usuario(usuario_id): self._serializar(encontrados[usuario_id], versao)
+                for usuario_id, versao in versoes.items() if usuario_id in encontrados
+            }, self.ttl)
+        return usuarios
+
+    async def obter_versao(self, usuario_id: UUID) -> Optional[Tuple[datetime, Optional[datetime]]]:
+        # Entrada válida no cache responde sem ir ao banco; a ausência não é
+        # preenchida aqui (a versão sozinha não serve para obter_por_id)
+        if usuario_id not in self._pendentes:
+            versao_atual, dados = await self.cache.get_many([
+                self._chave_versao(usuario_id), self._chave_usuario(usuario_id)
+            ])
+            if dados is not None:
+                usuario = self._desserializar(dados, int(versao_atual or 0))
+                if usuario is not None:
+                    return usuario.data_atualizacao, usuario.ultimo_login
+        return await self.repositorio.obter_versao(usuario_id)
+
+    async def _carregar_por_id(self, usuario_id: UUID, versao: int) -> Optional[Usuario]:
+        usuario = await self.repositorio.obter_por_id(usuario_id)
+        if usuario is not None:
+            await self.cache.set(
+                self._chave_usuario(usuario_id), self._serializar(usuario, versao), self.ttl
+            )
+        return usuario
+
+    async def _carregar_por_email(self, email: str) -> Optional[Usuario]:
+        usuario = await self.repositorio.obter_por_email(email)
+        if usuario is not None:
+            # Só o mapeamento email -> id: a versão do usuário não foi lida
+            # antes da consulta, então os dados ficam para obter_por_id
+            await self.cache.set(self._chave_email(email), str(usuario.id).encode(), self.ttl)
+        return usuario
+
+    # -- Escritas: invalidação após o commit --
+
+    async def atualizar(self, usuario: Usuario) -> Usuario:
+        self._pendentes.add(usuario.id)
+        return await self.repositorio.atualizar(usuario)
+
+    async def atualizar_campos(self, usuario_id: UUID, campos: Dict[str, Any]) -> Optional[Usuario]:
+        self._pendentes.add(usuario_id)
+        return await self.repositorio.atualizar_campos(usuario_id, campos)
+
+    async def substituir_senha_hash(self, usuario_id: UUID, hash_atual: str, novo_hash: str) -> bool:
+        self._pendentes.add(usuario_id)
+        return await self.repositorio.substituir_senha_hash(usuario_id, hash_atual, novo_hash)
+
+    async def remover(self, usuario_id: UUID) -> bool:
+        self._pendentes.add(usuario_id)
+        return await self.repositorio.remover(usuario_id)
+
+    async def publicar_invalidacoes(self) -> None:
+        """Chamado pela unidade de trabalho depois do commit."""
+        pendentes, self._pendentes = self._pendentes, set()
+        for usuario_id in pendentes:
+            try:
+                await self.cache.incr(self._chave_versao(usuario_id))
+            except Exception:
+                # O commit já aconteceu: a entrada antiga vale até expirar o TTL
+                logger.exception("Falha ao invalidar o usuário %s no cache", usuario_id)
+                continue
+            await self.cache.delete(self._chave_usuario(usuario_id))
+
+    def descartar_invalidacoes(self) -> None:
+        """Chamado pela unidade de trabalho no rollback."""
+        self._pendentes.clear()
+
+    # -- Chaves e serialização --
+
+    def _chave_usuario(self, usuario_id: UUID) -> str:
+        return f"{self.prefixo}:usuario:{usuario_id}"
+
+    def _chave_versao(self, usuario_id: UUID) -> str:
+        return f"{self.prefixo}:usuario:{usuario_id}:versao"
+
+    def _chave_email(self, email: str) -> str:
+        return f"{self.prefixo}:usuario:email:{email}"
+
+    def _serializar(self, usuario: Usuario, versao: int) -> bytes:
+        # Inclui o senha_hash (usado no login): o backend do cache deve ter
+        # o mesmo nível de proteção do banco
+        return orjson.dumps({
+            "_v": versao,
+            "id": usuario.id,
+            "email": usuario.email,
+            "senha_hash": usuario.senha_hash,
+            "nome": usuario.nome,
+            "perfil": usuario.perfil,
+            "ativo": usuario.ativo,
+            "data_criacao": usuario.data_criacao,
+            "data_atualizacao": usuario.data_atualizacao,
+            "ultimo_login": usuario.ultimo_login,
+        })
+
+    def _desserializar(self, dados: bytes, versao: int) -> Optional[Usuario]:
+        try:
+            item = orjson.loads(dados)
+        except orjson.JSONDecodeError:
+            return None
+        if item.get("_v") != versao:
+            return None
+
+        ultimo_login = item["ultimo_login"]
+        return Usuario.from_persistence(
+            id=UUID(item["id"]),
+            email=item["email"],
+            senha_hash=item["senha_hash"],
+            nome=item["nome"],
+            perfil=PerfilUsuario(item["perfil"]),
+            ativo=item["ativo"],
+            data_criacao=datetime.fromisoformat(item["data_criacao"]),
+            data_atualizacao=datetime.fromisoformat(item["data_atualizacao"]),
+            ultimo_login=datetime.fromisoformat(ultimo_login) if ultimo_login else None
+        )
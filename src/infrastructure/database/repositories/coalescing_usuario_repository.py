@@ -0,0 +1,44 @@
+from typing import Optional
+from uuid import UUID
+
+from src.domain.entities.usuario import Usuario
+from src.domain.repositories.usuario_repository_interface import UsuarioRepositoryInterface
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.database.repositories.usuario_repository_decorator import UsuarioRepositoryDecorator
+
+# Compartilhado por todas as requisições do worker
+_single_flight = SingleFlight("leituras")
+
+def get_leituras_single_flight() -> SingleFlight:
+    return _single_flight
+
+class CoalescingUsuarioRepository(UsuarioRepositoryDecorator):
+    """
+    Decorador que agrupa leituras idênticas concorrentes (obter_por_id e
+    obter_por_email): enquanto uma consulta está em andamento no worker,
+    as chamadas com a mesma chave aguardam o resultado dela em vez de
+    consultar o banco de novo. Nada é guardado depois que a consulta
+    termina.
+
+    Só deve envolver repositórios usados em leituras fora de um comando:
+    o resultado vem da sessão de outra requisição e não enxergaria
+    alterações ainda não confirmadas desta.
+    """
+
+    def __init__(
+        self,
+        repositorio: UsuarioRepositoryInterface,
+        single_flight: Optional[SingleFlight] = None
+    ):
+        super().__init__(repositorio)
+        self.single_flight = single_flight or _single_flight
+
+    async def obter_por_id(self, usuario_id: UUID) -> Optional[Usuario]:
+        return await self.single_flight.executar(
+            ("id", usuario_id), lambda: self.repositorio.obter_por_id(usuario_id)
+        )
+
+    async def obter_por_email(self, email: str) -> Optional[Usuario]:
+        return await self.single_flight.executar(
+            ("email", email), lambda: self.repositorio.obter_por_email(email)
+        )
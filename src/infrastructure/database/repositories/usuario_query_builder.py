@@ -0,0 +1,87 @@
+import string
+import sys
+from typing import Optional
+
+from sqlalchemy import Select, func, or_
+
+from src.domain.repositories.filtro_usuarios import FiltroUsuarios, ModoBusca
+from src.infrastructure.database.models.usuario_model import UsuarioModel
+
+# lower() do SQLite só converte letras ASCII
+_MINUSCULAS_ASCII = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+class UsuarioQueryBuilder:
+    """
+    Traduz um FiltroUsuarios em condições WHERE escritas para os índices
+    de busca do UsuarioModel (lower(nome), lower(email) e trigramas).
+
+    - prefixo: no PostgreSQL, LIKE 'termo%' (índice text_pattern_ops); nos
+      demais, o intervalo lower(col) >= 'termo' AND < sucessor('termo'),
+      que o SQLite resolve pelo índice funcional (o LIKE do SQLite só usa
+      índice com collation NOCASE).
+    - substring: LIKE '%termo%'; no PostgreSQL usa o índice de trigramas,
+      nos demais percorre o índice funcional.
+
+    O termo é convertido para minúsculas como o lower() do banco faria.
+    No SQLite, que só converte ASCII, lower('Érica') é 'Érica': o termo
+    "Érica" vira "Érica" (com str.lower() viraria "érica" e não casaria),
+    e buscar "érica" não encontra "Érica".
+    """
+
+    def __init__(self, dialeto: str):
+        self.dialeto = dialeto
+
+    def aplicar(self, stmt: Select, filtro: FiltroUsuarios) -> Select:
+        if filtro.termo is not None:
+            stmt = stmt.where(or_(
+                self._condicao_termo(func.lower(UsuarioModel.nome), filtro),
+                self._condicao_termo(func.lower(UsuarioModel.email), filtro),
+            ))
+        if filtro.perfil is not None:
+            stmt = stmt.where(UsuarioModel.perfil == filtro.perfil)
+        if filtro.ativo is not None:
+            stmt = stmt.where(UsuarioModel.ativo == filtro.ativo)
+        if filtro.criado_de is not None:
+            stmt = stmt.where(UsuarioModel.data_criacao >= filtro.criado_de)
+        if filtro.criado_ate is not None:
+            stmt = stmt.where(UsuarioModel.data_criacao <= filtro.criado_ate)
+        if filtro.ultimo_login_de is not None:
+            stmt = stmt.where(UsuarioModel.ultimo_login >= filtro.ultimo_login_de)
+        if filtro.ultimo_login_ate is not None:
+            stmt = stmt.where(UsuarioModel.ultimo_login <= filtro.ultimo_login_ate)
+        return stmt
+
+    def _condicao_termo(self, expressao, filtro: FiltroUsuarios):
+        termo = self._minusculas(filtro.termo)
+        if filtro.modo == ModoBusca.PREFIXO and self.dialeto != "postgresql":
+            sucessor = _sucessor(termo)
+            if sucessor is None:
+                return expressao >= termo
+            return (expressao >= termo) & (expressao < sucessor)
+
+        padrao = _escapar_like(termo)
+        if filtro.modo == ModoBusca.PREFIXO:
+            return expressao.like(f"{padrao}%", escape="\\")
+        return expressao.like(f"%{padrao}%", escape="\\")
+
+    def _minusculas(self, termo: str) -> str:
+        if self.dialeto == "postgresql":
+            return termo.lower()
+        return termo.translate(_MINUSCULAS_ASCII)
+
+def _escapar_like(termo: str) -> str:
+    return termo.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _sucessor(prefixo: str) -> Optional[str]:
+    """
+    Menor string maior que todas as que começam com `prefixo`, ou None se
+    não houver (prefixo só com o último code point).
+    """
+    prefixo = prefixo.rstrip(chr(sys.maxunicode))
+    if not prefixo:
+        return None
+    proximo = ord(prefixo[-1]) + 1
+    if 0xD800 <= proximo <= 0xDFFF:
+        # Surrogates não são codificáveis em UTF-8
+        proximo = 0xE000
+    return prefixo[:-1] + chr(proximo)
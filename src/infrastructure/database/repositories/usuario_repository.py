@@ -1,12 +1,72 @@
-from typing import List, Optional
+import random
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 from uuid import UUID
 
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    String,
+    Uuid,
+    and_,
+    any_,
+    bindparam,
+    case,
+    column,
+    delete,
+    func,
+    literal,
+    null,
+    text,
+    tuple_,
+    union_all,
+    update,
+    values
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.domain.entities.usuario import Usuario, PerfilUsuario
+from src.domain.exceptions.domain_exceptions import DomainValidationError
+from src.domain.repositories.filtro_usuarios import FiltroUsuarios
 from src.domain.repositories.usuario_repository_interface import UsuarioRepositoryInterface
+from src.infrastructure.database.models.usuario_contador_model import (
+    PREFIXO_CADASTROS,
+    PREFIXO_GRUPO,
+    UsuarioContadorModel,
+    chave_cadastros,
+    chave_grupo
+)
 from src.infrastructure.database.models.usuario_model import UsuarioModel
+from src.infrastructure.database.repositories.usuario_query_builder import UsuarioQueryBuilder
+
+# Colunas expostas pela API (sem senha_hash), na ordem de UsuarioResponse
+COLUNAS_PUBLICAS = (
+    UsuarioModel.email,
+    UsuarioModel.nome,
+    UsuarioModel.id,
+    UsuarioModel.perfil,
+    UsuarioModel.ativo,
+    UsuarioModel.data_criacao,
+    UsuarioModel.data_atualizacao,
+    UsuarioModel.ultimo_login,
+)
+
+# IDs por consulta em obter_por_ids fora do PostgreSQL
+TAMANHO_LOTE_IDS = 500
+
+# Parâmetros por comando: o protocolo do PostgreSQL (asyncpg) aceita até
+# 32767 e o SQLite, desde a 3.32, até 32766
+LIMITE_PARAMETROS = 32766
+
+# Fatias de cada contador de estatísticas (ver UsuarioContadorModel)
+FATIAS_CONTADORES = 16
+
+# Chave do advisory lock da reconciliação: uma por vez entre todos os processos
+CHAVE_BLOQUEIO_RECONCILIACAO = 7_530_019_024
 
 class UsuarioRepository(UsuarioRepositoryInterface):
     def __init__(self, session: AsyncSession):
@@ -26,29 +86,147 @@ class UsuarioRepository(UsuarioRepositoryInterface):
         )
         
         self.session.add(db_usuario)
-        await self.session.commit()
-        await self.session.refresh(db_usuario)
+        try:
+            await self.session.flush()
+        except IntegrityError:
+            raise DomainValidationError(f"Já existe um usuário com o email {usuario.email}")
         
+        await self._ajustar_contadores(
+            self._deltas_contadores(usuario.perfil, usuario.ativo, usuario.data_criacao, 1)
+        )
         return self._mapear_para_entidade(db_usuario)
     
+    async def criar_em_lote(self, usuarios: List[Usuario]) -> Set[str]:
+        if not usuarios:
+            return set()
+        
+        # INSERT multi-linha com ON CONFLICT (email) DO NOTHING, em comandos
+        # com no máximo LIMITE_PARAMETROS parâmetros (um por coluna e linha)
+        insert = postgresql.insert if self._dialeto() == "postgresql" else sqlite.insert
+        linhas = [self._mapear_para_linha(usuario) for usuario in usuarios]
+        por_comando = LIMITE_PARAMETROS // len(linhas[0])
+        inseridos = set()
+        deltas: Counter = Counter()
+        for inicio in range(0, len(linhas), por_comando):
+            stmt = (
+                insert(UsuarioModel)
+                .values(linhas[inicio:inicio + por_comando])
+                .on_conflict_do_nothing(index_elements=[UsuarioModel.email])
+                .returning(
+                    UsuarioModel.email,
+                    UsuarioModel.perfil,
+                    UsuarioModel.ativo,
+                    UsuarioModel.data_criacao
+                )
+            )
+            result = await self.session.execute(stmt)
+            for row in result:
+                inseridos.add(row.email)
+                deltas.update(self._deltas_contadores(row.perfil, row.ativo, row.data_criacao, 1))
+        
+        await self._ajustar_contadores(deltas)
+        return inseridos
+    
     async def atualizar(self, usuario: Usuario) -> Usuario:
-        stmt = select(UsuarioModel).where(UsuarioModel.id == usuario.id)
-        result = await self.session.execute(stmt)
-        db_usuario = result.scalar_one_or_none()
+        return await self.atualizar_campos(usuario.id, {
+            "email": usuario.email,
+            "senha_hash": usuario.senha_hash,
+            "nome": usuario.nome,
+            "perfil": usuario.perfil,
+            "ativo": usuario.ativo,
+            "data_atualizacao": usuario.data_atualizacao,
+            "ultimo_login": usuario.ultimo_login
+        })
+    
+    async def atualizar_campos(self, usuario_id: UUID, campos: Dict[str, Any]) -> Optional[Usuario]:
+        # UPDATE ... RETURNING: escreve apenas as colunas informadas em uma única ida ao banco
+        stmt = (
+            update(UsuarioModel)
+            .where(UsuarioModel.id == usuario_id)
+            .values(**campos)
+            .returning(*UsuarioModel.__table__.columns)
+        )
         
-        if db_usuario:
-            db_usuario.email = usuario.email
-            db_usuario.senha_hash = usuario.senha_hash
-            db_usuario.nome = usuario.nome
-            db_usuario.perfil = usuario.perfil
-            db_usuario.ativo = usuario.ativo
-            db_usuario.data_atualizacao = usuario.data_atualizacao
-            db_usuario.ultimo_login = usuario.ultimo_login
-            
-            await self.session.commit()
-            await self.session.refresh(db_usuario)
-            
-        return self._mapear_para_entidade(db_usuario) if db_usuario else None
+        # Perfil e situação anteriores, para ajustar os contadores
+        altera_grupo = "perfil" in campos or "ativo" in campos
+        if altera_grupo and self._dialeto() == "postgresql":
+            # Lidos e bloqueados no mesmo comando:
+            # WITH anterior AS (SELECT ... FOR UPDATE) UPDATE ... FROM anterior RETURNING anterior.*, usuarios.*
+            anterior = (
+                select(UsuarioModel.id, UsuarioModel.perfil, UsuarioModel.ativo)
+                .where(UsuarioModel.id == usuario_id)
+                .with_for_update()
+                .cte("anterior")
+            )
+            stmt = (
+                update(UsuarioModel)
+                .where(UsuarioModel.id == anterior.c.id)
+                .values(**campos)
+                .returning(
+                    *UsuarioModel.__table__.columns,
+                    anterior.c.perfil.label("perfil_anterior"),
+                    anterior.c.ativo.label("ativo_anterior")
+                )
+            )
+        elif altera_grupo:
+            # O RETURNING do SQLite não enxerga outras tabelas: os contadores
+            # são ajustados antes, a partir da linha atual
+            await self._ajustar_grupo_pela_linha(usuario_id, campos)
+        
+        try:
+            result = await self.session.execute(stmt)
+            row = result.mappings().one_or_none()
+        except IntegrityError:
+            # A transação é desfeita pela unidade de trabalho
+            if "email" in campos:
+                raise DomainValidationError(f"Email {campos['email']} já está em uso")
+            raise
+        
+        if row is None:
+            return None
+        if "perfil_anterior" in row and (row["perfil_anterior"], row["ativo_anterior"]) != (row["perfil"], row["ativo"]):
+            await self._ajustar_contadores({
+                chave_grupo(row["perfil_anterior"], row["ativo_anterior"]): -1,
+                chave_grupo(row["perfil"], row["ativo"]): 1,
+            })
+        return self._mapear_linha_para_entidade(row)
+    
+    async def registrar_logins(self, logins: Mapping[UUID, datetime]) -> int:
+        if not logins:
+            return 0
+        
+        # WITH v(id, ultimo_login) AS (VALUES ...) UPDATE usuarios ... FROM v
+        dados = values(
+            column("id", Uuid),
+            column("ultimo_login", DateTime),
+            name="v"
+        ).data(list(logins.items())).cte("v")
+        stmt = (
+            update(UsuarioModel)
+            .where(UsuarioModel.id == dados.c.id)
+            .values(
+                ultimo_login=dados.c.ultimo_login,
+                # Login não é uma alteração cadastral: evita o onupdate
+                data_atualizacao=UsuarioModel.data_atualizacao
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
+    
+    async def substituir_senha_hash(self, usuario_id: UUID, hash_atual: str, novo_hash: str) -> bool:
+        stmt = (
+            update(UsuarioModel)
+            .where(UsuarioModel.id == usuario_id, UsuarioModel.senha_hash == hash_atual)
+            .values(
+                senha_hash=novo_hash,
+                # Mesma senha com outro hash: não é uma alteração cadastral
+                data_atualizacao=UsuarioModel.data_atualizacao
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount == 1
     
     async def obter_por_id(self, usuario_id: UUID) -> Optional[Usuario]:
         stmt = select(UsuarioModel).where(UsuarioModel.id == usuario_id)
@@ -57,6 +235,40 @@ class UsuarioRepository(UsuarioRepositoryInterface):
         
         return self._mapear_para_entidade(db_usuario) if db_usuario else None
     
+    async def obter_por_ids(self, usuario_ids: Iterable[UUID]) -> Dict[UUID, Usuario]:
+        ids = list(dict.fromkeys(usuario_ids))
+        if not ids:
+            return {}
+        
+        colunas = select(*UsuarioModel.__table__.columns)
+        if self._dialeto() == "postgresql":
+            # id = ANY($1::UUID[]): um único parâmetro, qualquer que seja o número de IDs
+            lotes = [colunas.where(UsuarioModel.id == any_(
+                bindparam("ids", ids, type_=postgresql.ARRAY(Uuid(as_uuid=True)))
+            ))]
+        else:
+            # IN (...) em lotes, abaixo do limite de parâmetros do SQLite
+            lotes = [
+                colunas.where(UsuarioModel.id.in_(ids[inicio:inicio + TAMANHO_LOTE_IDS]))
+                for inicio in range(0, len(ids), TAMANHO_LOTE_IDS)
+            ]
+        
+        usuarios = {}
+        for stmt in lotes:
+            result = await self.session.execute(stmt)
+            for row in result.mappings():
+                usuarios[row["id"]] = self._mapear_linha_para_entidade(row)
+        return usuarios
+    
+    async def obter_versao(self, usuario_id: UUID) -> Optional[Tuple[datetime, Optional[datetime]]]:
+        stmt = select(UsuarioModel.data_atualizacao, UsuarioModel.ultimo_login).where(
+            UsuarioModel.id == usuario_id
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        
+        return (row.data_atualizacao, row.ultimo_login) if row else None
+    
     async def obter_por_email(self, email: str) -> Optional[Usuario]:
         stmt = select(UsuarioModel).where(UsuarioModel.email == email)
         result = await self.session.execute(stmt)
@@ -64,27 +276,333 @@ class UsuarioRepository(UsuarioRepositoryInterface):
         
         return self._mapear_para_entidade(db_usuario) if db_usuario else None
     
+    async def obter_emails_existentes(self, emails: Iterable[str]) -> Set[str]:
+        emails = list(emails)
+        if not emails:
+            return set()
+        
+        existentes = set()
+        for inicio in range(0, len(emails), LIMITE_PARAMETROS):
+            stmt = select(UsuarioModel.email).where(
+                UsuarioModel.email.in_(emails[inicio:inicio + LIMITE_PARAMETROS])
+            )
+            result = await self.session.execute(stmt)
+            existentes.update(result.scalars().all())
+        return existentes
+    
     async def listar(self, skip: int = 0, limit: int = 100) -> List[Usuario]:
-        stmt = select(UsuarioModel).offset(skip).limit(limit)
+        stmt = (
+            select(UsuarioModel)
+            .order_by(UsuarioModel.data_criacao, UsuarioModel.id)
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self.session.execute(stmt)
         db_usuarios = result.scalars().all()
         
         return [self._mapear_para_entidade(db_usuario) for db_usuario in db_usuarios]
     
+    async def listar_linhas(
+        self, 
+        skip: int = 0, 
+        limit: int = 100, 
+        apos: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Dict[str, Any]]:
+        # Apenas colunas: sem objetos ORM nem entidades no caminho da resposta
+        stmt = (
+            select(*COLUNAS_PUBLICAS)
+            .order_by(UsuarioModel.data_criacao, UsuarioModel.id)
+            .limit(limit)
+        )
+        if apos is not None:
+            stmt = stmt.where(
+                tuple_(UsuarioModel.data_criacao, UsuarioModel.id) > tuple_(*apos)
+            )
+        elif skip:
+            stmt = stmt.offset(skip)
+        result = await self.session.execute(stmt)
+        
+        return [dict(row) for row in result.mappings()]
+    
+    async def buscar_linhas(
+        self,
+        filtro: FiltroUsuarios,
+        limit: int = 100,
+        apos: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Dict[str, Any]]:
+        stmt = (
+            select(*COLUNAS_PUBLICAS)
+            .order_by(UsuarioModel.data_criacao, UsuarioModel.id)
+            .limit(limit)
+        )
+        stmt = UsuarioQueryBuilder(self._dialeto()).aplicar(stmt, filtro)
+        if apos is not None:
+            stmt = stmt.where(
+                tuple_(UsuarioModel.data_criacao, UsuarioModel.id) > tuple_(*apos)
+            )
+        result = await self.session.execute(stmt)
+        
+        return [dict(row) for row in result.mappings()]
+    
+    async def exportar(self, batch_size: int = 1000) -> AsyncIterator[Mapping[str, Any]]:
+        # Seleciona colunas (sem montar objetos ORM) e lê em lotes pelo cursor do servidor
+        stmt = (
+            select(*COLUNAS_PUBLICAS)
+            .order_by(UsuarioModel.data_criacao, UsuarioModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        try:
+            async for partition in result.mappings().partitions():
+                for row in partition:
+                    yield row
+        finally:
+            await result.close()
+    
     async def remover(self, usuario_id: UUID) -> bool:
-        stmt = select(UsuarioModel).where(UsuarioModel.id == usuario_id)
+        stmt = (
+            delete(UsuarioModel)
+            .where(UsuarioModel.id == usuario_id)
+            .returning(UsuarioModel.perfil, UsuarioModel.ativo, UsuarioModel.data_criacao)
+        )
         result = await self.session.execute(stmt)
-        db_usuario = result.scalar_one_or_none()
+        row = result.one_or_none()
+        if row is None:
+            return False
+        
+        await self._ajustar_contadores(
+            self._deltas_contadores(row.perfil, row.ativo, row.data_criacao, -1)
+        )
+        return True
+    
+    async def contar_por_grupo(self) -> Dict[Tuple[PerfilUsuario, bool], int]:
+        totais = await self._somar_contadores(
+            UsuarioContadorModel.chave.startswith(PREFIXO_GRUPO, autoescape=True)
+        )
+        grupos = {}
+        for chave, total in totais.items():
+            perfil, ativo = chave[len(PREFIXO_GRUPO):].rsplit(":", 1)
+            grupos[(PerfilUsuario(perfil), ativo == "1")] = total
+        return grupos
+    
+    async def contar_cadastros_por_dia(self, desde: date) -> Dict[date, int]:
+        # Chaves com a data ISO: o intervalo de dias é um intervalo de texto
+        totais = await self._somar_contadores(
+            UsuarioContadorModel.chave >= chave_cadastros(desde),
+            UsuarioContadorModel.chave < PREFIXO_CADASTROS[:-1] + ";"
+        )
+        return {
+            date.fromisoformat(chave[len(PREFIXO_CADASTROS):]): total
+            for chave, total in totais.items()
+        }
+    
+    async def contar_ativos_desde(self, momento: datetime) -> int:
+        # Intervalo no índice de ultimo_login: lê apenas os usuários do período
+        stmt = select(func.count()).select_from(UsuarioModel).where(UsuarioModel.ultimo_login >= momento)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+    
+    async def estimar_total(self) -> Optional[int]:
+        if self._dialeto() != "postgresql":
+            return None
+        
+        # Número de linhas estimado pelo ANALYZE/autovacuum; -1 se a tabela nunca foi analisada
+        result = await self.session.execute(text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:tabela AS regclass)"
+        ), {"tabela": UsuarioModel.__tablename__})
+        estimativa = result.scalar_one_or_none()
+        return estimativa if estimativa is not None and estimativa >= 0 else None
+    
+    async def reconciliar_contadores(self) -> Optional[int]:
+        if self._dialeto() == "postgresql":
+            # Outro processo já está reconciliando: aplicar a mesma correção
+            # duas vezes dobraria o ajuste
+            bloqueado = await self.session.scalar(
+                select(func.pg_try_advisory_xact_lock(CHAVE_BLOQUEIO_RECONCILIACAO))
+            )
+            if not bloqueado:
+                return None
+        
+        # Contagem real e soma dos contadores em uma única consulta, ou seja,
+        # no mesmo snapshot: escritas confirmadas aparecem nas duas (usuário e
+        # incremento vão na mesma transação) e as demais em nenhuma. Nada é
+        # bloqueado durante as varreduras.
+        dia = func.date(UsuarioModel.data_criacao)
+        consulta = union_all(
+            select(UsuarioModel.perfil, UsuarioModel.ativo, null(), null(), func.count())
+            .group_by(UsuarioModel.perfil, UsuarioModel.ativo),
+            select(null(), null(), dia, null(), func.count()).group_by(dia),
+            select(null(), null(), null(), UsuarioContadorModel.chave, func.sum(UsuarioContadorModel.total))
+            .group_by(UsuarioContadorModel.chave)
+        )
+        esperados: Counter = Counter()
+        atuais: Counter = Counter()
+        for perfil, ativo, valor_dia, chave, total in await self.session.execute(consulta):
+            if chave is not None:
+                atuais[chave] += int(total or 0)
+            elif valor_dia is not None:
+                # date no PostgreSQL, texto ISO no SQLite
+                esperados[chave_cadastros(date.fromisoformat(str(valor_dia)))] += total
+            else:
+                esperados[chave_grupo(perfil, ativo)] += total
         
-        if db_usuario:
-            await self.session.delete(db_usuario)
-            await self.session.commit()
-            return True
-            
-        return False
+        await self._compactar_contadores()
+        
+        # A correção é somada (total = total + diferença), então comuta com
+        # os incrementos feitos depois do snapshot
+        deltas = {
+            chave: esperados[chave] - atuais[chave]
+            for chave in esperados.keys() | atuais.keys()
+        }
+        await self._ajustar_contadores(deltas, fatia=0)
+        return sum(1 for delta in deltas.values() if delta)
+    
+    async def _compactar_contadores(self) -> None:
+        """Soma as fatias de cada chave na fatia 0, sem bloquear a tabela."""
+        fatias = UsuarioContadorModel.fatia != 0
+        if self._dialeto() == "postgresql":
+            # Remoção e soma no mesmo comando: os incrementos concorrentes nas
+            # fatias removidas aguardam o commit e recriam a fatia. As linhas
+            # são bloqueadas em ordem de chave, como nos incrementos (sem deadlock)
+            bloqueadas = (
+                select(UsuarioContadorModel.chave, UsuarioContadorModel.fatia)
+                .where(fatias)
+                .order_by(UsuarioContadorModel.chave, UsuarioContadorModel.fatia)
+                .with_for_update()
+                .cte("bloqueadas")
+            )
+            removidas = (
+                delete(UsuarioContadorModel)
+                .where(tuple_(UsuarioContadorModel.chave, UsuarioContadorModel.fatia).in_(
+                    select(bloqueadas.c.chave, bloqueadas.c.fatia)
+                ))
+                .returning(UsuarioContadorModel.chave, UsuarioContadorModel.total)
+                .cte("removidas")
+            )
+            stmt = postgresql.insert(UsuarioContadorModel).from_select(
+                ["chave", "fatia", "total"],
+                select(removidas.c.chave, literal(0), func.sum(removidas.c.total))
+                .group_by(removidas.c.chave)
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[UsuarioContadorModel.chave, UsuarioContadorModel.fatia],
+                set_={"total": UsuarioContadorModel.total + stmt.excluded.total}
+            )
+            await self.session.execute(stmt)
+            return
+        
+        # SQLite não aceita DELETE em CTE; com um único escritor, a leitura
+        # seguida da remoção é consistente
+        somas = await self._somar_contadores(fatias)
+        await self.session.execute(delete(UsuarioContadorModel).where(fatias))
+        await self._ajustar_contadores(somas, fatia=0)
+    
+    async def _somar_contadores(self, *condicoes) -> Dict[str, int]:
+        stmt = (
+            select(UsuarioContadorModel.chave, func.sum(UsuarioContadorModel.total))
+            .where(*condicoes)
+            .group_by(UsuarioContadorModel.chave)
+        )
+        result = await self.session.execute(stmt)
+        return {chave: int(total) for chave, total in result if total}
+    
+    async def _ajustar_contadores(self, deltas: Mapping[str, int], fatia: Optional[int] = None) -> None:
+        deltas = {chave: delta for chave, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        
+        # Upsert na mesma transação da escrita, em uma fatia aleatória; as
+        # chaves vão em ordem para que transações concorrentes bloqueiem as
+        # linhas na mesma sequência (sem deadlock)
+        if fatia is None:
+            fatia = random.randrange(FATIAS_CONTADORES)
+        insert = postgresql.insert if self._dialeto() == "postgresql" else sqlite.insert
+        stmt = insert(UsuarioContadorModel).values([
+            {"chave": chave, "fatia": fatia, "total": deltas[chave]} for chave in sorted(deltas)
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UsuarioContadorModel.chave, UsuarioContadorModel.fatia],
+            set_={"total": UsuarioContadorModel.total + stmt.excluded.total}
+        )
+        await self.session.execute(stmt)
+    
+    async def _ajustar_grupo_pela_linha(self, usuario_id: UUID, campos: Mapping[str, Any]) -> None:
+        """
+        Ajuste dos contadores de grupo em um INSERT ... SELECT sobre a linha
+        atual, que calcula no banco o delta de cada grupo (+1 no novo, -1 no
+        anterior; nada se não mudou). Deve preceder o UPDATE; o SQLite tem um
+        único escritor por vez, então a linha não muda até o commit.
+        """
+        grupos = values(
+            column("perfil", UsuarioModel.perfil.type),
+            column("ativo", Boolean),
+            column("chave", String),
+            name="grupos"
+        ).data([
+            (perfil, ativo, chave_grupo(perfil, ativo))
+            for perfil in PerfilUsuario for ativo in (False, True)
+        ]).cte("grupos")
+        novo_perfil = literal(campos["perfil"], UsuarioModel.perfil.type) if "perfil" in campos else UsuarioModel.perfil
+        novo_ativo = literal(campos["ativo"], Boolean) if "ativo" in campos else UsuarioModel.ativo
+        delta = (
+            case((and_(novo_perfil == grupos.c.perfil, novo_ativo == grupos.c.ativo), 1), else_=0)
+            - case((and_(UsuarioModel.perfil == grupos.c.perfil, UsuarioModel.ativo == grupos.c.ativo), 1), else_=0)
+        )
+        
+        stmt = sqlite.insert(UsuarioContadorModel).from_select(
+            ["chave", "fatia", "total"],
+            select(grupos.c.chave, literal(random.randrange(FATIAS_CONTADORES)), delta)
+            .where(UsuarioModel.id == usuario_id, delta != 0)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UsuarioContadorModel.chave, UsuarioContadorModel.fatia],
+            set_={"total": UsuarioContadorModel.total + stmt.excluded.total}
+        )
+        await self.session.execute(stmt)
+    
+    def _deltas_contadores(
+        self, 
+        perfil: PerfilUsuario, 
+        ativo: bool, 
+        data_criacao: datetime, 
+        sinal: int
+    ) -> Dict[str, int]:
+        return {
+            chave_grupo(perfil, ativo): sinal,
+            chave_cadastros(data_criacao.date()): sinal,
+        }
+    
+    def _dialeto(self) -> str:
+        return self.session.get_bind().dialect.name
+    
+    def _mapear_para_linha(self, usuario: Usuario) -> dict:
+        return {
+            "id": usuario.id,
+            "email": usuario.email,
+            "senha_hash": usuario.senha_hash,
+            "nome": usuario.nome,
+            "perfil": usuario.perfil,
+            "ativo": usuario.ativo,
+            "data_criacao": usuario.data_criacao,
+            "data_atualizacao": usuario.data_atualizacao,
+            "ultimo_login": usuario.ultimo_login
+        }
+    
+    def _mapear_linha_para_entidade(self, row: Mapping[str, Any]) -> Usuario:
+        return Usuario.from_persistence(
+            id=row["id"],
+            email=row["email"],
+            senha_hash=row["senha_hash"],
+            nome=row["nome"],
+            perfil=row["perfil"],
+            ativo=row["ativo"],
+            data_criacao=row["data_criacao"],
+            data_atualizacao=row["data_atualizacao"],
+            ultimo_login=row["ultimo_login"]
+        )
     
     def _mapear_para_entidade(self, model: UsuarioModel) -> Usuario:
-        return Usuario(
+        return Usuario.from_persistence(
             id=model.id,
             email=model.email,
             senha_hash=model.senha_hash,
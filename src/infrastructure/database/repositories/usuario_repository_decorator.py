@@ -0,0 +1,93 @@
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from uuid import UUID
+
+from src.domain.entities.usuario import PerfilUsuario, Usuario
+from src.domain.repositories.filtro_usuarios import FiltroUsuarios
+from src.domain.repositories.usuario_repository_interface import UsuarioRepositoryInterface
+
+class UsuarioRepositoryDecorator(UsuarioRepositoryInterface):
+    """
+    Base para decoradores do repositório: delega todas as operações ao
+    repositório envolvido. As subclasses sobrescrevem só o que mudam.
+    """
+
+    def __init__(self, repositorio: UsuarioRepositoryInterface):
+        self.repositorio = repositorio
+
+    @property
+    def session(self):
+        return self.repositorio.session
+
+    async def criar(self, usuario: Usuario) -> Usuario:
+        return await self.repositorio.criar(usuario)
+
+    async def criar_em_lote(self, usuarios: List[Usuario]) -> Set[str]:
+        return await self.repositorio.criar_em_lote(usuarios)
+
+    async def atualizar(self, usuario: Usuario) -> Usuario:
+        return await self.repositorio.atualizar(usuario)
+
+    async def atualizar_campos(self, usuario_id: UUID, campos: Dict[str, Any]) -> Optional[Usuario]:
+        return await self.repositorio.atualizar_campos(usuario_id, campos)
+
+    async def registrar_logins(self, logins: Mapping[UUID, datetime]) -> int:
+        return await self.repositorio.registrar_logins(logins)
+
+    async def substituir_senha_hash(self, usuario_id: UUID, hash_atual: str, novo_hash: str) -> bool:
+        return await self.repositorio.substituir_senha_hash(usuario_id, hash_atual, novo_hash)
+
+    async def obter_por_id(self, usuario_id: UUID) -> Optional[Usuario]:
+        return await self.repositorio.obter_por_id(usuario_id)
+
+    async def obter_por_ids(self, usuario_ids: Iterable[UUID]) -> Dict[UUID, Usuario]:
+        return await self.repositorio.obter_por_ids(usuario_ids)
+
+    async def obter_versao(self, usuario_id: UUID) -> Optional[Tuple[datetime, Optional[datetime]]]:
+        return await self.repositorio.obter_versao(usuario_id)
+
+    async def obter_por_email(self, email: str) -> Optional[Usuario]:
+        return await self.repositorio.obter_por_email(email)
+
+    async def obter_emails_existentes(self, emails: Iterable[str]) -> Set[str]:
+        return await self.repositorio.obter_emails_existentes(emails)
+
+    async def listar(self, skip: int = 0, limit: int = 100) -> List[Usuario]:
+        return await self.repositorio.listar(skip, limit)
+
+    async def listar_linhas(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        apos: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Dict[str, Any]]:
+        return await self.repositorio.listar_linhas(skip, limit, apos)
+
+    async def buscar_linhas(
+        self,
+        filtro: FiltroUsuarios,
+        limit: int = 100,
+        apos: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Dict[str, Any]]:
+        return await self.repositorio.buscar_linhas(filtro, limit, apos)
+
+    async def remover(self, usuario_id: UUID) -> bool:
+        return await self.repositorio.remover(usuario_id)
+
+    def exportar(self, batch_size: int = 1000) -> AsyncIterator[Mapping[str, Any]]:
+        return self.repositorio.exportar(batch_size)
+
+    async def contar_por_grupo(self) -> Dict[Tuple[PerfilUsuario, bool], int]:
+        return await self.repositorio.contar_por_grupo()
+
+    async def contar_cadastros_por_dia(self, desde: date) -> Dict[date, int]:
+        return await self.repositorio.contar_cadastros_por_dia(desde)
+
+    async def contar_ativos_desde(self, momento: datetime) -> int:
+        return await self.repositorio.contar_ativos_desde(momento)
+
+    async def estimar_total(self) -> Optional[int]:
+        return await self.repositorio.estimar_total()
+
+    async def reconciliar_contadores(self) -> Optional[int]:
+        return await self.repositorio.reconciliar_contadores()
@@ -0,0 +1,124 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.cache_interface import CacheInterface
+from src.application.interfaces.unit_of_work_interface import UnitOfWorkInterface
+from src.config.settings import get_settings
+from src.infrastructure.database.replica_router import ReplicaRouter
+from src.infrastructure.database.repositories.cached_usuario_repository import CachedUsuarioRepository
+from src.infrastructure.database.repositories.coalescing_usuario_repository import CoalescingUsuarioRepository
+from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+
+class SqlAlchemyUnitOfWork(UnitOfWorkInterface):
+    """
+    Unidade de trabalho sobre uma AsyncSession. Escopos aninhados
+    compartilham a transação do escopo mais externo, que é quem decide
+    entre commit e rollback.
+
+    Se um ReplicaRouter for informado, os escopos somente leitura usam uma
+    sessão em uma réplica. Continuam no primário as leituras dentro de um
+    comando, as feitas depois de um commit nesta unidade de trabalho (para
+    que a requisição leia o que acabou de gravar) e as que não encontram
+    réplica saudável.
+
+    Com um `cache`, os repositórios leem através dele e as invalidações
+    registradas durante o comando são publicadas só depois do commit.
+    Leituras em réplica consultam o cache mas não o preenchem.
+
+    Com `coalescer_leituras`, as leituras desses mesmos escopos (fora de
+    um comando e antes de qualquer commit) são agrupadas com leituras
+    idênticas em andamento no worker.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        replicas: Optional[ReplicaRouter] = None,
+        cache: Optional[CacheInterface] = None,
+        coalescer_leituras: bool = False
+    ):
+        self.session = session
+        self.replicas = replicas
+        self.cache = cache
+        self.coalescer_leituras = coalescer_leituras
+        self.usuarios = self._criar_repositorio(session)
+        self._repositorio_principal = self.usuarios
+        self._profundidade = 0
+        self._houve_escrita = False
+
+    async def __aenter__(self) -> "SqlAlchemyUnitOfWork":
+        self._profundidade += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._profundidade -= 1
+        if exc_type is not None or self._profundidade == 0:
+            # Após um commit não há nada pendente e o rollback é gratuito
+            await self.rollback()
+
+    @asynccontextmanager
+    async def somente_leitura(self) -> AsyncIterator["SqlAlchemyUnitOfWork"]:
+        # Fora de um comando e sem escrita anterior não há o que preservar da
+        # transação desta requisição: a leitura pode ir a uma réplica e ser
+        # agrupada com leituras idênticas de outras requisições
+        independente = self._profundidade == 0 and not self._houve_escrita
+
+        aberta = None
+        if independente and self.replicas is not None:
+            aberta = await self.replicas.abrir_sessao()
+
+        if aberta is None:
+            # Dentro de um comando a leitura segue na mesma transação
+            async with self:
+                if not (independente and self.coalescer_leituras):
+                    yield self
+                    return
+                usuarios = self.usuarios
+                self.usuarios = CoalescingUsuarioRepository(usuarios)
+                try:
+                    yield self
+                finally:
+                    self.usuarios = usuarios
+            return
+
+        replica, sessao = aberta
+        usuarios = self.usuarios
+        self.usuarios = self._criar_repositorio(sessao, replica=True)
+        if self.coalescer_leituras:
+            self.usuarios = CoalescingUsuarioRepository(self.usuarios)
+        try:
+            yield self
+        except DBAPIError as exc:
+            if exc.connection_invalidated:
+                self.replicas.marcar_falha(replica)
+            raise
+        finally:
+            self.usuarios = usuarios
+            await self.replicas.liberar(replica, sessao)
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        self._houve_escrita = True
+        if isinstance(self._repositorio_principal, CachedUsuarioRepository):
+            await self._repositorio_principal.publicar_invalidacoes()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+        if isinstance(self._repositorio_principal, CachedUsuarioRepository):
+            self._repositorio_principal.descartar_invalidacoes()
+
+    def _criar_repositorio(self, session: AsyncSession, replica: bool = False):
+        repositorio = UsuarioRepository(session)
+        if self.cache is None:
+            return repositorio
+        settings = get_settings()
+        return CachedUsuarioRepository(
+            repositorio,
+            self.cache,
+            ttl=settings.CACHE_TTL_SECONDS,
+            prefixo=settings.CACHE_KEY_PREFIX,
+            preencher=not replica
+        )
@@ -0,0 +1,28 @@
+from prometheus_client import Counter
+
+# Contadores incrementados na origem do evento (hasher, limite de login,
+# caches e single-flight). Ficam fora de metrics.py, que importa esses
+# módulos para amostrar os gauges. Counters sobrevivem à saída de um
+# worker no modo multiprocesso: a soma nunca diminui.
+
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total", "Operações de hash de senha recusadas por fila cheia"
+)
+
+LOGIN_RATE_LIMITED = Counter(
+    "login_rate_limited_total", "Tentativas de login recusadas pelo limite de taxa"
+)
+
+CACHE_HITS = Counter("cache_hits_total", "Acertos do cache", ["cache"])
+CACHE_MISSES = Counter("cache_misses_total", "Faltas do cache", ["cache"])
+
+SINGLE_FLIGHT_EXECUTIONS = Counter(
+    "single_flight_executions_total",
+    "Consultas efetivamente executadas pelo single-flight",
+    ["group"]
+)
+SINGLE_FLIGHT_COALESCED = Counter(
+    "single_flight_coalesced_total",
+    "Chamadas atendidas pelo resultado de uma consulta já em andamento",
+    ["group"]
+)
@@ -0,0 +1,138 @@
+import os
+import time
+from typing import Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from src.config import database
+from src.infrastructure.auth.password_hasher import get_password_hasher
+from src.infrastructure.auth.jwt_handler import get_token_cache
+from src.infrastructure.cache.principal_cache import get_principal_cache
+from src.infrastructure.database.repositories.cached_usuario_repository import get_cache_single_flight
+from src.infrastructure.database.repositories.coalescing_usuario_repository import get_leituras_single_flight
+from src.infrastructure.instrumentation.route_stats import LATENCY_BUCKETS_MS
+
+# Com PROMETHEUS_MULTIPROC_DIR definido (antes de importar prometheus_client),
+# cada worker grava seus valores em arquivos mmap nesse diretório e /metrics
+# agrega todos. Gauges usam "livesum": soma apenas dos workers vivos, o que
+# só serve para valores instantâneos; totais acumulados são Counters
+# (ver contadores.py).
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+# Os mesmos limites dos histogramas por rota do diagnóstico
+LATENCY_BUCKETS_SECONDS: Tuple[float, ...] = tuple(limite / 1000 for limite in LATENCY_BUCKETS_MS)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Requisições HTTP atendidas",
+    ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS_SECONDS
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requisições HTTP em andamento",
+    ["method"],
+    multiprocess_mode="livesum"
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Tamanho configurado do pool de conexões", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Conexões do pool em uso", multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Conexões abertas além do tamanho do pool", multiprocess_mode="livesum"
+)
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Operações de bcrypt aguardando uma thread livre",
+    multiprocess_mode="livesum"
+)
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "password_hash_in_flight", "Operações de bcrypt em execução", multiprocess_mode="livesum"
+)
+CACHE_HIT_RATIO = Gauge(
+    "cache_hit_ratio", "Taxa de acerto do cache no worker", ["cache"], multiprocess_mode="liveall"
+)
+
+SINGLE_FLIGHT_IN_FLIGHT = Gauge(
+    "single_flight_in_flight",
+    "Consultas em andamento no single-flight",
+    ["group"],
+    multiprocess_mode="livesum"
+)
+
+def observar_requisicao(metodo: str, rota: str, status: int, duracao: float) -> None:
+    HTTP_REQUESTS.labels(metodo, rota, str(status)).inc()
+    HTTP_REQUEST_DURATION.labels(metodo, rota).observe(duracao)
+
+# Intervalo mínimo entre amostragens disparadas pelas requisições
+INTERVALO_AMOSTRAGEM_SECONDS = 1.0
+_ultima_amostragem = 0.0
+
+def atualizar_gauges(forcar: bool = False) -> None:
+    """
+    Amostra o estado do pool do banco, do hasher, dos caches e do
+    single-flight deste worker.
+    Chamado ao fim das requisições (no máximo uma vez por intervalo) e antes
+    de cada coleta, para que os arquivos dos demais workers fiquem recentes.
+    """
+    global _ultima_amostragem
+
+    agora = time.monotonic()
+    if not forcar and agora - _ultima_amostragem < INTERVALO_AMOSTRAGEM_SECONDS:
+        return
+    _ultima_amostragem = agora
+
+    engine = database.engine
+    pool = engine.sync_engine.pool if engine is not None else None
+    if pool is not None and hasattr(pool, "checkedout"):
+        DB_POOL_SIZE.set(pool.size())
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(0, pool.overflow()))
+
+    hasher = get_password_hasher()
+    PASSWORD_HASH_QUEUE_DEPTH.set(hasher.queue_depth)
+    PASSWORD_HASH_IN_FLIGHT.set(hasher.in_flight)
+
+    caches = [("principal", get_principal_cache().stats)]
+    token_cache = get_token_cache()
+    if token_cache is not None:
+        caches.append(("jwt", token_cache.stats()))
+    for nome, stats in caches:
+        CACHE_HIT_RATIO.labels(nome).set(stats["hit_ratio"])
+
+    grupos = [("leituras", get_leituras_single_flight()), ("cache", get_cache_single_flight())]
+    for nome, single_flight in grupos:
+        SINGLE_FLIGHT_IN_FLIGHT.labels(nome).set(single_flight.em_andamento)
+
+def gerar_metricas() -> Tuple[bytes, str]:
+    """Métricas no formato de exposição texto do Prometheus."""
+    atualizar_gauges(forcar=True)
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+def marcar_worker_encerrado(pid: Optional[int] = None) -> None:
+    """Remove os gauges "live" do worker que está saindo."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid or os.getpid())
@@ -0,0 +1,110 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RequestStats:
+    """Tempos (em segundos) e contadores acumulados durante uma requisição."""
+    caminho: str = ""
+    inicio: float = field(default_factory=time.perf_counter)
+    db_time: float = 0.0
+    db_count: int = 0
+    auth_time: float = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.inicio
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+# Limite de consulta lenta (em segundos) de cada engine instrumentado
+_slow_query_seconds: "WeakKeyDictionary[Engine, float]" = WeakKeyDictionary()
+
+def iniciar_coleta(caminho: str = "") -> RequestStats:
+    """
+    Associa um novo RequestStats ao contexto atual. Tarefas criadas a partir
+    daqui herdam a referência e acumulam no mesmo objeto.
+    """
+    stats = RequestStats(caminho=caminho)
+    _request_stats.set(stats)
+    return stats
+
+def coleta_atual() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+@contextmanager
+def medir_auth() -> Iterator[None]:
+    """Soma o tempo do bloco ao tempo de autenticação da requisição atual."""
+    stats = _request_stats.get()
+    if stats is None:
+        yield
+        return
+
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.auth_time += time.perf_counter() - inicio
+
+def instrumentar_engine(engine: AsyncEngine, slow_query_ms: float = 0) -> None:
+    """
+    Registra os eventos de cursor do engine para medir cada comando SQL,
+    acumular no RequestStats da requisição atual e registrar em log os
+    comandos acima de slow_query_ms (0 desativa o log). Chamadas repetidas
+    apenas atualizam o limite.
+    """
+    sync_engine = engine.sync_engine
+    _slow_query_seconds[sync_engine] = slow_query_ms / 1000
+    if event.contains(sync_engine, "before_cursor_execute", _antes_de_executar):
+        return
+
+    event.listen(sync_engine, "before_cursor_execute", _antes_de_executar)
+    event.listen(sync_engine, "after_cursor_execute", _depois_de_executar)
+    event.listen(sync_engine, "handle_error", _ao_falhar)
+
+def _antes_de_executar(conn, cursor, statement, parameters, context, executemany):
+    # No contexto de execução, e não em conn.info: um comando que falha
+    # não deixa nada para trás na conexão devolvida ao pool
+    if context is not None:
+        context._inicio_medicao = time.perf_counter()
+
+def _depois_de_executar(conn, cursor, statement, parameters, context, executemany):
+    _registrar_comando(conn.engine, context, statement)
+
+def _ao_falhar(exception_context):
+    # Comandos que falham (violação de unicidade, timeout) também contam
+    if exception_context.execution_context is not None:
+        _registrar_comando(
+            exception_context.engine, exception_context.execution_context, exception_context.statement
+        )
+
+def _registrar_comando(engine: Engine, context, statement: Optional[str]) -> None:
+    inicio = getattr(context, "_inicio_medicao", None)
+    if inicio is None:
+        return
+    duracao = time.perf_counter() - inicio
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.db_time += duracao
+        stats.db_count += 1
+
+    limite = _slow_query_seconds.get(engine, 0)
+    if limite and duracao >= limite:
+        # Parâmetros ficam de fora do log: podem conter dados pessoais
+        logger.warning(
+            "Consulta lenta (%.1f ms) em %s: %s",
+            duracao * 1000,
+            stats.caminho if stats is not None else "-",
+            " ".join((statement or "").split())[:500]
+        )
@@ -0,0 +1,91 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.infrastructure.instrumentation.request_stats import RequestStats
+
+# Limites superiores dos buckets de latência (em milissegundos)
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+@dataclass
+class RouteHistogram:
+    """Histograma de latência e totais de banco/autenticação de uma rota."""
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    db_ms: float = 0.0
+    db_count: int = 0
+    auth_ms: float = 0.0
+
+    def observe(self, duracao_ms: float, stats: RequestStats) -> None:
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duracao_ms)] += 1
+        self.count += 1
+        self.total_ms += duracao_ms
+        if duracao_ms > self.max_ms:
+            self.max_ms = duracao_ms
+        self.db_ms += stats.db_time * 1000
+        self.db_count += stats.db_count
+        self.auth_ms += stats.auth_time * 1000
+
+    def quantile(self, q: float) -> float:
+        """Estimativa do quantil: limite superior do bucket que o contém."""
+        if not self.count:
+            return 0.0
+        alvo = q * self.count
+        acumulado = 0
+        for limite, quantidade in zip(LATENCY_BUCKETS_MS, self.buckets):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                return float(limite)
+        return self.max_ms
+
+    def snapshot(self) -> Dict:
+        media = (lambda total: round(total / self.count, 3) if self.count else 0.0)
+        return {
+            "count": self.count,
+            "avg_ms": media(self.total_ms),
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "db_avg_ms": media(self.db_ms),
+            "db_statements_avg": media(self.db_count),
+            "auth_avg_ms": media(self.auth_ms),
+            "buckets": {
+                **{f"le_{int(limite)}": quantidade for limite, quantidade in zip(LATENCY_BUCKETS_MS, self.buckets)},
+                "le_inf": self.buckets[-1],
+            },
+        }
+
+class RouteStatsRegistry:
+    """
+    Histogramas agregados por rota (método + template do caminho) no worker
+    atual. Não é thread-safe: é alimentado a partir do event loop.
+    """
+
+    def __init__(self):
+        self._rotas: Dict[Tuple[str, str], RouteHistogram] = {}
+
+    def observe(self, metodo: str, rota: str, duracao_ms: float, stats: RequestStats) -> None:
+        histograma = self._rotas.get((metodo, rota))
+        if histograma is None:
+            histograma = self._rotas[(metodo, rota)] = RouteHistogram()
+        histograma.observe(duracao_ms, stats)
+
+    def get(self, metodo: str, rota: str) -> Optional[RouteHistogram]:
+        return self._rotas.get((metodo, rota))
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return {
+            f"{metodo} {rota}": histograma.snapshot()
+            for (metodo, rota), histograma in sorted(self._rotas.items())
+        }
+
+    def clear(self) -> None:
+        self._rotas.clear()
+
+_route_stats = RouteStatsRegistry()
+
+def get_route_stats() -> RouteStatsRegistry:
+    return _route_stats
@@ -1,9 +1,60 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.config.database import dispose_engine, get_session_factory, init_engine
+from src.config.server import worker_principal
 from src.config.settings import get_settings
+from src.infrastructure.auth.password_hasher import get_password_hasher, shutdown_password_hasher
+from src.infrastructure.cache.cache_backend import close_cache, get_cache
+from src.infrastructure.database.estatisticas_reconciler import (
+    start_estatisticas_reconciler,
+    stop_estatisticas_reconciler
+)
+from src.infrastructure.database.last_login_recorder import (
+    start_last_login_recorder,
+    stop_last_login_recorder
+)
+from src.infrastructure.database.password_rehasher import (
+    start_password_rehasher,
+    stop_password_rehasher
+)
+from src.infrastructure.database.replica_router import dispose_replica_router, init_replica_router
+from src.infrastructure.instrumentation import metrics
+from src.infrastructure.instrumentation.request_stats import instrumentar_engine
 from src.presentation.api.error_handlers import add_exception_handlers
+from src.presentation.api.middleware import RequestInstrumentationMiddleware
+from src.presentation.api.routers.diagnostico_router import router as diagnostico_router
 from src.presentation.api.routers.usuario_router import router as usuario_router
+from src.presentation.api.serialization import OrjsonResponse
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Inicializar o pool de conexões na subida e liberá-lo no desligamento
+    settings = get_settings()
+    engines = [init_engine(settings)]
+    replicas = init_replica_router(settings)
+    if replicas is not None:
+        engines += [replica.engine for replica in replicas.replicas]
+    if settings.INSTRUMENTATION_ENABLED:
+        for engine in engines:
+            instrumentar_engine(engine, settings.SLOW_QUERY_THRESHOLD_MS)
+    start_last_login_recorder(get_session_factory())
+    start_password_rehasher(get_session_factory(), get_password_hasher(), get_cache())
+    # Varre a tabela inteira: um processo por servidor basta
+    if worker_principal():
+        start_estatisticas_reconciler(get_session_factory())
+    yield
+    # Gravar os logins e rehashes pendentes antes de fechar o pool
+    await stop_last_login_recorder()
+    await stop_password_rehasher()
+    await stop_estatisticas_reconciler()
+    await close_cache()
+    await dispose_replica_router()
+    await dispose_engine()
+    shutdown_password_hasher()
+    metrics.marcar_worker_encerrado()
 
 def create_application() -> FastAPI:
     settings = get_settings()
@@ -12,7 +63,9 @@ def create_application() -> FastAPI:
         title="FastAPI DDD Application",
         description="API desenvolvida com FastAPI seguindo os princípios de DDD",
         version="0.1.0",
-        debug=settings.DEBUG
+        debug=settings.DEBUG,
+        default_response_class=OrjsonResponse,
+        lifespan=lifespan
     )
     
     # Configuração CORS
@@ -24,8 +77,21 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Uma medição por requisição alimenta a instrumentação (Server-Timing e
+    # histogramas por rota) e as métricas Prometheus
+    if settings.INSTRUMENTATION_ENABLED or settings.METRICS_ENABLED:
+        app.add_middleware(
+            RequestInstrumentationMiddleware,
+            server_timing=settings.INSTRUMENTATION_ENABLED and settings.INSTRUMENTATION_SERVER_TIMING,
+            histogramas=settings.INSTRUMENTATION_ENABLED,
+            prometheus=settings.METRICS_ENABLED,
+            excluir=(settings.METRICS_PATH,)
+        )
+    
     # Adicionar routers
     app.include_router(usuario_router, prefix="/api/v1")
+    if settings.INSTRUMENTATION_ENABLED:
+        app.include_router(diagnostico_router, prefix="/api/v1")
     
     # Adicionar handlers de exceção
     add_exception_handlers(app)
@@ -34,6 +100,12 @@ def create_application() -> FastAPI:
     async def health_check():
         return {"status": "ok", "message": "API is running"}
     
+    if settings.METRICS_ENABLED:
+        @app.get(settings.METRICS_PATH, include_in_schema=False)
+        async def metrics_endpoint():
+            conteudo, content_type = metrics.gerar_metricas()
+            return Response(content=conteudo, media_type=content_type)
+    
     return app
 
 app = create_application()
\ No newline at end of file
@@ -0,0 +1,97 @@
+import json
+from typing import AsyncIterable, List, Tuple
+
+from pydantic import ValidationError
+
+from src.application.dtos.usuario_dto import UsuarioImportItem, UsuarioImportResult
+from src.domain.exceptions.domain_exceptions import DomainValidationError
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# Tamanho médio máximo de uma linha: limita o corpo (max_linhas vezes este
+# valor) antes de terminar de recebê-lo
+TAMANHO_MAXIMO_LINHA = 4096
+
+def _resumir_erro(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(parte) for parte in erro['loc']) or 'linha'}: {erro['msg']}"
+        for erro in exc.errors()
+    )
+
+def _excede_linhas(max_linhas: int) -> DomainValidationError:
+    return DomainValidationError(f"A importação aceita no máximo {max_linhas} linhas")
+
+async def parse_import_payload(
+    partes: AsyncIterable[bytes],
+    content_type: str,
+    max_linhas: int
+) -> Tuple[List[Tuple[int, UsuarioImportItem]], List[UsuarioImportResult]]:
+    """
+    Interpreta o corpo de uma importação em lote (NDJSON ou array JSON),
+    recebido em partes. Retorna os itens válidos com o número da linha e os
+    resultados das linhas inválidas, que não impedem a importação das demais.
+
+    A leitura é interrompida assim que o limite é ultrapassado: no NDJSON,
+    pelo número de linhas; em ambos os formatos, pelo tamanho do corpo.
+    """
+    registros: List[Tuple[int, object]] = []
+    invalidos: List[UsuarioImportResult] = []
+    max_bytes = max_linhas * TAMANHO_MAXIMO_LINHA
+    recebidos = 0
+    
+    if content_type.split(";")[0].strip() in NDJSON_MEDIA_TYPES:
+        numero = 0
+        pendente = b""
+        
+        def interpretar(linha: bytes) -> None:
+            if not linha.strip():
+                return
+            if len(registros) + len(invalidos) >= max_linhas:
+                raise _excede_linhas(max_linhas)
+            try:
+                registros.append((numero, json.loads(linha)))
+            except ValueError:
+                invalidos.append(UsuarioImportResult(
+                    linha=numero, status="invalido", erro="JSON inválido"
+                ))
+        
+        async for parte in partes:
+            recebidos += len(parte)
+            if recebidos > max_bytes:
+                raise _excede_linhas(max_linhas)
+            *linhas, pendente = (pendente + parte).split(b"\n")
+            for linha in linhas:
+                numero += 1
+                interpretar(linha)
+        numero += 1
+        interpretar(pendente)
+    else:
+        corpo = bytearray()
+        async for parte in partes:
+            corpo += parte
+            if len(corpo) > max_bytes:
+                raise _excede_linhas(max_linhas)
+        try:
+            dados = json.loads(corpo)
+        except ValueError:
+            raise DomainValidationError("Corpo da requisição não é um JSON válido")
+        if not isinstance(dados, list):
+            raise DomainValidationError("O corpo deve ser um array JSON ou NDJSON")
+        if len(dados) > max_linhas:
+            raise _excede_linhas(max_linhas)
+        registros = list(enumerate(dados, start=1))
+    
+    validos: List[Tuple[int, UsuarioImportItem]] = []
+    for numero, registro in registros:
+        try:
+            validos.append((numero, UsuarioImportItem.model_validate(registro)))
+        except ValidationError as e:
+            email = registro.get("email") if isinstance(registro, dict) else None
+            invalidos.append(UsuarioImportResult(
+                linha=numero,
+                email=email if isinstance(email, str) else None,
+                status="invalido",
+                erro=_resumir_erro(e)
+            ))
+    
+    return validos, invalidos
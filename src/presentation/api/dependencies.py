@@ -1,47 +1,131 @@
-from typing import Annotated, Optional
+import time
+from typing import Annotated, Dict, Optional
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.interfaces.unit_of_work_interface import UnitOfWorkInterface
 from src.config.database import get_db
+from src.config.settings import get_settings
 from src.domain.entities.usuario import Usuario, PerfilUsuario
 from src.domain.exceptions.domain_exceptions import AuthenticationError, AuthorizationError
-from src.domain.repositories.usuario_repository_interface import UsuarioRepositoryInterface
 from src.infrastructure.auth.jwt_handler import decode_token
-from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+from src.infrastructure.cache.cache_backend import get_cache
+from src.infrastructure.cache.principal_cache import PrincipalCache, get_principal_cache
+from src.infrastructure.database.replica_router import get_replica_router
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.instrumentation.request_stats import medir_auth
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
-async def get_usuario_repository(db: AsyncSession = Depends(get_db)) -> UsuarioRepositoryInterface:
-    return UsuarioRepository(db)
+async def get_unit_of_work(db: AsyncSession = Depends(get_db)) -> UnitOfWorkInterface:
+    return SqlAlchemyUnitOfWork(
+        db,
+        replicas=get_replica_router(),
+        cache=get_cache(),
+        coalescer_leituras=get_settings().READ_COALESCING_ENABLED
+    )
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    usuario_repository: UsuarioRepositoryInterface = Depends(get_usuario_repository)
-) -> Usuario:
+async def get_token_payload(token: Annotated[str, Depends(oauth2_scheme)]) -> Dict:
     credentials_exception = AuthenticationError("Credenciais inválidas")
     
-    payload = decode_token(token)
-    if payload is None:
-        raise credentials_exception
+    with medir_auth():
+        payload = decode_token(token)
+        if payload is None:
+            raise credentials_exception
+        
+        try:
+            usuario_id = UUID(payload["sub"])
+        except (KeyError, TypeError, ValueError):
+            raise credentials_exception
     
-    usuario_id = payload.get("sub")
-    if usuario_id is None:
-        raise credentials_exception
+    return {**payload, "sub": usuario_id}
+
+def _principal_cache_local() -> Optional[PrincipalCache]:
+    """
+    Cache de principais do worker, usado apenas sem backend compartilhado.
+    Com CACHE_BACKEND configurado, o usuário é lido pelo repositório com
+    cache, cuja versão compartilhada enxerga desativações e remoções feitas
+    em qualquer worker (e, com elas, recusa os tokens do usuário).
+    """
+    if get_cache() is not None:
+        return None
+    return get_principal_cache()
+
+async def _carregar_usuario(
+    usuario_id: UUID,
+    uow: UnitOfWorkInterface
+) -> Usuario:
+    principal_cache = _principal_cache_local()
     
-    usuario = await usuario_repository.obter_por_id(usuario_id)
+    usuario = principal_cache.get(usuario_id) if principal_cache is not None else None
     if usuario is None:
-        raise credentials_exception
+        async with uow.somente_leitura():
+            usuario = await uow.usuarios.obter_por_id(usuario_id)
+        if usuario is None:
+            raise AuthenticationError("Credenciais inválidas")
+        if usuario.ativo and principal_cache is not None:
+            # Só principais ativos vão para o cache
+            principal_cache.set(usuario)
     
     if not usuario.ativo:
         raise AuthenticationError("Usuário desativado")
     
     return usuario
 
+def _claims_confiaveis(payload: Dict) -> bool:
+    """
+    Indica se as claims do token ainda estão dentro da janela em que o
+    perfil assinado pode ser usado sem consultar o usuário.
+    
+    Nessa janela a desativação do usuário não é vista: por isso ela nunca
+    passa do TTL do cache de principais, o atraso que um principal em cache
+    já admite em outro worker.
+    """
+    settings = get_settings()
+    janela = min(settings.AUTH_TRUST_TOKEN_CLAIMS_SECONDS, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+    emitido_em = payload.get("iat")
+    if janela <= 0 or emitido_em is None:
+        return False
+    return time.time() - emitido_em <= janela
+
+async def get_current_user(
+    payload: Annotated[Dict, Depends(get_token_payload)],
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
+) -> Usuario:
+    with medir_auth():
+        return await _carregar_usuario(payload["sub"], uow)
+
 async def get_current_admin_user(
-    current_user: Annotated[Usuario, Depends(get_current_user)]
+    payload: Annotated[Dict, Depends(get_token_payload)],
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
 ) -> Usuario:
-    if current_user.perfil != PerfilUsuario.ADMIN:
-        raise AuthorizationError("Acesso apenas para administradores")
-    return current_user
\ No newline at end of file
+    with medir_auth():
+        if _claims_confiaveis(payload):
+            # Token recente: o perfil assinado é suficiente para autorizar
+            if payload.get("perfil") != PerfilUsuario.ADMIN:
+                raise AuthorizationError("Acesso apenas para administradores")
+            
+            principal_cache = _principal_cache_local()
+            usuario = principal_cache.get(payload["sub"]) if principal_cache is not None else None
+            if usuario is not None:
+                if not usuario.ativo:
+                    raise AuthenticationError("Usuário desativado")
+                return usuario
+            
+            # Principal parcial montado a partir das claims (sem consulta ao
+            # banco); a situação do usuário não é conferida (ver _claims_confiaveis)
+            return Usuario(
+                id=payload["sub"],
+                email=payload["email"],
+                senha_hash="",
+                nome=payload.get("nome") or payload["email"],
+                perfil=PerfilUsuario.ADMIN
+            )
+        
+        current_user = await _carregar_usuario(payload["sub"], uow)
+        if current_user.perfil != PerfilUsuario.ADMIN:
+            raise AuthorizationError("Acesso apenas para administradores")
+        return current_user
\ No newline at end of file
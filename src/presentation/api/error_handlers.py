@@ -6,7 +6,8 @@ from src.domain.exceptions.domain_exceptions import (
     DomainValidationError,
     EntityNotFoundError,
     AuthenticationError,
-    AuthorizationError
+    AuthorizationError,
+    TooManyRequestsError
 )
 
 def add_exception_handlers(app: FastAPI):
@@ -38,6 +39,14 @@ def add_exception_handlers(app: FastAPI):
             content={"detail": str(exc)}
         )
     
+    @app.exception_handler(TooManyRequestsError)
+    async def too_many_requests_exception_handler(request: Request, exc: TooManyRequestsError):
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)}
+        )
+    
     @app.exception_handler(DomainException)
     async def domain_exception_handler(request: Request, exc: DomainException):
         return JSONResponse(
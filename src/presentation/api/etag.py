@@ -0,0 +1,66 @@
+import hashlib
+from datetime import datetime
+from typing import Mapping, Optional
+from uuid import UUID
+
+from fastapi import Request, Response, status
+
+# Respostas por usuário: o navegador guarda, mas revalida a cada uso
+CACHE_CONTROL = "private, no-cache"
+
+def etag_usuario(
+    usuario_id: UUID,
+    data_atualizacao: datetime,
+    ultimo_login: Optional[datetime] = None
+) -> str:
+    """
+    ETag forte de um usuário, derivado da versão do registro. O ultimo_login
+    entra porque faz parte da resposta e é gravado sem alterar
+    data_atualizacao.
+    """
+    versao = f"{usuario_id}|{data_atualizacao.isoformat()}|{ultimo_login.isoformat() if ultimo_login else ''}"
+    return '"%s"' % hashlib.blake2b(versao.encode(), digest_size=16).hexdigest()
+
+def etag_fraco(conteudo: bytes) -> str:
+    """ETag fraco sobre o corpo já serializado (páginas de listagem)."""
+    return 'W/"%s"' % hashlib.blake2b(conteudo, digest_size=16).hexdigest()
+
+def corresponde(request: Request, etag: str) -> bool:
+    """
+    Avalia o If-None-Match da requisição contra o ETag atual, com a
+    comparação fraca exigida pela RFC 9110 (o prefixo W/ é ignorado).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaco = etag.removeprefix("W/")
+    return any(
+        candidato.strip().removeprefix("W/") == opaco
+        for candidato in if_none_match.split(",")
+    )
+
+def nao_modificado(etag: str) -> Response:
+    """304 sem corpo: o cliente reaproveita a representação que já tem."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+def json_condicional(
+    request: Request,
+    conteudo: bytes,
+    headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """Resposta JSON com ETag fraco sobre o corpo, ou 304 se o cliente já o tem."""
+    etag = etag_fraco(conteudo)
+    if corresponde(request, etag):
+        resposta = nao_modificado(etag)
+        resposta.headers.update(headers or {})
+        return resposta
+    return Response(
+        content=conteudo,
+        media_type="application/json",
+        headers={**(headers or {}), "ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
@@ -0,0 +1,91 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.instrumentation import metrics
+from src.infrastructure.instrumentation.request_stats import iniciar_coleta
+from src.infrastructure.instrumentation.route_stats import get_route_stats
+
+class RequestInstrumentationMiddleware:
+    """
+    Middleware ASGI que mede cada requisição uma única vez (tempo total,
+    tempo e número de comandos SQL, tempo de autenticação) e, a partir
+    dessa medição, adiciona o header Server-Timing à resposta e alimenta os
+    histogramas por rota do diagnóstico e as métricas Prometheus (contador
+    e histograma por rota, requisições em andamento e, ao fim de cada
+    requisição, os gauges do pool, do hasher e dos caches).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = True,
+        histogramas: bool = True,
+        prometheus: bool = False,
+        excluir: tuple = ()
+    ):
+        self.app = app
+        self.server_timing = server_timing
+        self.histogramas = histogramas
+        self.prometheus = prometheus
+        # Caminhos fora das métricas Prometheus (ex.: o próprio /metrics)
+        self.excluir = frozenset(excluir)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = iniciar_coleta(scope["path"])
+        status = 500
+        em_andamento = None
+        if self.prometheus and scope["path"] not in self.excluir:
+            em_andamento = metrics.HTTP_REQUESTS_IN_PROGRESS.labels(scope["method"])
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    # Corpos em streaming: o header cobre o trabalho feito até aqui
+                    valor = (
+                        f'db;dur={stats.db_time * 1000:.2f}, '
+                        f'db-statements;desc="{stats.db_count}", '
+                        f'auth;dur={stats.auth_time * 1000:.2f}, '
+                        f'total;dur={stats.elapsed * 1000:.2f}'
+                    )
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", valor.encode("latin-1"))]
+            await send(message)
+
+        if em_andamento is not None:
+            em_andamento.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duracao = stats.elapsed
+            rota = template_da_rota(scope)
+            if self.histogramas:
+                get_route_stats().observe(scope["method"], rota, duracao * 1000, stats)
+            if em_andamento is not None:
+                em_andamento.dec()
+                metrics.observar_requisicao(scope["method"], rota, status, duracao)
+                metrics.atualizar_gauges()
+
+def template_da_rota(scope: Scope) -> str:
+    """
+    Caminho da rota atendida com os parâmetros no lugar dos valores
+    (ex.: /api/v1/admin/usuarios/{usuario_id}), para manter a cardinalidade
+    das métricas limitada. Requisições sem rota correspondente são agrupadas.
+    """
+    rota = scope.get("route")
+    # path_format é o template sem os conversores ({caminho:path} -> {caminho})
+    path_format = getattr(rota, "path_format", None)
+    if path_format is None:
+        return "<sem rota>"
+
+    # Routers incluídos sem copiar as rotas (versões recentes do FastAPI)
+    # deixam aqui a rota original, relativa ao router: o prefixo é a parte
+    # do caminho que ela não cobre
+    caminho = scope["path"]
+    inicio = 0
+    while inicio != -1 and not rota.path_regex.match(caminho[inicio:]):
+        inicio = caminho.find("/", inicio + 1)
+    return caminho[:max(inicio, 0)] + path_format
@@ -0,0 +1,23 @@
+from typing import Dict
+
+from fastapi import APIRouter, Depends
+
+from src.domain.entities.usuario import Usuario
+from src.infrastructure.instrumentation.route_stats import get_route_stats
+from src.presentation.api.dependencies import get_current_admin_user
+
+router = APIRouter(tags=["Diagnóstico"])
+
+# Endpoint com os histogramas agregados por rota (apenas admin)
+@router.get(
+    "/admin/diagnostico/rotas",
+    summary="Latência, tempo de banco e comandos SQL por rota"
+)
+async def estatisticas_rotas(
+    _: Usuario = Depends(get_current_admin_user)
+) -> Dict[str, Dict]:
+    """
+    Retorna, para cada rota atendida por este worker, o histograma de
+    latência e as médias de tempo de banco, comandos SQL e autenticação.
+    """
+    return get_route_stats().snapshot()
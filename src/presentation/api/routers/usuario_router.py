@@ -1,26 +1,49 @@
-from typing import Annotated, List
+from datetime import datetime
+from typing import Annotated, List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from src.application.dtos.usuario_dto import (
     UsuarioCreate,
     UsuarioResponse,
     UsuarioUpdate,
+    UsuarioBatchGetRequest,
+    UsuarioBatchGetResponse,
+    UsuarioEstatisticas,
+    UsuarioImportResponse,
     LoginRequest,
     TokenResponse
 )
+from src.application.interfaces.unit_of_work_interface import UnitOfWorkInterface
 from src.application.use_cases.usuario_use_cases import UsuarioUseCases
-from src.domain.entities.usuario import Usuario
-from src.domain.repositories.usuario_repository_interface import UsuarioRepositoryInterface
+from src.config.settings import get_settings
+from src.domain.entities.usuario import PerfilUsuario, Usuario
+from src.domain.repositories.filtro_usuarios import FiltroUsuarios, ModoBusca
 from src.presentation.api.dependencies import (
-    get_usuario_repository,
+    get_unit_of_work,
     get_current_user,
     get_current_admin_user
 )
+from src.presentation.api.bulk import parse_import_payload
+from src.presentation.api.etag import CACHE_CONTROL, corresponde, etag_usuario, json_condicional, nao_modificado
+from src.presentation.api.serialization import json_bytes
+from src.presentation.api.streaming import csv_stream, ndjson_stream
 
 router = APIRouter(tags=["Usuários"])
 
+CAMPOS_EXPORTACAO = [
+    "id",
+    "email",
+    "nome",
+    "perfil",
+    "ativo",
+    "data_criacao",
+    "data_atualizacao",
+    "ultimo_login",
+]
+
 # Endpoint de criação de usuário (público)
 @router.post(
     "/usuarios",
@@ -30,12 +53,12 @@ router = APIRouter(tags=["Usuários"])
 )
 async def criar_usuario(
     usuario_create: UsuarioCreate,
-    usuario_repository: UsuarioRepositoryInterface = Depends(get_usuario_repository)
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
 ):
     """
     Cria um novo usuário no sistema.
     """
-    use_case = UsuarioUseCases(usuario_repository)
+    use_case = UsuarioUseCases(uow)
     return await use_case.criar_usuario(usuario_create)
 
 # Endpoint de autenticação (login)
@@ -46,13 +69,18 @@ async def criar_usuario(
 )
 async def login(
     login_request: LoginRequest,
-    usuario_repository: UsuarioRepositoryInterface = Depends(get_usuario_repository)
+    request: Request,
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
 ):
     """
     Autentica um usuário e retorna um token de acesso.
+    
+    Tentativas acima do limite por IP ou por email recebem 429 com
+    Retry-After.
     """
-    use_case = UsuarioUseCases(usuario_repository)
-    return await use_case.autenticar_usuario(login_request.email, login_request.senha)
+    use_case = UsuarioUseCases(uow)
+    ip = request.client.host if request.client else None
+    return await use_case.autenticar_usuario(login_request.email, login_request.senha, ip)
 
 # Endpoint para obter dados do usuário autenticado
 @router.get(
@@ -61,12 +89,23 @@ async def login(
     summary="Obter usuário atual"
 )
 async def obter_usuario_atual(
+    request: Request,
+    response: Response,
     current_user: Annotated[Usuario, Depends(get_current_user)]
 ):
     """
     Retorna os dados do usuário autenticado.
+    
+    A resposta traz um ETag; com If-None-Match igual ao ETag atual, a
+    resposta é 304 sem corpo.
     """
-    return UsuarioResponse(
+    etag = etag_usuario(current_user.id, current_user.data_atualizacao, current_user.ultimo_login)
+    if corresponde(request, etag):
+        return nao_modificado(etag)
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return UsuarioResponse.model_construct(
         id=current_user.id,
         email=current_user.email,
         nome=current_user.nome,
@@ -86,7 +125,7 @@ async def obter_usuario_atual(
 async def atualizar_usuario_atual(
     usuario_update: UsuarioUpdate,
     current_user: Annotated[Usuario, Depends(get_current_user)],
-    usuario_repository: UsuarioRepositoryInterface = Depends(get_usuario_repository)
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
 ):
     """
     Atualiza os dados do usuário autenticado.
@@ -95,7 +134,7 @@ async def atualizar_usuario_atual(
     if usuario_update.perfil is not None and usuario_update.perfil != current_user.perfil:
         usuario_update.perfil = current_user.perfil
     
-    use_case = UsuarioUseCases(usuario_repository)
+    use_case = UsuarioUseCases(uow)
     return await use_case.atualizar_usuario(current_user.id, usuario_update)
 
 # -- Rotas de administração (apenas para admins) --
@@ -107,16 +146,196 @@ async def atualizar_usuario_atual(
     summary="Listar todos os usuários (admin)"
 )
 async def listar_usuarios(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
     _: Annotated[Usuario, Depends(get_current_admin_user)], # Usuário admin autenticado
-    usuario_repository: UsuarioRepositoryInterface = Depends(get_usuario_repository)
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
 ):
     """
     Lista todos os usuários (requer privilégios de administrador).
+    
+    Os usuários são ordenados por data de criação. Quando houver mais
+    resultados, o header X-Next-Cursor traz o cursor da próxima página,
+    que deve ser enviado no parâmetro `cursor` (nesse caso `skip` é ignorado).
+    
+    Cada página traz um ETag fraco; com If-None-Match igual a ele, a
+    resposta é 304 sem corpo.
+    """
+    use_case = UsuarioUseCases(uow)
+    linhas, proximo_cursor = await use_case.listar_usuarios_linhas(skip, limit, cursor)
+    
+    # Linhas do banco codificadas direto em bytes, sem passar por
+    # entidades, DTOs e pela validação do response_model
+    headers = {"X-Next-Cursor": proximo_cursor} if proximo_cursor else None
+    return json_condicional(request, json_bytes(linhas), headers)
+
+# Endpoint para importar usuários em lote
+@router.post(
+    "/admin/usuarios/bulk",
+    response_model=UsuarioImportResponse,
+    summary="Importar usuários em lote (admin)"
+)
+async def importar_usuarios(
+    request: Request,
+    _: Annotated[Usuario, Depends(get_current_admin_user)], # Usuário admin autenticado
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
+):
+    """
+    Importa usuários a partir de um array JSON ou de NDJSON
+    (Content-Type: application/x-ndjson). Cada linha aceita `senha` ou um
+    `senha_hash` já existente de um algoritmo suportado (bcrypt ou
+    argon2id). Retorna o resultado de cada linha (requer privilégios de
+    administrador).
+    """
+    settings = get_settings()
+    # Lido em partes: um corpo acima do limite é recusado sem ser recebido inteiro
+    validos, invalidos = await parse_import_payload(
+        request.stream(),
+        request.headers.get("content-type", ""),
+        settings.BULK_IMPORT_MAX_ROWS
+    )
+    
+    use_case = UsuarioUseCases(uow)
+    resultados = await use_case.importar_usuarios(validos, settings.BULK_IMPORT_BATCH_SIZE)
+    resultados = sorted(resultados + invalidos, key=lambda resultado: resultado.linha)
+    
+    criados = sum(1 for resultado in resultados if resultado.status == "criado")
+    return UsuarioImportResponse(
+        total=len(resultados),
+        criados=criados,
+        falhas=len(resultados) - criados,
+        resultados=resultados
+    )
+
+# Endpoint para exportar todos os usuários em streaming
+@router.get(
+    "/admin/usuarios/export",
+    response_class=StreamingResponse,
+    summary="Exportar usuários em NDJSON ou CSV (admin)"
+)
+async def exportar_usuarios(
+    _: Annotated[Usuario, Depends(get_current_admin_user)], # Usuário admin autenticado
+    formato: Literal["ndjson", "csv"] = "ndjson",
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
+):
+    """
+    Exporta todos os usuários em streaming, lendo do banco em lotes
+    (requer privilégios de administrador). O uso de memória não depende
+    do número de usuários.
+    """
+    use_case = UsuarioUseCases(uow)
+    linhas = use_case.exportar_usuarios()
+    
+    if formato == "csv":
+        return StreamingResponse(
+            csv_stream(linhas, CAMPOS_EXPORTACAO),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="usuarios.csv"'}
+        )
+    
+    return StreamingResponse(
+        ndjson_stream(linhas),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="usuarios.ndjson"'}
+    )
+
+# Endpoint de busca de usuários (declarado antes de /admin/usuarios/{usuario_id})
+@router.get(
+    "/admin/usuarios/search",
+    response_model=List[UsuarioResponse],
+    summary="Buscar usuários por nome/email e filtros (admin)"
+)
+async def buscar_usuarios(
+    request: Request,
+    _: Annotated[Usuario, Depends(get_current_admin_user)], # Usuário admin autenticado
+    q: Optional[str] = Query(None, max_length=100, description="Termo procurado em nome e email"),
+    modo: ModoBusca = ModoBusca.PREFIXO,
+    perfil: Optional[PerfilUsuario] = None,
+    ativo: Optional[bool] = None,
+    criado_de: Optional[datetime] = None,
+    criado_ate: Optional[datetime] = None,
+    ultimo_login_de: Optional[datetime] = None,
+    ultimo_login_ate: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
+):
+    """
+    Busca usuários (requer privilégios de administrador). O termo `q` é
+    procurado em nome e email, sem diferenciar maiúsculas, pelo início
+    (`modo=prefixo`) ou em qualquer posição (`modo=substring`, mínimo de
+    3 caracteres). Os filtros são combinados entre si.
+    
+    A ordenação, a paginação e o ETag são os da listagem: o header
+    X-Next-Cursor traz o cursor da próxima página.
     """
-    use_case = UsuarioUseCases(usuario_repository)
-    return await use_case.listar_usuarios(skip, limit)
+    filtro = FiltroUsuarios(
+        termo=q,
+        modo=modo,
+        perfil=perfil,
+        ativo=ativo,
+        criado_de=criado_de,
+        criado_ate=criado_ate,
+        ultimo_login_de=ultimo_login_de,
+        ultimo_login_ate=ultimo_login_ate
+    )
+    use_case = UsuarioUseCases(uow)
+    linhas, proximo_cursor = await use_case.buscar_usuarios_linhas(filtro, limit, cursor)
+    
+    headers = {"X-Next-Cursor": proximo_cursor} if proximo_cursor else None
+    return json_condicional(request, json_bytes(linhas), headers)
+
+# Endpoint de estatísticas dos usuários
+@router.get(
+    "/admin/usuarios/stats",
+    response_model=UsuarioEstatisticas,
+    summary="Estatísticas dos usuários (admin)"
+)
+async def obter_estatisticas(
+    _: Annotated[Usuario, Depends(get_current_admin_user)], # Usuário admin autenticado
+    dias: int = Query(30, ge=1, le=366, description="Período dos cadastros por dia"),
+    ativos_dias: List[int] = Query([1, 7, 30], description="Janelas, em dias, de usuários com login"),
+    total: Literal["contadores", "estimado"] = "contadores",
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
+):
+    """
+    Totais de usuários por perfil e situação, cadastros por dia e usuários
+    com login nas últimas janelas de dias (requer privilégios de administrador).
+    
+    Os totais e os cadastros vêm de contadores mantidos a cada escrita e
+    reconciliados periodicamente com a tabela, sem COUNT(*). Com
+    `total=estimado`, o total vem da estimativa do banco (PostgreSQL) e
+    `total_estimado` indica se ela foi usada.
+    """
+    use_case = UsuarioUseCases(uow)
+    return await use_case.obter_estatisticas(dias, ativos_dias, total == "estimado")
+
+# Endpoint para obter vários usuários em uma chamada
+@router.post(
+    "/admin/usuarios/batch-get",
+    response_model=UsuarioBatchGetResponse,
+    summary="Obter vários usuários pelos IDs (admin)"
+)
+async def obter_usuarios_por_ids(
+    batch_get: UsuarioBatchGetRequest,
+    _: Annotated[Usuario, Depends(get_current_admin_user)], # Usuário admin autenticado
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
+):
+    """
+    Retorna os usuários com os IDs informados (até 5000 por chamada) em
+    uma única consulta ao banco no PostgreSQL; nos demais bancos, em
+    blocos de 500 IDs (requer privilégios de administrador).
+    
+    Os itens seguem a ordem dos IDs, sem repetições; os IDs que não
+    existem são listados em `nao_encontrados`.
+    """
+    use_case = UsuarioUseCases(uow)
+    resposta = await use_case.obter_usuarios_por_ids(batch_get.ids)
+    
+    # DTOs montados sem validação: codifica direto, sem o response_model
+    return Response(content=json_bytes(resposta.model_dump()), media_type="application/json")
 
 # Endpoint para obter dados de um usuário específico
 @router.get(
@@ -126,14 +345,28 @@ async def listar_usuarios(
 )
 async def obter_usuario(
     usuario_id: UUID,
+    request: Request,
+    response: Response,
     _: Annotated[Usuario, Depends(get_current_admin_user)], # Usuário admin autenticado
-    usuario_repository: UsuarioRepositoryInterface = Depends(get_usuario_repository)
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
 ):
     """
     Retorna os dados de um usuário específico (requer privilégios de administrador).
+    
+    A resposta traz um ETag; com If-None-Match, a versão atual é consultada
+    sem carregar o registro e, se o ETag ainda for o mesmo, a resposta é
+    304 sem corpo.
     """
-    use_case = UsuarioUseCases(usuario_repository)
-    return await use_case.obter_usuario(usuario_id)
+    use_case = UsuarioUseCases(uow)
+    if request.headers.get("if-none-match"):
+        etag = etag_usuario(usuario_id, *await use_case.obter_versao_usuario(usuario_id))
+        if corresponde(request, etag):
+            return nao_modificado(etag)
+    
+    usuario = await use_case.obter_usuario(usuario_id)
+    response.headers["ETag"] = etag_usuario(usuario.id, usuario.data_atualizacao, usuario.ultimo_login)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return usuario
 
 # Endpoint para atualizar dados de um usuário específico
 @router.put(
@@ -145,12 +378,12 @@ async def atualizar_usuario(
     usuario_id: UUID,
     usuario_update: UsuarioUpdate,
     _: Annotated[Usuario, Depends(get_current_admin_user)], # Usuário admin autenticado
-    usuario_repository: UsuarioRepositoryInterface = Depends(get_usuario_repository)
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
 ):
     """
     Atualiza os dados de um usuário específico (requer privilégios de administrador).
     """
-    use_case = UsuarioUseCases(usuario_repository)
+    use_case = UsuarioUseCases(uow)
     return await use_case.atualizar_usuario(usuario_id, usuario_update)
 
 # Endpoint para remover um usuário
@@ -162,11 +395,11 @@ async def atualizar_usuario(
 async def remover_usuario(
     usuario_id: UUID,
     _: Annotated[Usuario, Depends(get_current_admin_user)], # Usuário admin autenticado
-    usuario_repository: UsuarioRepositoryInterface = Depends(get_usuario_repository)
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work)
 ):
     """
     Remove um usuário (requer privilégios de administrador).
     """
-    use_case = UsuarioUseCases(usuario_repository)
+    use_case = UsuarioUseCases(uow)
     await use_case.remover_usuario(usuario_id)
     return None
\ No newline at end of file
@@ -0,0 +1,21 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+def json_bytes(content: Any) -> bytes:
+    """
+    Serializa direto para bytes com orjson, que trata nativamente datetime,
+    UUID, Enum e dataclasses.
+    """
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+class OrjsonResponse(JSONResponse):
+    """
+    Classe de resposta padrão da aplicação. Rotas com response_model
+    continuam usando a serialização do Pydantic; as demais (e os handlers
+    que devolvem dicts) passam a ser renderizadas pelo orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_bytes(content)
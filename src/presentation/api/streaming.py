@@ -0,0 +1,55 @@
+import csv
+import io
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Mapping, Sequence
+
+from src.presentation.api.serialization import json_bytes
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+async def ndjson_stream(
+    rows: AsyncIterator[Mapping[str, Any]],
+    chunk_size: int = 1000
+) -> AsyncIterator[bytes]:
+    """
+    Serializa as linhas como NDJSON, agrupando `chunk_size` linhas por chunk
+    para reduzir o número de escritas no socket.
+    """
+    buffer = []
+    async for row in rows:
+        buffer.append(json_bytes(dict(row)))
+        if len(buffer) >= chunk_size:
+            yield b"\n".join(buffer) + b"\n"
+            buffer.clear()
+    if buffer:
+        yield b"\n".join(buffer) + b"\n"
+
+async def csv_stream(
+    rows: AsyncIterator[Mapping[str, Any]],
+    fieldnames: Sequence[str],
+    chunk_size: int = 1000
+) -> AsyncIterator[bytes]:
+    """
+    Serializa as linhas como CSV (com cabeçalho), em chunks de `chunk_size` linhas.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(fieldnames)
+    pendentes = 0
+    async for row in rows:
+        writer.writerow([_csv_value(row[campo]) for campo in fieldnames])
+        pendentes += 1
+        if pendentes >= chunk_size:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate()
+            pendentes = 0
+    yield output.getvalue().encode("utf-8")
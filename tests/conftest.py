@@ -1,18 +1,23 @@
 import asyncio
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from src.config.database import Base, get_db
 from src.domain.entities.usuario import Usuario, PerfilUsuario
+from src.infrastructure.auth.password_hasher import PasswordHasher
+from src.infrastructure.auth.rate_limiter import InMemoryRateLimiter, LoginRateLimiter
+from src.infrastructure.cache.principal_cache import get_principal_cache
 from src.infrastructure.database.models.usuario_model import UsuarioModel
+from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
 from src.main import app
 
 # SQLite em memória para testes
@@ -38,4 +43,112 @@ async def setup_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    yield engine
\ No newline at end of file
+    yield engine
+
+@pytest_asyncio.fixture
+async def db_engine():
+    """Motor SQLite em memória compartilhado por todas as sessões de um teste."""
+    engine = create_async_engine(
+        TEST_SQLALCHEMY_DATABASE_URL,
+        poolclass=StaticPool,
+    )
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    yield engine
+    
+    await engine.dispose()
+
+@pytest_asyncio.fixture
+async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+@pytest.fixture
+def comandos_sql(db_engine):
+    """Lista dos comandos SQL executados no motor de testes."""
+    comandos = []
+    
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        comandos.append(statement)
+    
+    event.listen(db_engine.sync_engine, "before_cursor_execute", registrar)
+    yield comandos
+    event.remove(db_engine.sync_engine, "before_cursor_execute", registrar)
+
+@pytest.fixture
+def criar_usuarios(db_session):
+    """
+    Insere usuários direto pelo repositório, em um commit, e retorna as
+    entidades: as informadas e mais `quantidade` usuários genéricos.
+    """
+    async def _criar_usuarios(*usuarios: Usuario, quantidade: int = 0) -> List[Usuario]:
+        usuarios = list(usuarios) + [
+            Usuario(email=f"usuario{i}@exemplo.com", senha_hash="hash", nome=f"Usuário {i}")
+            for i in range(quantidade)
+        ]
+        await UsuarioRepository(db_session).criar_em_lote(usuarios)
+        await db_session.commit()
+        return usuarios
+    
+    return _criar_usuarios
+
+@pytest.fixture
+def password_hasher(monkeypatch):
+    """Hasher com custo mínimo para manter os testes rápidos."""
+    hasher = PasswordHasher(rounds=4, max_workers=2)
+    monkeypatch.setattr(
+        "src.infrastructure.auth.password_hasher._password_hasher", hasher
+    )
+    yield hasher
+    hasher.shutdown()
+
+@pytest.fixture
+def login_rate_limiter(monkeypatch):
+    """Limitador de login novo a cada teste (o do worker acumula tentativas)."""
+    limitador = LoginRateLimiter(InMemoryRateLimiter())
+    monkeypatch.setattr(
+        "src.infrastructure.auth.rate_limiter._login_rate_limiter", limitador
+    )
+    return limitador
+
+@pytest_asyncio.fixture
+async def client(db_engine, password_hasher, login_rate_limiter) -> AsyncGenerator[AsyncClient, None]:
+    """Cliente HTTP para a aplicação usando o banco de testes."""
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+    
+    app.dependency_overrides[get_db] = override_get_db
+    get_principal_cache().clear()
+    
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+    
+    app.dependency_overrides.clear()
+    get_principal_cache().clear()
+
+@pytest.fixture
+def autenticar(client):
+    """Cria um usuário via API e retorna os headers de autorização."""
+    async def _autenticar(
+        email: str = "admin@exemplo.com",
+        perfil: PerfilUsuario = PerfilUsuario.ADMIN
+    ) -> dict:
+        await client.post("/api/v1/usuarios", json={
+            "email": email,
+            "nome": "Usuário Teste",
+            "senha": "senha_secreta",
+            "perfil": perfil.value
+        })
+        response = await client.post("/api/v1/auth/login", json={
+            "email": email,
+            "senha": "senha_secreta"
+        })
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    
+    return _autenticar
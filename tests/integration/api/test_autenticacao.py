@@ -0,0 +1,167 @@
+import pytest
+
+from src.config.settings import get_settings
+from src.domain.entities.usuario import PerfilUsuario
+from src.domain.exceptions.domain_exceptions import AuthenticationError
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.cache.principal_cache import get_principal_cache
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from src.presentation.api.dependencies import _carregar_usuario
+
+@pytest.mark.asyncio
+async def test_usuario_autenticado_e_servido_pelo_cache(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    cache = get_principal_cache()
+    
+    # Act
+    primeira = await client.get("/api/v1/usuarios/me", headers=headers)
+    segunda = await client.get("/api/v1/usuarios/me", headers=headers)
+    
+    # Assert
+    assert primeira.status_code == 200
+    assert segunda.json() == primeira.json()
+    assert cache.stats["hits"] >= 1
+
+@pytest.mark.asyncio
+async def test_atualizacao_invalida_cache_do_usuario(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    await client.get("/api/v1/usuarios/me", headers=headers)
+    
+    # Act
+    await client.put("/api/v1/usuarios/me", headers=headers, json={"nome": "Novo Nome"})
+    response = await client.get("/api/v1/usuarios/me", headers=headers)
+    
+    # Assert
+    assert response.json()["nome"] == "Novo Nome"
+
+@pytest.mark.asyncio
+async def test_usuario_desativado_perde_acesso(client, autenticar):
+    # Arrange
+    headers_admin = await autenticar()
+    headers_usuario = await autenticar("usuario@exemplo.com", PerfilUsuario.USUARIO)
+    usuario = (await client.get("/api/v1/usuarios/me", headers=headers_usuario)).json()
+    
+    # Act
+    await client.put(
+        f"/api/v1/admin/usuarios/{usuario['id']}",
+        headers=headers_admin,
+        json={"ativo": False}
+    )
+    response = await client.get("/api/v1/usuarios/me", headers=headers_usuario)
+    
+    # Assert
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_desativacao_em_outro_worker_com_cache_compartilhado(db_session, criar_usuarios, monkeypatch):
+    # Arrange: cada unidade de trabalho tem o próprio repositório, como workers distintos
+    cache = InMemoryCache()
+    monkeypatch.setattr("src.presentation.api.dependencies.get_cache", lambda: cache)
+    (usuario,) = await criar_usuarios(quantidade=1)
+    await _carregar_usuario(usuario.id, SqlAlchemyUnitOfWork(db_session, cache=cache))
+    outro_worker = SqlAlchemyUnitOfWork(db_session, cache=cache)
+    
+    # Act
+    async with outro_worker:
+        await outro_worker.usuarios.atualizar_campos(usuario.id, {"ativo": False})
+        await outro_worker.commit()
+    
+    # Assert
+    with pytest.raises(AuthenticationError, match="desativado"):
+        await _carregar_usuario(usuario.id, SqlAlchemyUnitOfWork(db_session, cache=cache))
+
+@pytest.mark.asyncio
+async def test_confia_no_perfil_do_token_dentro_da_janela(client, autenticar, monkeypatch):
+    # Arrange
+    settings = get_settings().model_copy(update={"AUTH_TRUST_TOKEN_CLAIMS_SECONDS": 60})
+    monkeypatch.setattr("src.presentation.api.dependencies.get_settings", lambda: settings)
+    headers_usuario = await autenticar("usuario@exemplo.com", PerfilUsuario.USUARIO)
+    
+    # Act
+    response = await client.get("/api/v1/admin/usuarios", headers=headers_usuario)
+    
+    # Assert
+    assert response.status_code == 403
+
+@pytest.mark.asyncio
+async def test_janela_das_claims_nao_passa_do_ttl_do_cache_de_principais(client, autenticar, monkeypatch):
+    # Arrange
+    settings = get_settings().model_copy(update={
+        "AUTH_TRUST_TOKEN_CLAIMS_SECONDS": 60,
+        "PRINCIPAL_CACHE_TTL_SECONDS": 0,
+    })
+    monkeypatch.setattr("src.presentation.api.dependencies.get_settings", lambda: settings)
+    headers_admin = await autenticar()
+    headers_outro = await autenticar("outro-admin@exemplo.com")
+    outro = (await client.get("/api/v1/usuarios/me", headers=headers_outro)).json()
+    
+    # Act
+    await client.put(
+        f"/api/v1/admin/usuarios/{outro['id']}",
+        headers=headers_admin,
+        json={"ativo": False}
+    )
+    response = await client.get("/api/v1/admin/usuarios", headers=headers_outro)
+    
+    # Assert
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_login_acima_do_limite_recebe_429_sem_consultar_o_banco(client, login_rate_limiter, comandos_sql):
+    # Arrange
+    login_rate_limiter.capacidade_email = 2
+    credenciais = {"email": "alvo@exemplo.com", "senha": "chute"}
+    for _ in range(2):
+        await client.post("/api/v1/auth/login", json=credenciais)
+    comandos_sql.clear()
+    
+    # Act
+    response = await client.post("/api/v1/auth/login", json=credenciais)
+    
+    # Assert
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert comandos_sql == []
+
+@pytest.mark.asyncio
+async def test_email_inexistente_executa_verificacao_ficticia(client, password_hasher):
+    # Act
+    response = await client.post("/api/v1/auth/login", json={
+        "email": "inexistente@exemplo.com",
+        "senha": "qualquer"
+    })
+    
+    # Assert: mesmo custo de uma senha errada
+    assert response.status_code == 401
+    assert password_hasher.verify_latency.count == 1
+
+@pytest.mark.asyncio
+async def test_conta_desativada_verifica_a_senha_antes_de_recusar(client, autenticar, password_hasher):
+    # Arrange
+    headers_admin = await autenticar()
+    headers_usuario = await autenticar("usuario@exemplo.com", PerfilUsuario.USUARIO)
+    usuario = (await client.get("/api/v1/usuarios/me", headers=headers_usuario)).json()
+    await client.put(
+        f"/api/v1/admin/usuarios/{usuario['id']}",
+        headers=headers_admin,
+        json={"ativo": False}
+    )
+    verificacoes = password_hasher.verify_latency.count
+    
+    # Act
+    senha_errada = await client.post("/api/v1/auth/login", json={
+        "email": "usuario@exemplo.com",
+        "senha": "chute"
+    })
+    senha_correta = await client.post("/api/v1/auth/login", json={
+        "email": "usuario@exemplo.com",
+        "senha": "senha_secreta"
+    })
+    
+    # Assert: mesmo custo e mesma resposta de uma senha errada
+    assert senha_errada.status_code == 401
+    assert "desativado" not in senha_errada.text
+    assert senha_correta.status_code == 401
+    assert password_hasher.verify_latency.count == verificacoes + 2
@@ -0,0 +1,87 @@
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.usuario_dto import MAX_IDS_BATCH_GET
+from src.application.use_cases.usuario_use_cases import UsuarioUseCases
+from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+BATCH_GET = "/api/v1/admin/usuarios/batch-get"
+
+@pytest.mark.asyncio
+async def test_obter_por_ids_faz_uma_unica_consulta(db_session, comandos_sql, criar_usuarios):
+    # Arrange
+    usuarios = await criar_usuarios(quantidade=20)
+    ids = [usuario.id for usuario in usuarios] + [uuid4()]
+    comandos_sql.clear()
+    
+    # Act
+    encontrados = await UsuarioRepository(db_session).obter_por_ids(ids + ids[:5])
+    
+    # Assert
+    assert len(comandos_sql) == 1
+    assert set(encontrados) == {usuario.id for usuario in usuarios}
+    assert encontrados[usuarios[3].id].email == "usuario3@exemplo.com"
+
+@pytest.mark.asyncio
+async def test_batch_get_busca_todos_os_ids_em_uma_chamada(db_session, criar_usuarios, password_hasher, monkeypatch):
+    # Arrange
+    usuarios = await criar_usuarios(quantidade=3)
+    ids = [usuario.id for usuario in usuarios] + [uuid4() for _ in range(MAX_IDS_BATCH_GET - 3)]
+    uow = SqlAlchemyUnitOfWork(db_session)
+    chamadas = []
+    obter_por_ids = uow.usuarios.obter_por_ids
+    
+    async def espiar(usuario_ids):
+        chamadas.append(list(usuario_ids))
+        return await obter_por_ids(chamadas[-1])
+    
+    monkeypatch.setattr(uow.usuarios, "obter_por_ids", espiar)
+    
+    # Act
+    resposta = await UsuarioUseCases(uow, password_hasher=password_hasher).obter_usuarios_por_ids(ids)
+    
+    # Assert
+    assert [len(ids_chamada) for ids_chamada in chamadas] == [MAX_IDS_BATCH_GET]
+    assert [item.id for item in resposta.itens] == [usuario.id for usuario in usuarios]
+    assert len(resposta.nao_encontrados) == MAX_IDS_BATCH_GET - 3
+
+@pytest.mark.asyncio
+async def test_batch_get_retorna_encontrados_e_inexistentes(client, autenticar, criar_usuarios):
+    # Arrange
+    headers = await autenticar()
+    usuarios = await criar_usuarios(quantidade=3)
+    inexistente = uuid4()
+    ids = [str(usuarios[2].id), str(inexistente), str(usuarios[0].id), str(usuarios[2].id)]
+    
+    # Act
+    response = await client.post(BATCH_GET, json={"ids": ids}, headers=headers)
+    
+    # Assert: ordem do pedido, sem repetições
+    assert response.status_code == 200
+    corpo = response.json()
+    assert [u["id"] for u in corpo["itens"]] == [str(usuarios[2].id), str(usuarios[0].id)]
+    assert corpo["nao_encontrados"] == [str(inexistente)]
+    assert "senha_hash" not in corpo["itens"][0]
+
+@pytest.mark.asyncio
+async def test_batch_get_limita_o_numero_de_ids(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    
+    # Act
+    vazio = await client.post(BATCH_GET, json={"ids": []}, headers=headers)
+    grande = await client.post(BATCH_GET, json={"ids": [str(uuid4()) for _ in range(5001)]}, headers=headers)
+    
+    # Assert
+    assert vazio.status_code == 422
+    assert grande.status_code == 422
+
+@pytest.mark.asyncio
+async def test_batch_get_exige_admin(client):
+    # Act
+    response = await client.post(BATCH_GET, json={"ids": [str(uuid4())]})
+    
+    # Assert
+    assert response.status_code == 401
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, text
+
+from src.domain.entities.usuario import PerfilUsuario, Usuario
+from src.domain.repositories.filtro_usuarios import FiltroUsuarios, ModoBusca
+from src.infrastructure.database.models.usuario_model import UsuarioModel
+from src.infrastructure.database.repositories.usuario_query_builder import UsuarioQueryBuilder
+
+BUSCA = "/api/v1/admin/usuarios/search"
+
+def _usuario(email: str, nome: str, **campos) -> Usuario:
+    return Usuario(email=email, senha_hash="hash", nome=nome, **campos)
+
+@pytest.mark.asyncio
+async def test_busca_por_prefixo_em_nome_e_email(client, autenticar, criar_usuarios):
+    # Arrange
+    headers = await autenticar()
+    await criar_usuarios(
+        _usuario("maria@exemplo.com", "Maria Souza"),
+        _usuario("joao@exemplo.com", "João Mariano"),
+        _usuario("mariana@outro.com", "Ana Lima"),
+    )
+    
+    # Act
+    response = await client.get(f"{BUSCA}?q=MARI", headers=headers)
+    
+    # Assert: prefixo de nome ou de email, sem diferenciar maiúsculas
+    assert response.status_code == 200
+    assert {u["email"] for u in response.json()} == {"maria@exemplo.com", "mariana@outro.com"}
+
+@pytest.mark.asyncio
+async def test_busca_com_letras_acentuadas(client, autenticar, criar_usuarios):
+    # Arrange
+    headers = await autenticar()
+    await criar_usuarios(_usuario("erica@exemplo.com", "Érica Souza"))
+    
+    # Act
+    prefixo = await client.get(f"{BUSCA}?q=ÉRICA", headers=headers)
+    substring = await client.get(f"{BUSCA}?q=rica sou&modo=substring", headers=headers)
+    limite = await client.get(f"{BUSCA}?q=\U0010ffff", headers=headers)
+    
+    # Assert
+    assert [u["email"] for u in prefixo.json()] == ["erica@exemplo.com"]
+    assert [u["email"] for u in substring.json()] == ["erica@exemplo.com"]
+    assert limite.status_code == 200
+    assert limite.json() == []
+
+@pytest.mark.asyncio
+async def test_busca_por_substring(client, autenticar, criar_usuarios):
+    # Arrange
+    headers = await autenticar()
+    await criar_usuarios(
+        _usuario("joao@exemplo.com", "João Mariano"),
+        _usuario("ana@outro.com", "Ana Lima"),
+    )
+    
+    # Act
+    response = await client.get(f"{BUSCA}?q=ariano&modo=substring", headers=headers)
+    curta = await client.get(f"{BUSCA}?q=ar&modo=substring", headers=headers)
+    
+    # Assert
+    assert [u["email"] for u in response.json()] == ["joao@exemplo.com"]
+    assert curta.status_code == 400
+
+@pytest.mark.asyncio
+async def test_curingas_do_like_sao_literais(client, autenticar, criar_usuarios):
+    # Arrange
+    headers = await autenticar()
+    await criar_usuarios(
+        _usuario("cem_porcento@exemplo.com", "Cem 100% Certo"),
+        _usuario("cemx@exemplo.com", "Cem 1000 Certo"),
+    )
+    
+    # Act
+    response = await client.get(f"{BUSCA}?q=100%25&modo=substring", headers=headers)
+    
+    # Assert
+    assert [u["email"] for u in response.json()] == ["cem_porcento@exemplo.com"]
+
+@pytest.mark.asyncio
+async def test_filtros_combinados_e_paginacao(client, autenticar, criar_usuarios):
+    # Arrange
+    headers = await autenticar()
+    agora = datetime.utcnow()
+    await criar_usuarios(*(
+        _usuario(f"ativo{i}@exemplo.com", f"Ativo {i}", ultimo_login=agora - timedelta(days=i))
+        for i in range(5)
+    ), _usuario("inativo@exemplo.com", "Inativo", ativo=False, ultimo_login=agora))
+    desde = (agora - timedelta(days=2, hours=1)).isoformat()
+    
+    # Act
+    emails = []
+    url = f"{BUSCA}?perfil=usuario&ativo=true&ultimo_login_de={desde}&limit=2"
+    response = await client.get(url, headers=headers)
+    emails += [u["email"] for u in response.json()]
+    while "X-Next-Cursor" in response.headers:
+        response = await client.get(f"{url}&cursor={response.headers['X-Next-Cursor']}", headers=headers)
+        emails += [u["email"] for u in response.json()]
+    
+    # Assert
+    assert sorted(emails) == ["ativo0@exemplo.com", "ativo1@exemplo.com", "ativo2@exemplo.com"]
+
+@pytest.mark.asyncio
+async def test_busca_exige_admin(client, autenticar):
+    # Arrange
+    headers = await autenticar("usuario@exemplo.com", PerfilUsuario.USUARIO)
+    
+    # Act
+    response = await client.get(f"{BUSCA}?q=usu", headers=headers)
+    
+    # Assert
+    assert response.status_code == 403
+
+@pytest.mark.asyncio
+async def test_prefixo_no_sqlite_usa_o_indice_funcional(db_session):
+    # Arrange
+    stmt = UsuarioQueryBuilder("sqlite").aplicar(
+        select(UsuarioModel.id), FiltroUsuarios(termo="mar", modo=ModoBusca.PREFIXO)
+    )
+    sql = str(stmt.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True}))
+    
+    # Act
+    plano = (await db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))).all()
+    
+    # Assert
+    detalhes = " ".join(linha[-1] for linha in plano)
+    assert "ix_usuarios_nome_lower" in detalhes
+    assert "ix_usuarios_email_lower" in detalhes
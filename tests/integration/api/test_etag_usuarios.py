@@ -0,0 +1,88 @@
+import pytest
+
+from src.domain.entities.usuario import Usuario
+
+@pytest.mark.asyncio
+async def test_usuario_atual_responde_304_com_o_mesmo_etag(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    primeira = await client.get("/api/v1/usuarios/me", headers=headers)
+    etag = primeira.headers["etag"]
+    
+    # Act
+    response = await client.get("/api/v1/usuarios/me", headers={**headers, "If-None-Match": etag})
+    
+    # Assert
+    assert primeira.status_code == 200
+    assert not etag.startswith("W/")
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+@pytest.mark.asyncio
+async def test_etag_muda_apos_alteracao(client, autenticar, criar_usuarios):
+    # Arrange
+    headers = await autenticar()
+    (usuario,) = await criar_usuarios(quantidade=1)
+    url = f"/api/v1/admin/usuarios/{usuario.id}"
+    etag = (await client.get(url, headers=headers)).headers["etag"]
+    
+    # Act
+    await client.put(url, json={"nome": "Nome Alterado"}, headers=headers)
+    response = await client.get(url, headers={**headers, "If-None-Match": etag})
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["nome"] == "Nome Alterado"
+    assert response.headers["etag"] != etag
+
+@pytest.mark.asyncio
+async def test_requisicao_condicional_consulta_apenas_a_versao(client, autenticar, criar_usuarios, comandos_sql):
+    # Arrange
+    headers = await autenticar()
+    (usuario,) = await criar_usuarios(quantidade=1)
+    url = f"/api/v1/admin/usuarios/{usuario.id}"
+    etag = (await client.get(url, headers=headers)).headers["etag"]
+    comandos_sql.clear()
+    
+    # Act
+    response = await client.get(url, headers={**headers, "If-None-Match": f'"outro", W/{etag}'})
+    
+    # Assert: só data_atualizacao e ultimo_login, sem carregar o registro
+    consultas = [sql for sql in comandos_sql if sql.lstrip().upper().startswith("SELECT")]
+    assert response.status_code == 304
+    assert len(consultas) == 1
+    assert "senha_hash" not in consultas[0]
+
+@pytest.mark.asyncio
+async def test_requisicao_condicional_de_usuario_inexistente(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    
+    # Act
+    response = await client.get(
+        "/api/v1/admin/usuarios/00000000-0000-0000-0000-000000000000",
+        headers={**headers, "If-None-Match": '"qualquer"'}
+    )
+    
+    # Assert
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_pagina_da_listagem_tem_etag_fraco(client, autenticar, criar_usuarios):
+    # Arrange
+    headers = await autenticar()
+    await criar_usuarios(quantidade=1)
+    primeira = await client.get("/api/v1/admin/usuarios", headers=headers)
+    etag = primeira.headers["etag"]
+    
+    # Act
+    igual = await client.get("/api/v1/admin/usuarios", headers={**headers, "If-None-Match": etag})
+    await criar_usuarios(Usuario(email="outro@exemplo.com", senha_hash="hash", nome="Outro"))
+    alterada = await client.get("/api/v1/admin/usuarios", headers={**headers, "If-None-Match": etag})
+    
+    # Assert
+    assert etag.startswith('W/"')
+    assert igual.status_code == 304
+    assert alterada.status_code == 200
+    assert len(alterada.json()) == 3
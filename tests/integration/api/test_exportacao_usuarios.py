@@ -0,0 +1,95 @@
+import json
+import os
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.application.use_cases.usuario_use_cases import UsuarioUseCases
+from src.config.database import Base
+from src.domain.entities.usuario import PerfilUsuario
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from src.presentation.api.streaming import ndjson_stream
+
+# Teste lento, fora da execução padrão: pytest -m slow
+# O volume pode ser ajustado, ex.: EXPORT_TEST_ROWS=100000 pytest -m slow
+TOTAL_LINHAS_MEMORIA = int(os.getenv("EXPORT_TEST_ROWS", "1000000"))
+
+@pytest.mark.asyncio
+async def test_exportacao_ndjson(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    await autenticar("usuario@exemplo.com", PerfilUsuario.USUARIO)
+    
+    # Act
+    response = await client.get("/api/v1/admin/usuarios/export", headers=headers)
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    linhas = [json.loads(linha) for linha in response.text.splitlines()]
+    assert [linha["email"] for linha in linhas] == ["admin@exemplo.com", "usuario@exemplo.com"]
+    assert "senha_hash" not in linhas[0]
+
+@pytest.mark.asyncio
+async def test_exportacao_csv(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    
+    # Act
+    response = await client.get("/api/v1/admin/usuarios/export?formato=csv", headers=headers)
+    
+    # Assert
+    assert response.status_code == 200
+    cabecalho, linha = response.text.splitlines()
+    assert cabecalho.startswith("id,email,nome,perfil,ativo")
+    assert "admin@exemplo.com" in linha
+
+def _memoria_residente() -> int:
+    """Memória residente (RSS) atual do processo, em bytes."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="requer /proc")
+async def test_exportacao_mantem_memoria_limitada(tmp_path):
+    # Arrange
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'export.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # Linhas sintéticas geradas pelo próprio SQLite
+        await conn.exec_driver_sql(
+            """
+            WITH RECURSIVE seq(x) AS (
+                SELECT 0 UNION ALL SELECT x + 1 FROM seq WHERE x < ? - 1
+            )
+            INSERT INTO usuarios (
+                id, email, senha_hash, nome, perfil, ativo, data_criacao, data_atualizacao
+            )
+            SELECT
+                substr('00000000000000000000000000000000' || x, -32, 32),
+                'usuario' || x || '@exemplo.com',
+                'hash',
+                'Usuário ' || x,
+                'USUARIO',
+                1,
+                datetime('2024-01-01', '+' || x || ' seconds'),
+                datetime('2024-01-01', '+' || x || ' seconds')
+            FROM seq
+            """,
+            (TOTAL_LINHAS_MEMORIA,)
+        )
+    
+    # Act
+    total_linhas = 0
+    async with async_sessionmaker(engine)() as session:
+        use_case = UsuarioUseCases(SqlAlchemyUnitOfWork(session))
+        memoria_inicial = pico = _memoria_residente()
+        async for chunk in ndjson_stream(use_case.exportar_usuarios()):
+            total_linhas += chunk.count(b"\n")
+            pico = max(pico, _memoria_residente())
+    await engine.dispose()
+    
+    # Assert
+    assert total_linhas == TOTAL_LINHAS_MEMORIA
+    assert pico - memoria_inicial < 64 * 1024 * 1024
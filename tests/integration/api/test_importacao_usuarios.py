@@ -0,0 +1,128 @@
+import json
+
+import argon2
+import bcrypt
+import pytest
+
+from src.application.services.hasher_registry import HasherRegistry
+from src.domain.entities.usuario import Usuario
+from src.domain.exceptions.domain_exceptions import DomainValidationError
+from src.infrastructure.auth.hash_algorithms import Argon2idHashAlgorithm, BcryptHashAlgorithm
+from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+from src.presentation.api.bulk import parse_import_payload
+
+@pytest.mark.asyncio
+async def test_importacao_json_reporta_resultado_por_linha(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    senha_hash = bcrypt.hashpw(b"senha_secreta", bcrypt.gensalt(rounds=4)).decode()
+    itens = [
+        {"email": "novo1@exemplo.com", "nome": "Novo Um", "senha": "senha_secreta"},
+        {"email": "novo2@exemplo.com", "nome": "Novo Dois", "senha_hash": senha_hash},
+        {"email": "admin@exemplo.com", "nome": "Já Existe", "senha": "senha_secreta"},
+        {"email": "novo1@exemplo.com", "nome": "Repetido", "senha": "senha_secreta"},
+        {"email": "invalido", "nome": "Inválido", "senha": "senha_secreta"},
+    ]
+    
+    # Act
+    response = await client.post("/api/v1/admin/usuarios/bulk", headers=headers, json=itens)
+    
+    # Assert
+    assert response.status_code == 200
+    corpo = response.json()
+    assert corpo["total"] == 5
+    assert corpo["criados"] == 2
+    assert [r["status"] for r in corpo["resultados"]] == [
+        "criado", "criado", "duplicado", "duplicado", "invalido"
+    ]
+    login = await client.post("/api/v1/auth/login", json={
+        "email": "novo2@exemplo.com", "senha": "senha_secreta"
+    })
+    assert login.status_code == 200
+
+@pytest.mark.asyncio
+async def test_importacao_ndjson(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    linhas = [
+        json.dumps({"email": f"ndjson{i}@exemplo.com", "nome": "Usuário", "senha": "senha_secreta"})
+        for i in range(3)
+    ]
+    corpo = "\n".join(linhas[:2] + ["{quebrado"] + linhas[2:])
+    
+    # Act
+    response = await client.post(
+        "/api/v1/admin/usuarios/bulk",
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+        content=corpo
+    )
+    
+    # Assert
+    resultados = response.json()["resultados"]
+    assert [r["linha"] for r in resultados] == [1, 2, 3, 4]
+    assert [r["status"] for r in resultados] == ["criado", "criado", "invalido", "criado"]
+
+@pytest.mark.asyncio
+async def test_importacao_aceita_hash_argon2id_e_rejeita_formato_desconhecido(client, autenticar, password_hasher):
+    # Arrange
+    password_hasher.registry = HasherRegistry(
+        Argon2idHashAlgorithm(time_cost=1, memory_cost=8, parallelism=1), [BcryptHashAlgorithm(rounds=4)]
+    )
+    headers = await autenticar()
+    senha_hash = argon2.PasswordHasher(time_cost=1, memory_cost=8, parallelism=1).hash("senha_secreta")
+    itens = [
+        {"email": "argon@exemplo.com", "nome": "Argon", "senha_hash": senha_hash},
+        {"email": "md5@exemplo.com", "nome": "Md5", "senha_hash": "5f4dcc3b5aa765d61d8327deb882cf99"},
+    ]
+    
+    # Act
+    response = await client.post("/api/v1/admin/usuarios/bulk", headers=headers, json=itens)
+    
+    # Assert
+    assert [r["status"] for r in response.json()["resultados"]] == ["criado", "invalido"]
+    login = await client.post("/api/v1/auth/login", json={
+        "email": "argon@exemplo.com", "senha": "senha_secreta"
+    })
+    assert login.status_code == 200
+
+@pytest.mark.asyncio
+async def test_importacao_exige_array(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    
+    # Act
+    response = await client.post("/api/v1/admin/usuarios/bulk", headers=headers, json={"email": "x"})
+    
+    # Assert
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_ndjson_acima_do_limite_para_de_ler_o_corpo():
+    # Arrange
+    lidas = []
+    
+    async def partes():
+        for i in range(100):
+            lidas.append(i)
+            yield json.dumps({"email": f"l{i}@exemplo.com", "nome": "Linha", "senha": "senha_secreta"}).encode() + b"\n"
+    
+    # Act
+    with pytest.raises(DomainValidationError):
+        await parse_import_payload(partes(), "application/x-ndjson", max_linhas=3)
+    
+    # Assert
+    assert len(lidas) == 4
+
+@pytest.mark.asyncio
+async def test_insert_em_lote_respeita_o_limite_de_parametros(db_session, comandos_sql, monkeypatch):
+    # Arrange: 9 colunas por linha, no máximo 2 linhas por comando
+    monkeypatch.setattr("src.infrastructure.database.repositories.usuario_repository.LIMITE_PARAMETROS", 20)
+    usuarios = [Usuario(email=f"lote{i}@exemplo.com", senha_hash="hash", nome="Lote") for i in range(5)]
+    comandos_sql.clear()
+    
+    # Act
+    inseridos = await UsuarioRepository(db_session).criar_em_lote(usuarios)
+    
+    # Assert
+    assert len(inseridos) == 5
+    assert sum(1 for comando in comandos_sql if comando.startswith("INSERT INTO usuarios")) == 3
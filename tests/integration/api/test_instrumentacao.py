@@ -0,0 +1,160 @@
+import logging
+import re
+
+import pytest
+import pytest_asyncio
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config.database import get_db
+from src.config.settings import get_settings
+from src.infrastructure.cache.principal_cache import get_principal_cache
+from src.infrastructure.instrumentation.request_stats import iniciar_coleta, instrumentar_engine
+from src.infrastructure.instrumentation.route_stats import get_route_stats
+from src.main import create_application
+from src.presentation.api.middleware import RequestInstrumentationMiddleware
+
+@pytest_asyncio.fixture
+async def cliente_instrumentado(db_engine, password_hasher, monkeypatch):
+    """Aplicação criada com a instrumentação ligada, usando o banco de testes."""
+    monkeypatch.setattr(get_settings(), "INSTRUMENTATION_ENABLED", True)
+    app = create_application()
+    instrumentar_engine(db_engine, slow_query_ms=0)
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    get_principal_cache().clear()
+    get_route_stats().clear()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        await ac.post("/api/v1/usuarios", json={
+            "email": "admin@exemplo.com",
+            "nome": "Admin",
+            "senha": "senha_secreta",
+            "perfil": "admin"
+        })
+        response = await ac.post("/api/v1/auth/login", json={
+            "email": "admin@exemplo.com",
+            "senha": "senha_secreta"
+        })
+        ac.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+        yield ac
+
+    get_principal_cache().clear()
+    get_route_stats().clear()
+
+def _server_timing(response) -> dict:
+    metricas = {}
+    for item in response.headers["server-timing"].split(","):
+        nome, *params = [parte.strip() for parte in item.split(";")]
+        metricas[nome] = dict(param.split("=", 1) for param in params)
+    return metricas
+
+@pytest.mark.asyncio
+async def test_server_timing_informa_tempo_e_comandos_sql(cliente_instrumentado):
+    # Arrange
+    get_principal_cache().clear()
+
+    # Act
+    response = await cliente_instrumentado.get("/api/v1/usuarios/me")
+
+    # Assert
+    metricas = _server_timing(response)
+    assert metricas["db-statements"]["desc"] == '"1"'
+    assert float(metricas["db"]["dur"]) > 0
+    assert float(metricas["auth"]["dur"]) >= float(metricas["db"]["dur"])
+    assert float(metricas["total"]["dur"]) >= float(metricas["auth"]["dur"])
+
+@pytest.mark.asyncio
+async def test_histogramas_agregados_por_template_da_rota(cliente_instrumentado):
+    # Arrange
+    criado = await cliente_instrumentado.post("/api/v1/usuarios", json={
+        "email": "outro@exemplo.com", "nome": "Outro", "senha": "senha_secreta"
+    })
+
+    # Act
+    await cliente_instrumentado.get(f"/api/v1/admin/usuarios/{criado.json()['id']}")
+    await cliente_instrumentado.get("/api/v1/usuarios/me")
+    response = await cliente_instrumentado.get("/api/v1/admin/diagnostico/rotas")
+
+    # Assert
+    assert response.status_code == 200
+    rotas = response.json()
+    rota = rotas["GET /api/v1/admin/usuarios/{usuario_id}"]
+    assert rota["count"] == 1
+    assert rota["db_statements_avg"] >= 1
+    assert sum(rota["buckets"].values()) == 1
+    assert rotas["POST /api/v1/usuarios"]["count"] == 2
+
+@pytest.mark.asyncio
+async def test_template_da_rota_vem_da_rota_atendida():
+    # Arrange: parâmetro :path e segmento literal igual ao valor do parâmetro
+    app = FastAPI()
+    app.add_middleware(RequestInstrumentationMiddleware, server_timing=False)
+
+    @app.get("/arquivos/{caminho:path}")
+    async def arquivo(caminho: str):
+        return {}
+
+    router = APIRouter(prefix="/grupos")
+
+    @router.get("/{nome}/grupos")
+    async def grupo(nome: str):
+        return {}
+
+    app.include_router(router, prefix="/api")
+    get_route_stats().clear()
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        await ac.get("/arquivos/a/b/c.txt")
+        await ac.get("/api/grupos/grupos/grupos")
+        await ac.get("/inexistente")
+
+    # Assert
+    assert set(get_route_stats().snapshot()) == {
+        "GET /arquivos/{caminho}",
+        "GET /api/grupos/{nome}/grupos",
+        "GET <sem rota>",
+    }
+    get_route_stats().clear()
+
+@pytest.mark.asyncio
+async def test_consultas_lentas_sao_registradas_sem_parametros(
+    cliente_instrumentado, db_engine, caplog
+):
+    # Arrange
+    instrumentar_engine(db_engine, slow_query_ms=1e-6)
+
+    # Act
+    with caplog.at_level(logging.WARNING, logger="src.infrastructure.instrumentation.request_stats"):
+        await cliente_instrumentado.get("/api/v1/admin/usuarios?limit=5")
+
+    # Assert
+    mensagens = [registro.getMessage() for registro in caplog.records]
+    assert any(re.match(r"Consulta lenta \(.+ ms\) em /api/v1/admin/usuarios: SELECT", m) for m in mensagens)
+    assert not any("admin@exemplo.com" in m for m in mensagens)
+
+@pytest.mark.asyncio
+async def test_comando_com_erro_e_medido_sem_deixar_estado_na_conexao(db_engine):
+    # Arrange
+    instrumentar_engine(db_engine, slow_query_ms=0)
+    stats = iniciar_coleta("/teste")
+
+    # Act
+    async with db_engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            await conn.execute(text("SELECT * FROM tabela_inexistente"))
+        await conn.execute(text("SELECT 1"))
+        info = dict(conn.sync_connection.info)
+
+    # Assert
+    assert stats.db_count == 2
+    assert info == {}
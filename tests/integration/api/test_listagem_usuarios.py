@@ -0,0 +1,67 @@
+import pytest
+
+from src.application.dtos.usuario_dto import UsuarioResponse
+from src.domain.entities.usuario import PerfilUsuario
+
+@pytest.mark.asyncio
+async def test_paginacao_por_cursor_percorre_todos_os_usuarios(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    for i in range(4):
+        await autenticar(f"usuario{i}@exemplo.com", PerfilUsuario.USUARIO)
+    
+    # Act
+    emails = []
+    response = await client.get("/api/v1/admin/usuarios?limit=2", headers=headers)
+    emails += [u["email"] for u in response.json()]
+    while "X-Next-Cursor" in response.headers:
+        cursor = response.headers["X-Next-Cursor"]
+        response = await client.get(
+            f"/api/v1/admin/usuarios?limit=2&cursor={cursor}", headers=headers
+        )
+        emails += [u["email"] for u in response.json()]
+    
+    # Assert
+    assert len(emails) == 5
+    assert len(set(emails)) == 5
+
+@pytest.mark.asyncio
+async def test_paginacao_por_offset_continua_disponivel(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    await autenticar("usuario@exemplo.com", PerfilUsuario.USUARIO)
+    
+    # Act
+    response = await client.get("/api/v1/admin/usuarios?skip=1&limit=10", headers=headers)
+    
+    # Assert
+    assert response.status_code == 200
+    assert [u["email"] for u in response.json()] == ["usuario@exemplo.com"]
+    assert "X-Next-Cursor" not in response.headers
+
+@pytest.mark.asyncio
+async def test_cursor_invalido_retorna_400(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    
+    # Act
+    response = await client.get("/api/v1/admin/usuarios?cursor=invalido", headers=headers)
+    
+    # Assert
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_listagem_rapida_tem_o_mesmo_formato_de_usuario_response(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    await autenticar("usuario@exemplo.com", PerfilUsuario.USUARIO)
+    
+    # Act
+    response = await client.get("/api/v1/admin/usuarios", headers=headers)
+    
+    # Assert
+    assert response.headers["content-type"] == "application/json"
+    for item in response.json():
+        esperado = UsuarioResponse.model_validate(item).model_dump(mode="json")
+        assert item == esperado
+        assert "senha_hash" not in item
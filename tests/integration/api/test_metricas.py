@@ -0,0 +1,94 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+def _valor(texto: str, metrica: str) -> float:
+    padrao = re.compile(rf"^{re.escape(metrica)} (\S+)$", re.MULTILINE)
+    encontrado = padrao.search(texto)
+    return float(encontrado.group(1)) if encontrado else 0.0
+
+@pytest.mark.asyncio
+async def test_metrics_expoe_contadores_e_histogramas_por_rota(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    rota = 'method="GET",route="/api/v1/usuarios/me"'
+    antes = (await client.get("/metrics")).text
+
+    # Act
+    for _ in range(3):
+        await client.get("/api/v1/usuarios/me", headers=headers)
+    response = await client.get("/metrics")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    texto = response.text
+    contador = f'http_requests_total{{{rota},status="200"}}'
+    assert _valor(texto, contador) - _valor(antes, contador) == 3
+    contagem = f"http_request_duration_seconds_count{{{rota}}}"
+    assert _valor(texto, contagem) - _valor(antes, contagem) == 3
+    assert 'cache_hit_ratio{cache="principal"}' in texto
+    assert "password_hash_queue_depth" in texto
+    assert 'route="/metrics"' not in texto
+
+@pytest.mark.asyncio
+async def test_rotas_com_parametros_usam_o_template(client, autenticar):
+    # Arrange
+    headers = await autenticar()
+    usuario_id = (await client.get("/api/v1/usuarios/me", headers=headers)).json()["id"]
+
+    # Act
+    await client.get(f"/api/v1/admin/usuarios/{usuario_id}", headers=headers)
+    texto = (await client.get("/metrics")).text
+
+    # Assert
+    assert 'route="/api/v1/admin/usuarios/{usuario_id}"' in texto
+    assert usuario_id not in texto
+
+def test_modo_multiprocesso_agrega_os_workers(tmp_path):
+    # Arrange
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "PYTHONPATH": os.getcwd()}
+    worker = (
+        "from src.infrastructure.instrumentation import metrics; "
+        "metrics.observar_requisicao('GET', '/x', 200, 0.01)"
+    )
+
+    # Act
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", worker], env=env, check=True)
+    saida = subprocess.run(
+        [sys.executable, "-c",
+         "from src.infrastructure.instrumentation import metrics; "
+         "print(metrics.gerar_metricas()[0].decode())"],
+        env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+    # Assert
+    assert _valor(saida, 'http_requests_total{method="GET",route="/x",status="200"}') == 2
+
+def test_contadores_acumulados_somam_workers_encerrados(tmp_path):
+    # Arrange
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "PYTHONPATH": os.getcwd()}
+    worker = (
+        "from src.infrastructure.cache.ttl_cache import TTLCache; "
+        "from src.infrastructure.instrumentation import metrics; "
+        "cache = TTLCache(nome='principal'); cache.get('a'); cache.set('a', 1); cache.get('a'); "
+        "metrics.marcar_worker_encerrado()"
+    )
+
+    # Act
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", worker], env=env, check=True)
+    saida = subprocess.run(
+        [sys.executable, "-c",
+         "from src.infrastructure.instrumentation import metrics; "
+         "print(metrics.gerar_metricas()[0].decode())"],
+        env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+    # Assert
+    assert _valor(saida, 'cache_hits_total{cache="principal"}') == 2
+    assert _valor(saida, 'cache_misses_total{cache="principal"}') == 2
@@ -0,0 +1,93 @@
+import pytest
+from uuid import uuid4
+
+from src.application.dtos.usuario_dto import UsuarioCreate, UsuarioUpdate
+from src.application.use_cases.usuario_use_cases import UsuarioUseCases
+from src.domain.exceptions.domain_exceptions import DomainValidationError, EntityNotFoundError
+from src.infrastructure.cache.principal_cache import PrincipalCache
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+@pytest.fixture
+def use_case(db_session, password_hasher, login_rate_limiter):
+    return UsuarioUseCases(
+        SqlAlchemyUnitOfWork(db_session),
+        password_hasher=password_hasher,
+        principal_cache=PrincipalCache(),
+        login_rate_limiter=login_rate_limiter
+    )
+
+async def _criar(use_case, email="usuario@exemplo.com"):
+    return await use_case.criar_usuario(UsuarioCreate(
+        email=email, nome="Usuário Teste", senha="senha_secreta"
+    ))
+
+@pytest.mark.asyncio
+async def test_atualizar_usuario_usa_um_unico_comando(use_case, comandos_sql):
+    # Arrange
+    usuario = await _criar(use_case)
+    comandos_sql.clear()
+    
+    # Act
+    atualizado = await use_case.atualizar_usuario(usuario.id, UsuarioUpdate(nome="Novo Nome"))
+    
+    # Assert
+    assert atualizado.nome == "Novo Nome"
+    assert atualizado.email == usuario.email
+    assert len(comandos_sql) == 1
+    assert comandos_sql[0].startswith("UPDATE usuarios SET nome=")
+    assert "senha_hash" not in comandos_sql[0].split("RETURNING")[0]
+
+@pytest.mark.asyncio
+async def test_atualizar_usuario_inexistente(use_case, comandos_sql):
+    # Act & Assert
+    with pytest.raises(EntityNotFoundError):
+        await use_case.atualizar_usuario(uuid4(), UsuarioUpdate(nome="Novo Nome"))
+    assert len(comandos_sql) == 1
+
+@pytest.mark.asyncio
+async def test_atualizar_usuario_com_email_em_uso(use_case):
+    # Arrange
+    await _criar(use_case, "existente@exemplo.com")
+    usuario = await _criar(use_case)
+    
+    # Act & Assert
+    with pytest.raises(DomainValidationError) as excinfo:
+        await use_case.atualizar_usuario(usuario.id, UsuarioUpdate(email="existente@exemplo.com"))
+    
+    assert "já está em uso" in str(excinfo.value)
+
+@pytest.mark.asyncio
+async def test_remover_usuario_usa_um_comando_e_o_ajuste_dos_contadores(use_case, comandos_sql):
+    # Arrange
+    usuario = await _criar(use_case)
+    comandos_sql.clear()
+    
+    # Act
+    removido = await use_case.remover_usuario(usuario.id)
+    
+    # Assert
+    assert removido is True
+    assert len(comandos_sql) == 2
+    assert comandos_sql[0].startswith("DELETE FROM usuarios")
+    assert comandos_sql[1].startswith("INSERT INTO usuario_contadores")
+
+@pytest.mark.asyncio
+async def test_remover_usuario_inexistente(use_case, comandos_sql):
+    # Act & Assert
+    with pytest.raises(EntityNotFoundError):
+        await use_case.remover_usuario(uuid4())
+    assert len(comandos_sql) == 1
+
+@pytest.mark.asyncio
+async def test_autenticar_usuario_usa_leitura_e_um_update(use_case, comandos_sql):
+    # Arrange
+    await _criar(use_case)
+    comandos_sql.clear()
+    
+    # Act
+    await use_case.autenticar_usuario("usuario@exemplo.com", "senha_secreta")
+    
+    # Assert
+    assert len(comandos_sql) == 2
+    assert comandos_sql[0].startswith("SELECT")
+    assert "UPDATE usuarios SET" in comandos_sql[1]
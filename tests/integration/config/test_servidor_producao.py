@@ -0,0 +1,67 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pytest
+from sqlalchemy import create_engine
+
+from src.config.database import Base
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+def _porta_livre() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _aguardar(url: str, prazo: float = 15.0) -> bytes:
+    limite = time.monotonic() + prazo
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as resposta:
+                return resposta.read()
+        except OSError:
+            if time.monotonic() > limite:
+                raise
+            time.sleep(0.1)
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="supervisor de workers usa fork")
+def test_servidor_de_producao_com_varios_workers(tmp_path):
+    # Arrange: tabelas criadas para a reconciliação do worker principal
+    porta = _porta_livre()
+    database_url = f"sqlite:///{tmp_path / 'servidor.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    ambiente = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "DEBUG": "false",
+    }
+    ambiente.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    processo = subprocess.Popen(
+        [sys.executable, "-m", "src", "--host", "127.0.0.1", "--port", str(porta), "--workers", "2"],
+        cwd=RAIZ,
+        env=ambiente,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    
+    try:
+        # Act
+        corpo = _aguardar(f"http://127.0.0.1:{porta}/")
+        processo.send_signal(signal.SIGTERM)
+        _, erros = processo.communicate(timeout=15)
+        codigo = processo.returncode
+    finally:
+        if processo.poll() is None:
+            processo.kill()
+    
+    # Assert: atende e encerra de forma graciosa
+    assert b'"status":"ok"' in corpo
+    assert codigo == 0
+    assert b"Traceback" not in erros
@@ -0,0 +1,290 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.cache.redis_cache import RedisCache
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.database.repositories.cached_usuario_repository import CachedUsuarioRepository
+from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+class ServidorRespFalso:
+    """Servidor mínimo com o subconjunto de comandos do Redis usado pelo cache."""
+
+    def __init__(self):
+        self.dados = {}
+        self.comandos = []
+        self._servidor = None
+
+    async def iniciar(self) -> int:
+        self._servidor = await asyncio.start_server(self._atender, "127.0.0.1", 0)
+        return self._servidor.sockets[0].getsockname()[1]
+
+    async def parar(self) -> None:
+        self._servidor.close()
+        await self._servidor.wait_closed()
+
+    async def _atender(self, reader, writer):
+        try:
+            while True:
+                linha = await reader.readline()
+                if not linha:
+                    break
+                args = []
+                for _ in range(int(linha[1:-2])):
+                    tamanho = int((await reader.readline())[1:-2])
+                    args.append((await reader.readexactly(tamanho + 2))[:-2])
+                writer.write(self._responder(args))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _responder(self, args) -> bytes:
+        comando = args[0].decode().upper()
+        self.comandos.append(comando)
+        if comando == "GET":
+            return self._bulk(self.dados.get(args[1]))
+        if comando == "MGET":
+            return b"*%d\r\n" % (len(args) - 1) + b"".join(
+                self._bulk(self.dados.get(chave)) for chave in args[1:]
+            )
+        if comando == "SET":
+            self.dados[args[1]] = args[2]
+            return b"+OK\r\n"
+        if comando == "DEL":
+            removidas = sum(self.dados.pop(chave, None) is not None for chave in args[1:])
+            return b":%d\r\n" % removidas
+        if comando == "INCR":
+            valor = int(self.dados.get(args[1], b"0")) + 1
+            self.dados[args[1]] = str(valor).encode()
+            return b":%d\r\n" % valor
+        if comando == "PEXPIRE":
+            return b":%d\r\n" % (args[1] in self.dados)
+        return b"-ERR comando desconhecido\r\n"
+
+    @staticmethod
+    def _bulk(valor) -> bytes:
+        if valor is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(valor), valor)
+
+@pytest_asyncio.fixture
+async def servidor_redis():
+    servidor = ServidorRespFalso()
+    porta = await servidor.iniciar()
+    servidor.porta = porta
+    yield servidor
+    await servidor.parar()
+
+@pytest_asyncio.fixture
+async def redis_cache(servidor_redis):
+    cache = RedisCache(port=servidor_redis.porta, timeout=1.0)
+    yield cache
+    await cache.close()
+
+def _repositorio(db_session, cache) -> CachedUsuarioRepository:
+    return CachedUsuarioRepository(
+        UsuarioRepository(db_session), cache, ttl=60, single_flight=SingleFlight()
+    )
+
+@pytest.mark.asyncio
+async def test_redis_cache_operacoes_basicas(servidor_redis, redis_cache):
+    # Act
+    await redis_cache.set("a", b"1", ttl=10)
+    valores = await redis_cache.get_many(["a", "b"])
+    versao = await redis_cache.incr("contador")
+    await redis_cache.delete("a")
+
+    # Assert
+    assert valores == [b"1", None]
+    assert versao == 1
+    assert await redis_cache.incr("contador") == 2
+    assert await redis_cache.incr("janela", ttl=60) == 1
+    assert servidor_redis.comandos[-2:] == ["INCR", "PEXPIRE"]
+    assert await redis_cache.get("a") is None
+
+@pytest.mark.asyncio
+async def test_leitura_repetida_nao_consulta_o_banco(db_session, comandos_sql, redis_cache, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    repositorio = _repositorio(db_session, redis_cache)
+    await repositorio.obter_por_id(usuario.id)
+    comandos_sql.clear()
+
+    # Act
+    encontrado = await repositorio.obter_por_id(usuario.id)
+
+    # Assert
+    assert comandos_sql == []
+    assert encontrado.email == usuario.email
+    assert encontrado.data_criacao == usuario.data_criacao
+
+@pytest.mark.asyncio
+async def test_obter_por_email_usa_o_mapeamento_para_o_id(db_session, comandos_sql, redis_cache, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    repositorio = _repositorio(db_session, redis_cache)
+    await repositorio.obter_por_email(usuario.email)
+    await repositorio.obter_por_id(usuario.id)
+    comandos_sql.clear()
+
+    # Act
+    encontrado = await repositorio.obter_por_email(usuario.email)
+
+    # Assert
+    assert comandos_sql == []
+    assert encontrado.id == usuario.id
+
+@pytest.mark.asyncio
+async def test_alteracao_invalida_o_cache_apos_o_commit(db_session, redis_cache, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    await _repositorio(db_session, redis_cache).obter_por_id(usuario.id)
+    uow = SqlAlchemyUnitOfWork(db_session, cache=redis_cache)
+
+    # Act
+    async with uow:
+        await uow.usuarios.atualizar_campos(usuario.id, {"nome": "Nome Novo"})
+        await uow.commit()
+
+    # Assert: outro worker (outro repositório) enxerga o valor novo
+    encontrado = await _repositorio(db_session, redis_cache).obter_por_id(usuario.id)
+    assert encontrado.nome == "Nome Novo"
+
+@pytest.mark.asyncio
+async def test_comando_le_as_proprias_alteracoes(db_session, redis_cache, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    await _repositorio(db_session, redis_cache).obter_por_id(usuario.id)
+    uow = SqlAlchemyUnitOfWork(db_session, cache=redis_cache)
+
+    # Act
+    async with uow:
+        await uow.usuarios.atualizar_campos(usuario.id, {"nome": "Ainda Sem Commit"})
+        encontrado = await uow.usuarios.obter_por_id(usuario.id)
+
+    # Assert
+    assert encontrado.nome == "Ainda Sem Commit"
+
+@pytest.mark.asyncio
+async def test_rollback_nao_invalida_o_cache(db_session, servidor_redis, redis_cache, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    uow = SqlAlchemyUnitOfWork(db_session, cache=redis_cache)
+
+    # Act
+    async with uow:
+        await uow.usuarios.atualizar_campos(usuario.id, {"nome": "Descartado"})
+
+    # Assert
+    assert "INCR" not in servidor_redis.comandos
+
+@pytest.mark.asyncio
+async def test_gravacao_atrasada_de_versao_antiga_e_ignorada(db_session, comandos_sql, redis_cache, criar_usuarios):
+    # Arrange: uma leitura começa antes da alteração e grava no cache depois dela
+    (usuario,) = await criar_usuarios(quantidade=1)
+    repositorio = _repositorio(db_session, redis_cache)
+    versao_lida = 0
+    await redis_cache.incr(repositorio._chave_versao(usuario.id))
+
+    # Act
+    await redis_cache.set(
+        repositorio._chave_usuario(usuario.id),
+        repositorio._serializar(usuario, versao_lida),
+        ttl=60
+    )
+    comandos_sql.clear()
+    await repositorio.obter_por_id(usuario.id)
+
+    # Assert: a entrada obsoleta não foi aceita
+    assert len(comandos_sql) == 1
+
+@pytest.mark.asyncio
+async def test_falhas_concorrentes_fazem_uma_unica_consulta(db_session, comandos_sql, redis_cache, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    repositorio = _repositorio(db_session, redis_cache)
+    comandos_sql.clear()
+
+    # Act
+    resultados = await asyncio.gather(*(repositorio.obter_por_id(usuario.id) for _ in range(10)))
+
+    # Assert
+    assert len(comandos_sql) == 1
+    assert repositorio.single_flight.coalescidas == 9
+    assert len({id(resultado) for resultado in resultados}) == 10
+
+@pytest.mark.asyncio
+async def test_redis_indisponivel_cai_para_o_banco(db_session, servidor_redis, redis_cache, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    await servidor_redis.parar()
+    repositorio = _repositorio(db_session, redis_cache)
+    uow = SqlAlchemyUnitOfWork(db_session, cache=redis_cache)
+
+    # Act
+    encontrado = await repositorio.obter_por_id(usuario.id)
+    async with uow:
+        await uow.usuarios.atualizar_campos(usuario.id, {"nome": "Sem Cache"})
+        await uow.commit()
+
+    # Assert
+    assert encontrado.id == usuario.id
+    assert redis_cache.erros > 0
+
+@pytest.mark.asyncio
+async def test_backend_em_memoria(db_session, comandos_sql, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    cache = InMemoryCache()
+    repositorio = _repositorio(db_session, cache)
+    await repositorio.obter_por_id(usuario.id)
+    comandos_sql.clear()
+
+    # Act
+    await repositorio.obter_por_id(usuario.id)
+    await repositorio.atualizar_campos(usuario.id, {"nome": "Outro"})
+    await db_session.commit()
+    await repositorio.publicar_invalidacoes()
+    encontrado = await repositorio.obter_por_id(usuario.id)
+
+    # Assert
+    assert encontrado.nome == "Outro"
+    assert cache.stats["hits"] >= 1
+
+@pytest.mark.asyncio
+async def test_obter_por_ids_consulta_apenas_os_ausentes_do_cache(db_session, comandos_sql, servidor_redis, redis_cache, criar_usuarios):
+    # Arrange
+    primeiro, segundo = await criar_usuarios(quantidade=2)
+    repositorio = _repositorio(db_session, redis_cache)
+    await repositorio.obter_por_id(primeiro.id)
+    comandos_sql.clear()
+    servidor_redis.comandos.clear()
+
+    # Act
+    encontrados = await repositorio.obter_por_ids([primeiro.id, segundo.id])
+    novamente = await repositorio.obter_por_ids([primeiro.id, segundo.id])
+
+    # Assert: uma consulta só para o ausente, gravado no cache em seguida
+    assert len(comandos_sql) == 1
+    assert set(encontrados) == set(novamente) == {primeiro.id, segundo.id}
+    assert servidor_redis.comandos == ["MGET", "SET", "MGET"]
+
+@pytest.mark.asyncio
+async def test_obter_versao_usa_a_entrada_do_cache(db_session, comandos_sql, redis_cache, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    repositorio = _repositorio(db_session, redis_cache)
+    await repositorio.obter_por_id(usuario.id)
+    comandos_sql.clear()
+
+    # Act
+    versao = await repositorio.obter_versao(usuario.id)
+
+    # Assert
+    assert comandos_sql == []
+    assert versao == (usuario.data_atualizacao, None)
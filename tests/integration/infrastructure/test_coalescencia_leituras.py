@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.instrumentation import metrics
+from src.infrastructure.instrumentation.contadores import SINGLE_FLIGHT_COALESCED, SINGLE_FLIGHT_EXECUTIONS
+
+@pytest.fixture
+def single_flight(monkeypatch):
+    """Single-flight isolado, no lugar do compartilhado pelo worker."""
+    instancia = SingleFlight("leituras")
+    monkeypatch.setattr(
+        "src.infrastructure.database.repositories.coalescing_usuario_repository._single_flight",
+        instancia
+    )
+    return instancia
+
+@pytest.mark.asyncio
+async def test_leituras_concorrentes_compartilham_a_consulta(db_engine, db_session, comandos_sql, single_flight, criar_usuarios):
+    # Arrange: uma unidade de trabalho (e uma sessão) por requisição
+    (usuario,) = await criar_usuarios(quantidade=1)
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    comandos_sql.clear()
+    
+    async def requisicao():
+        async with session_factory() as sessao:
+            uow = SqlAlchemyUnitOfWork(sessao, coalescer_leituras=True)
+            async with uow.somente_leitura():
+                return await uow.usuarios.obter_por_id(usuario.id)
+    
+    # Act
+    resultados = await asyncio.gather(*(requisicao() for _ in range(20)))
+    
+    # Assert
+    assert len(comandos_sql) == 1
+    assert single_flight.execucoes == 1
+    assert single_flight.coalescidas == 19
+    assert all(resultado.id == usuario.id for resultado in resultados)
+    # Cada requisição recebe a própria instância
+    assert len({id(resultado) for resultado in resultados}) == 20
+
+@pytest.mark.asyncio
+async def test_leitura_dentro_de_um_comando_nao_e_agrupada(db_session, single_flight, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    uow = SqlAlchemyUnitOfWork(db_session, coalescer_leituras=True)
+    
+    # Act
+    async with uow:
+        await uow.usuarios.atualizar_campos(usuario.id, {"nome": "Nome Novo"})
+        async with uow.somente_leitura():
+            encontrado = await uow.usuarios.obter_por_id(usuario.id)
+        await uow.commit()
+    
+    # Assert
+    assert encontrado.nome == "Nome Novo"
+    assert single_flight.execucoes == 0
+
+@pytest.mark.asyncio
+async def test_leitura_apos_commit_nao_e_agrupada(db_session, single_flight, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    uow = SqlAlchemyUnitOfWork(db_session, coalescer_leituras=True)
+    async with uow:
+        await uow.usuarios.atualizar_campos(usuario.id, {"nome": "Nome Novo"})
+        await uow.commit()
+    
+    # Act
+    async with uow.somente_leitura():
+        encontrado = await uow.usuarios.obter_por_id(usuario.id)
+    
+    # Assert
+    assert encontrado.nome == "Nome Novo"
+    assert single_flight.execucoes == 0
+
+@pytest.mark.asyncio
+async def test_metricas_do_single_flight(db_session, single_flight, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    uow = SqlAlchemyUnitOfWork(db_session, coalescer_leituras=True)
+    execucoes = SINGLE_FLIGHT_EXECUTIONS.labels("leituras")._value.get()
+    coalescidas = SINGLE_FLIGHT_COALESCED.labels("leituras")._value.get()
+    
+    # Act
+    async with uow.somente_leitura():
+        await uow.usuarios.obter_por_email(usuario.email)
+    metrics.atualizar_gauges(forcar=True)
+    
+    # Assert
+    assert SINGLE_FLIGHT_EXECUTIONS.labels("leituras")._value.get() - execucoes == 1
+    assert SINGLE_FLIGHT_COALESCED.labels("leituras")._value.get() - coalescidas == 0
+    assert metrics.SINGLE_FLIGHT_IN_FLIGHT.labels("leituras")._value.get() == 0
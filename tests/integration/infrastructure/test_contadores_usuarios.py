@@ -0,0 +1,185 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.domain.entities.usuario import PerfilUsuario, Usuario
+from src.infrastructure.database.estatisticas_reconciler import EstatisticasReconciler
+from src.infrastructure.database.models.usuario_contador_model import UsuarioContadorModel
+from src.infrastructure.database.models.usuario_model import UsuarioModel
+from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+
+def _usuario(email: str, **campos) -> Usuario:
+    return Usuario(email=email, senha_hash="hash", nome="Usuário Contado", **campos)
+
+@pytest.mark.asyncio
+async def test_escritas_mantem_os_contadores(db_session):
+    # Arrange
+    repositorio = UsuarioRepository(db_session)
+    admin = await repositorio.criar(_usuario("admin@exemplo.com", perfil=PerfilUsuario.ADMIN))
+    await repositorio.criar_em_lote([_usuario(f"lote{i}@exemplo.com") for i in range(3)])
+    
+    # Act
+    usuario = await repositorio.obter_por_email("lote0@exemplo.com")
+    await repositorio.atualizar_campos(usuario.id, {"ativo": False})
+    await repositorio.atualizar_campos(usuario.id, {"nome": "Só o Nome"})
+    await repositorio.remover(admin.id)
+    await db_session.commit()
+    
+    # Assert
+    assert await repositorio.contar_por_grupo() == {
+        (PerfilUsuario.USUARIO, True): 2,
+        (PerfilUsuario.USUARIO, False): 1,
+    }
+    hoje = datetime.utcnow().date()
+    assert await repositorio.contar_cadastros_por_dia(hoje - timedelta(days=1)) == {hoje: 3}
+
+@pytest.mark.asyncio
+async def test_alterar_situacao_nao_le_a_linha_antes(db_session, comandos_sql, criar_usuarios):
+    # Arrange
+    repositorio = UsuarioRepository(db_session)
+    usuario, outro = await criar_usuarios(quantidade=2)
+    comandos_sql.clear()
+    
+    # Act
+    await repositorio.atualizar_campos(usuario.id, {"ativo": False})
+    outro.nome = "Mesmo Grupo"
+    await repositorio.atualizar(outro)
+    comandos = list(comandos_sql)
+    await db_session.commit()
+    
+    # Assert: ajuste dos contadores e UPDATE, sem SELECT dos valores anteriores
+    assert len(comandos) == 4
+    assert all("INSERT INTO usuario_contadores" in comando for comando in comandos[0::2])
+    assert all(comando.startswith("UPDATE usuarios") for comando in comandos[1::2])
+    assert await repositorio.contar_por_grupo() == {
+        (PerfilUsuario.USUARIO, True): 1,
+        (PerfilUsuario.USUARIO, False): 1,
+    }
+
+@pytest.mark.asyncio
+async def test_contadores_nao_mudam_em_rollback(db_session):
+    # Arrange
+    repositorio = UsuarioRepository(db_session)
+    await repositorio.criar(_usuario("mantido@exemplo.com"))
+    await db_session.commit()
+    
+    # Act
+    await repositorio.criar(_usuario("descartado@exemplo.com"))
+    await db_session.rollback()
+    
+    # Assert
+    assert await repositorio.contar_por_grupo() == {(PerfilUsuario.USUARIO, True): 1}
+
+@pytest.mark.asyncio
+async def test_reconciliacao_corrige_divergencias(db_session):
+    # Arrange: usuário inserido por fora do repositório e contador perdido
+    repositorio = UsuarioRepository(db_session)
+    await repositorio.criar(_usuario("repositorio@exemplo.com"))
+    db_session.add(UsuarioModel(
+        email="externo@exemplo.com",
+        senha_hash="hash",
+        nome="Externo",
+        perfil=PerfilUsuario.ADMIN,
+        data_criacao=datetime(2024, 1, 31, 12),
+    ))
+    await db_session.commit()
+    
+    # Act
+    divergentes = await repositorio.reconciliar_contadores()
+    await db_session.commit()
+    
+    # Assert
+    assert divergentes == 2
+    assert await repositorio.contar_por_grupo() == {
+        (PerfilUsuario.USUARIO, True): 1,
+        (PerfilUsuario.ADMIN, True): 1,
+    }
+    assert datetime(2024, 1, 31).date() in await repositorio.contar_cadastros_por_dia(datetime(2024, 1, 1).date())
+    assert await repositorio.reconciliar_contadores() == 0
+
+@pytest.mark.asyncio
+async def test_reconciliacao_compacta_as_fatias(db_session):
+    # Arrange
+    repositorio = UsuarioRepository(db_session)
+    await repositorio.criar_em_lote([_usuario(f"fatia{i}@exemplo.com") for i in range(5)])
+    for i in range(5):
+        await repositorio.criar(_usuario(f"avulso{i}@exemplo.com"))
+    await db_session.commit()
+    
+    # Act
+    divergentes = await repositorio.reconciliar_contadores()
+    await db_session.commit()
+    linhas = (await db_session.execute(
+        UsuarioContadorModel.__table__.select()
+    )).all()
+    
+    # Assert: uma linha por chave (grupo e dia), com o total
+    assert divergentes == 0
+    assert sorted(linha.total for linha in linhas) == [10, 10]
+
+@pytest.mark.asyncio
+async def test_reconciliacao_le_usuarios_e_contadores_em_um_comando(db_session, comandos_sql):
+    # Arrange
+    repositorio = UsuarioRepository(db_session)
+    await repositorio.criar(_usuario("snapshot@exemplo.com"))
+    await db_session.commit()
+    comandos_sql.clear()
+    
+    # Act
+    await repositorio.reconciliar_contadores()
+    await db_session.commit()
+    
+    # Assert: contagem e soma no mesmo snapshot, sem bloquear a tabela
+    leituras = [comando for comando in comandos_sql if "FROM usuarios" in comando]
+    assert len(leituras) == 1
+    assert "FROM usuario_contadores" in leituras[0]
+    assert not any("LOCK" in comando for comando in comandos_sql)
+
+@pytest.mark.asyncio
+async def test_contar_ativos_desde(db_session):
+    # Arrange
+    agora = datetime.utcnow()
+    repositorio = UsuarioRepository(db_session)
+    await repositorio.criar_em_lote([
+        _usuario("hoje@exemplo.com", ultimo_login=agora - timedelta(hours=1)),
+        _usuario("semana@exemplo.com", ultimo_login=agora - timedelta(days=5)),
+        _usuario("nunca@exemplo.com"),
+    ])
+    await db_session.commit()
+    
+    # Act & Assert
+    assert await repositorio.contar_ativos_desde(agora - timedelta(days=1)) == 1
+    assert await repositorio.contar_ativos_desde(agora - timedelta(days=7)) == 2
+    assert await repositorio.estimar_total() is None
+
+@pytest.mark.asyncio
+async def test_reconciler_usa_sessao_propria(db_engine, db_session):
+    # Arrange
+    db_session.add(UsuarioModel(email="antigo@exemplo.com", senha_hash="hash", nome="Antigo"))
+    await db_session.commit()
+    reconciler = EstatisticasReconciler(async_sessionmaker(db_engine, expire_on_commit=False))
+    
+    # Act
+    divergentes = await reconciler.reconciliar()
+    
+    # Assert
+    assert divergentes == 2
+    assert reconciler.execucoes == 1
+    assert await UsuarioRepository(db_session).contar_por_grupo() == {(PerfilUsuario.USUARIO, True): 1}
+
+@pytest.mark.asyncio
+async def test_reconciler_pula_quando_outro_processo_reconcilia(db_engine, monkeypatch):
+    # Arrange
+    async def em_andamento(self):
+        return None
+    
+    monkeypatch.setattr(UsuarioRepository, "reconciliar_contadores", em_andamento)
+    reconciler = EstatisticasReconciler(async_sessionmaker(db_engine, expire_on_commit=False))
+    
+    # Act
+    resultado = await reconciler.reconciliar()
+    
+    # Assert
+    assert resultado is None
+    assert (reconciler.execucoes, reconciler.puladas) == (0, 1)
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.infrastructure.database.models.usuario_model import UsuarioModel
+from src.infrastructure.database.last_login_recorder import LastLoginRecorder
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+@pytest.fixture
+def session_factory(db_engine):
+    return async_sessionmaker(db_engine, expire_on_commit=False)
+
+async def _obter(session_factory, usuario_id):
+    async with session_factory() as session:
+        uow = SqlAlchemyUnitOfWork(session)
+        async with uow.somente_leitura():
+            return await uow.usuarios.obter_por_id(usuario_id)
+
+@pytest.mark.asyncio
+async def test_logins_repetidos_sao_agrupados(session_factory, comandos_sql, criar_usuarios):
+    # Arrange
+    usuario, outro = await criar_usuarios(quantidade=2)
+    recorder = LastLoginRecorder(session_factory, flush_interval=60)
+    inicio = datetime(2024, 1, 1)
+    comandos_sql.clear()
+    
+    # Act
+    recorder.registrar(usuario.id, inicio)
+    recorder.registrar(usuario.id, inicio + timedelta(minutes=5))
+    recorder.registrar(usuario.id, inicio + timedelta(minutes=1))
+    recorder.registrar(outro.id, inicio)
+    gravados = await recorder.flush()
+    
+    # Assert
+    assert gravados == 2
+    assert len(comandos_sql) == 1
+    assert (await _obter(session_factory, usuario.id)).ultimo_login == inicio + timedelta(minutes=5)
+    assert (await _obter(session_factory, outro.id)).ultimo_login == inicio
+
+@pytest.mark.asyncio
+async def test_login_nao_altera_data_atualizacao(session_factory, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    stmt = select(UsuarioModel.data_atualizacao).where(UsuarioModel.id == usuario.id)
+    async with session_factory() as session:
+        antes = await session.scalar(stmt)
+    recorder = LastLoginRecorder(session_factory, flush_interval=60)
+    
+    # Act
+    recorder.registrar(usuario.id, datetime.utcnow() + timedelta(hours=1))
+    await recorder.flush()
+    
+    # Assert
+    async with session_factory() as session:
+        assert await session.scalar(stmt) == antes
+
+@pytest.mark.asyncio
+async def test_stop_grava_pendentes(session_factory, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(quantidade=1)
+    recorder = LastLoginRecorder(session_factory, flush_interval=60)
+    recorder.start()
+    momento = datetime(2024, 1, 1)
+    
+    # Act
+    recorder.registrar(usuario.id, momento)
+    await recorder.stop()
+    
+    # Assert
+    assert recorder.ativo is False
+    assert recorder.pendentes == 0
+    assert (await _obter(session_factory, usuario.id)).ultimo_login == momento
+
+@pytest.mark.asyncio
+async def test_falha_na_gravacao_devolve_ao_buffer_ate_o_limite(criar_usuarios, caplog):
+    # Arrange: o banco está indisponível
+    def sessao_indisponivel():
+        raise ConnectionError("banco indisponível")
+    
+    usuarios = await criar_usuarios(quantidade=3)
+    recorder = LastLoginRecorder(sessao_indisponivel, flush_interval=60, max_pending=2)
+    inicio = datetime(2024, 1, 1)
+    recorder.registrar(usuarios[0].id, inicio)
+    recorder.registrar(usuarios[1].id, inicio + timedelta(minutes=1))
+    await recorder.flush()
+    
+    # Act: novos logins chegam enquanto o banco continua fora
+    recorder.registrar(usuarios[1].id, inicio + timedelta(minutes=5))
+    recorder.registrar(usuarios[2].id, inicio + timedelta(minutes=2))
+    await recorder.flush()
+    
+    # Assert: fica o login mais recente de cada usuário, sem passar do limite
+    assert recorder._pendentes == {
+        usuarios[1].id: inicio + timedelta(minutes=5),
+        usuarios[2].id: inicio + timedelta(minutes=2),
+    }
+    assert recorder.descartados == 1
+    assert "descartados" in caplog.text
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.application.services.hasher_registry import HasherRegistry
+from src.application.use_cases.usuario_use_cases import UsuarioUseCases
+from src.domain.entities.usuario import Usuario
+from src.infrastructure.auth.hash_algorithms import Argon2idHashAlgorithm, BcryptHashAlgorithm
+from src.infrastructure.auth.password_hasher import PasswordHasher
+from src.infrastructure.cache.principal_cache import PrincipalCache
+from src.infrastructure.database.password_rehasher import PasswordRehasher
+from src.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+@pytest.fixture
+def hasher_argon2():
+    """Hasher cujo padrão é argon2id, aceitando hashes bcrypt antigos."""
+    registry = HasherRegistry(
+        Argon2idHashAlgorithm(time_cost=1, memory_cost=8, parallelism=1),
+        [BcryptHashAlgorithm(rounds=4)]
+    )
+    hasher = PasswordHasher(max_workers=2, registry=registry)
+    yield hasher
+    hasher.shutdown()
+
+@pytest.fixture
+def rehasher(db_engine, hasher_argon2):
+    return PasswordRehasher(async_sessionmaker(db_engine, expire_on_commit=False), hasher_argon2)
+
+@pytest.fixture
+def use_case(db_session, hasher_argon2, rehasher, login_rate_limiter):
+    return UsuarioUseCases(
+        SqlAlchemyUnitOfWork(db_session),
+        password_hasher=hasher_argon2,
+        principal_cache=PrincipalCache(),
+        login_rate_limiter=login_rate_limiter,
+        password_rehasher=rehasher
+    )
+
+def _usuario_com_bcrypt() -> Usuario:
+    return Usuario(
+        email="legado@exemplo.com",
+        senha_hash=BcryptHashAlgorithm(rounds=4).hash("senha_secreta"),
+        nome="Usuário Legado"
+    )
+
+async def _hash_armazenado(db_session, usuario: Usuario) -> Usuario:
+    db_session.expire_all()
+    return await UsuarioRepository(db_session).obter_por_id(usuario.id)
+
+@pytest.mark.asyncio
+async def test_login_migra_o_hash_em_segundo_plano(db_session, use_case, rehasher, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(_usuario_com_bcrypt())
+    
+    # Act
+    await use_case.autenticar_usuario(usuario.email, "senha_secreta")
+    await rehasher.stop()
+    
+    # Assert
+    armazenado = await _hash_armazenado(db_session, usuario)
+    assert armazenado.senha_hash.startswith("$argon2id$")
+    assert armazenado.data_atualizacao == usuario.data_atualizacao
+    assert rehasher.gravados == 1
+    # Próximo login verifica com argon2id e não agenda novo rehash
+    await use_case.autenticar_usuario(usuario.email, "senha_secreta")
+    assert rehasher.agendados == 1
+
+@pytest.mark.asyncio
+async def test_troca_de_senha_concorrente_prevalece(db_session, rehasher, criar_usuarios):
+    # Arrange
+    (usuario,) = await criar_usuarios(_usuario_com_bcrypt())
+    await UsuarioRepository(db_session).atualizar_campos(usuario.id, {"senha_hash": "$2b$04$trocada"})
+    await db_session.commit()
+    
+    # Act: rehash a partir do hash verificado antes da troca
+    rehasher.agendar(usuario.id, "senha_secreta", usuario.senha_hash)
+    await rehasher.stop()
+    
+    # Assert
+    armazenado = await _hash_armazenado(db_session, usuario)
+    assert armazenado.senha_hash == "$2b$04$trocada"
+    assert rehasher.gravados == 0
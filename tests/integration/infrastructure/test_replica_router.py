@@ -0,0 +1,152 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.config.database import Base
+from src.domain.entities.usuario import Usuario
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.database.replica_router import ReplicaRouter, criar_replica
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+async def _criar_banco(url: str, *emails: str):
+    """Banco SQLite em arquivo; cada um recebe emails distintos para identificá-lo."""
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine)() as session:
+        uow = SqlAlchemyUnitOfWork(session)
+        async with uow:
+            for email in emails:
+                await uow.usuarios.criar(Usuario(email=email, senha_hash="hash", nome="Usuário"))
+            await uow.commit()
+    return engine
+
+@pytest_asyncio.fixture
+async def bancos(tmp_path):
+    """Primário e duas réplicas, como arquivos SQLite independentes."""
+    engines = {
+        nome: await _criar_banco(f"sqlite+aiosqlite:///{tmp_path / nome}.db", f"{nome}@exemplo.com")
+        for nome in ("primario", "replica-0", "replica-1")
+    }
+    yield engines
+    for engine in engines.values():
+        await engine.dispose()
+
+class Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+async def _origem_da_leitura(uow: SqlAlchemyUnitOfWork) -> str:
+    async with uow.somente_leitura():
+        (usuario,) = await uow.usuarios.listar()
+    return usuario.email.split("@")[0]
+
+@pytest.mark.asyncio
+async def test_round_robin_alterna_entre_as_replicas(bancos):
+    # Arrange
+    replicas = ReplicaRouter([criar_replica(nome, bancos[nome]) for nome in ("replica-0", "replica-1")])
+
+    # Act
+    async with async_sessionmaker(bancos["primario"])() as session:
+        uow = SqlAlchemyUnitOfWork(session, replicas=replicas)
+        origens = [await _origem_da_leitura(uow) for _ in range(4)]
+
+    # Assert
+    assert origens == ["replica-0", "replica-1", "replica-0", "replica-1"]
+
+@pytest.mark.asyncio
+async def test_least_connections_escolhe_a_replica_menos_ocupada(bancos):
+    # Arrange
+    replicas = ReplicaRouter(
+        [criar_replica(nome, bancos[nome]) for nome in ("replica-0", "replica-1")],
+        estrategia="least_connections"
+    )
+    ocupada, sessao = await replicas.abrir_sessao()
+
+    # Act
+    async with async_sessionmaker(bancos["primario"])() as session:
+        origem = await _origem_da_leitura(SqlAlchemyUnitOfWork(session, replicas=replicas))
+    await replicas.liberar(ocupada, sessao)
+
+    # Assert
+    assert ocupada.nome == "replica-0"
+    assert origem == "replica-1"
+
+@pytest.mark.asyncio
+async def test_leitura_apos_escrita_fica_no_primario(bancos):
+    # Arrange
+    replicas = ReplicaRouter([criar_replica("replica-0", bancos["replica-0"])])
+
+    async with async_sessionmaker(bancos["primario"], expire_on_commit=False)() as session:
+        uow = SqlAlchemyUnitOfWork(session, replicas=replicas)
+        antes = await _origem_da_leitura(uow)
+
+        # Act
+        async with uow:
+            await uow.usuarios.criar(Usuario(email="novo@exemplo.com", senha_hash="hash", nome="Novo"))
+            await uow.commit()
+        async with uow.somente_leitura():
+            emails = {usuario.email for usuario in await uow.usuarios.listar()}
+
+    # Assert
+    assert antes == "replica-0"
+    assert emails == {"primario@exemplo.com", "novo@exemplo.com"}
+
+@pytest.mark.asyncio
+async def test_replica_indisponivel_cai_para_o_primario(bancos, tmp_path):
+    # Arrange
+    relogio = Relogio()
+    quebrada = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/inexistente/replica.db")
+    replicas = ReplicaRouter(
+        [criar_replica("quebrada", quebrada)], tempo_quarentena=30, clock=relogio
+    )
+
+    async with async_sessionmaker(bancos["primario"])() as session:
+        uow = SqlAlchemyUnitOfWork(session, replicas=replicas)
+
+        # Act
+        primeira = await _origem_da_leitura(uow)
+        segunda = await _origem_da_leitura(uow)
+        relogio.agora = 31
+        terceira = await _origem_da_leitura(uow)
+    await quebrada.dispose()
+
+    # Assert
+    assert [primeira, segunda, terceira] == ["primario"] * 3
+    # Em quarentena a réplica nem é tentada; depois dela, uma nova tentativa
+    assert replicas.replicas[0].falhas == 2
+    assert replicas.stats.fallbacks == 3
+
+@pytest.mark.asyncio
+async def test_leitura_em_replica_atrasada_nao_preenche_o_cache(bancos):
+    # Arrange: a réplica ainda tem o usuário ativo que o primário já desativou
+    usuario = Usuario(email="atrasado@exemplo.com", senha_hash="hash", nome="Usuário")
+    for nome in ("primario", "replica-0"):
+        async with async_sessionmaker(bancos[nome])() as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            async with uow:
+                await uow.usuarios.criar(usuario)
+                await uow.commit()
+    cache = InMemoryCache()
+    replicas = ReplicaRouter([criar_replica("replica-0", bancos["replica-0"])])
+
+    async with async_sessionmaker(bancos["primario"])() as session:
+        uow = SqlAlchemyUnitOfWork(session, cache=cache)
+        async with uow:
+            await uow.usuarios.atualizar_campos(usuario.id, {"ativo": False})
+            await uow.commit()
+
+        # Act
+        uow = SqlAlchemyUnitOfWork(session, replicas=replicas, cache=cache)
+        async with uow.somente_leitura():
+            lido_na_replica = await uow.usuarios.obter_por_id(usuario.id)
+        outro_worker = SqlAlchemyUnitOfWork(session, cache=cache)
+        async with outro_worker.somente_leitura():
+            lido_no_primario = await outro_worker.usuarios.obter_por_id(usuario.id)
+
+    # Assert
+    assert lido_na_replica.ativo is True
+    assert lido_no_primario.ativo is False
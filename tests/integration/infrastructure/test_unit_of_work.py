@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy import event
+
+from src.domain.entities.usuario import Usuario
+from src.infrastructure.database.replica_router import ReplicaRouter, criar_replica
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+@pytest.fixture
+def commits(db_session):
+    """Contador de commits efetivos da sessão."""
+    registros = []
+    
+    def registrar(session):
+        registros.append(session)
+    
+    event.listen(db_session.sync_session, "after_commit", registrar)
+    yield registros
+    event.remove(db_session.sync_session, "after_commit", registrar)
+
+def _novo_usuario(email="usuario@exemplo.com") -> Usuario:
+    return Usuario(email=email, senha_hash="hash", nome="Usuário Teste")
+
+@pytest.mark.asyncio
+async def test_commit_unico_ao_final_do_comando(db_session, commits):
+    # Arrange
+    uow = SqlAlchemyUnitOfWork(db_session)
+    
+    # Act
+    async with uow:
+        await uow.usuarios.criar(_novo_usuario("um@exemplo.com"))
+        await uow.usuarios.criar(_novo_usuario("dois@exemplo.com"))
+        await uow.commit()
+    
+    # Assert
+    assert len(commits) == 1
+    async with uow.somente_leitura():
+        assert len(await uow.usuarios.listar()) == 2
+
+@pytest.mark.asyncio
+async def test_erro_desfaz_a_transacao(db_session, commits):
+    # Arrange
+    uow = SqlAlchemyUnitOfWork(db_session)
+    usuario = _novo_usuario()
+    
+    # Act
+    with pytest.raises(RuntimeError):
+        async with uow:
+            await uow.usuarios.criar(usuario)
+            raise RuntimeError("falha no meio do comando")
+    
+    # Assert
+    assert commits == []
+    async with uow.somente_leitura():
+        assert await uow.usuarios.obter_por_id(usuario.id) is None
+
+@pytest.mark.asyncio
+async def test_comando_sem_commit_e_descartado(db_session, commits):
+    # Arrange
+    uow = SqlAlchemyUnitOfWork(db_session)
+    usuario = _novo_usuario()
+    
+    # Act
+    async with uow:
+        await uow.usuarios.criar(usuario)
+    
+    # Assert
+    async with uow.somente_leitura():
+        assert await uow.usuarios.obter_por_id(usuario.id) is None
+
+@pytest.mark.asyncio
+async def test_leitura_aninhada_usa_transacao_do_comando(db_session, commits):
+    # Arrange
+    uow = SqlAlchemyUnitOfWork(db_session)
+    usuario = _novo_usuario()
+    
+    # Act
+    async with uow:
+        await uow.usuarios.criar(usuario)
+        async with uow.somente_leitura():
+            encontrado = await uow.usuarios.obter_por_id(usuario.id)
+        await uow.commit()
+    
+    # Assert
+    assert encontrado is not None
+    assert len(commits) == 1
+
+@pytest.mark.asyncio
+async def test_leitura_usa_sessao_de_replica_sem_commit(db_session, db_engine, commits):
+    # Arrange
+    replicas = ReplicaRouter([criar_replica("replica-0", db_engine)])
+    uow = SqlAlchemyUnitOfWork(db_session, replicas=replicas)
+    
+    # Act
+    async with uow.somente_leitura():
+        repositorio_leitura = uow.usuarios
+        await uow.usuarios.listar()
+    
+    # Assert
+    assert repositorio_leitura.session is not db_session
+    assert uow.usuarios.session is db_session
+    assert replicas.replicas[0].em_uso == 0
+    assert commits == []
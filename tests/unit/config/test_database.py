@@ -0,0 +1,54 @@
+from src.config.database import build_async_url, build_engine_options
+from src.config.settings import Settings
+
+def test_build_async_url_postgres_usa_asyncpg():
+    # Arrange & Act
+    url = build_async_url("postgresql://postgres:postgres@db:5432/app_db")
+    
+    # Assert
+    assert url == "postgresql+asyncpg://postgres:postgres@db:5432/app_db"
+
+def test_build_async_url_sqlite_usa_aiosqlite():
+    # Arrange & Act
+    url = build_async_url("sqlite:///./app.db")
+    
+    # Assert
+    assert url == "sqlite+aiosqlite:///./app.db"
+
+def test_build_async_url_mantem_driver_assincrono():
+    # Arrange & Act
+    url = build_async_url("sqlite+aiosqlite:///:memory:")
+    
+    # Assert
+    assert url == "sqlite+aiosqlite:///:memory:"
+
+def test_build_engine_options_postgres():
+    # Arrange
+    settings = Settings(
+        DATABASE_URL="postgresql://postgres:postgres@db:5432/app_db",
+        DATABASE_POOL_SIZE=5,
+        DATABASE_MAX_OVERFLOW=7,
+        DATABASE_POOL_RECYCLE=600,
+        DATABASE_STATEMENT_TIMEOUT_MS=1500
+    )
+    
+    # Act
+    options = build_engine_options(settings)
+    
+    # Assert
+    assert options["pool_size"] == 5
+    assert options["max_overflow"] == 7
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"]["server_settings"]["statement_timeout"] == "1500"
+
+def test_build_engine_options_sqlite_ignora_tamanho_do_pool():
+    # Arrange
+    settings = Settings(DATABASE_URL="sqlite:///./app.db")
+    
+    # Act
+    options = build_engine_options(settings)
+    
+    # Assert
+    assert "pool_size" not in options
+    assert "connect_args" not in options
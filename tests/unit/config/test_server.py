@@ -0,0 +1,53 @@
+from src.config.server import (
+    VARIAVEL_WORKER_PRINCIPAL,
+    build_server_config,
+    cpus_disponiveis,
+    numero_de_workers,
+    worker_principal
+)
+from src.config.settings import Settings
+
+def test_build_server_config_producao():
+    # Arrange
+    settings = Settings(
+        SERVER_PORT=9000,
+        SERVER_BACKLOG=4096,
+        SERVER_KEEPALIVE_SECONDS=90,
+        SERVER_GRACEFUL_TIMEOUT_SECONDS=20,
+        SERVER_LIMIT_CONCURRENCY=0
+    )
+    
+    # Act
+    config = build_server_config(settings)
+    
+    # Assert
+    assert config.port == 9000
+    assert config.backlog == 4096
+    assert config.timeout_keep_alive == 90
+    assert config.timeout_graceful_shutdown == 20
+    assert config.limit_concurrency is None
+    assert (config.loop, config.http, config.lifespan) == ("auto", "auto", "on")
+    assert config.reload is False
+
+def test_numero_de_workers_configurado():
+    # Arrange & Act & Assert
+    assert numero_de_workers(Settings(SERVER_WORKERS=3)) == 3
+
+def test_numero_de_workers_automatico_usa_as_cpus():
+    # Arrange & Act
+    workers = numero_de_workers(Settings(SERVER_WORKERS=0))
+    
+    # Assert
+    assert workers == cpus_disponiveis() >= 1
+
+def test_apenas_o_worker_principal_executa_tarefas_unicas(monkeypatch):
+    # Arrange
+    monkeypatch.delenv(VARIAVEL_WORKER_PRINCIPAL, raising=False)
+    sem_supervisor = worker_principal()
+    
+    # Act
+    monkeypatch.setenv(VARIAVEL_WORKER_PRINCIPAL, "0")
+    
+    # Assert
+    assert sem_supervisor is True
+    assert worker_principal() is False
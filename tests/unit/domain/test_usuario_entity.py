@@ -1,6 +1,6 @@
 import pytest
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from src.domain.entities.usuario import Usuario, PerfilUsuario
 from src.domain.exceptions.domain_exceptions import DomainValidationError
@@ -100,4 +100,46 @@ def test_registrar_login():
     
     # Assert
     assert usuario.ultimo_login is not None
-    assert isinstance(usuario.ultimo_login, datetime)
\ No newline at end of file
+    assert isinstance(usuario.ultimo_login, datetime)
+
+def test_criar_usuario_preserva_data_atualizacao_informada():
+    # Arrange
+    data = datetime(2024, 1, 1, 12, 0)
+    
+    # Act
+    usuario = Usuario(
+        email="usuario@exemplo.com",
+        senha_hash="hashed_password",
+        nome="Usuário Teste",
+        data_criacao=data,
+        data_atualizacao=data
+    )
+    
+    # Assert
+    assert usuario.data_atualizacao == data
+
+def test_from_persistence_nao_valida_nem_altera_os_dados():
+    # Arrange
+    usuario_id = uuid4()
+    data_criacao = datetime(2024, 1, 1)
+    data_atualizacao = datetime(2024, 2, 1)
+    
+    # Act
+    usuario = Usuario.from_persistence(
+        id=usuario_id,
+        email="legado-sem-arroba",
+        senha_hash="hashed_password",
+        nome="Usuário Teste",
+        perfil=PerfilUsuario.ADMIN,
+        ativo=False,
+        data_criacao=data_criacao,
+        data_atualizacao=data_atualizacao
+    )
+    
+    # Assert
+    assert usuario.id == usuario_id
+    assert usuario.email == "legado-sem-arroba"
+    assert usuario.data_criacao == data_criacao
+    assert usuario.data_atualizacao == data_atualizacao
+    assert usuario.ultimo_login is None
+    assert not hasattr(usuario, "__dict__")
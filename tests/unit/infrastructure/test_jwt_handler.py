@@ -0,0 +1,85 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import jwt
+import pytest
+
+from src.infrastructure.auth import jwt_handler
+from src.infrastructure.auth.jwt_handler import (
+    create_access_token,
+    decode_token,
+    revoke_token,
+    revoke_user_tokens,
+)
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+@pytest.fixture
+def decodificacoes(monkeypatch):
+    """Cache limpo e contador de verificações reais do token."""
+    monkeypatch.setattr(jwt_handler, "_token_cache", TTLCache(max_size=100, clock=jwt_handler.time.time))
+    chamadas = []
+    decode_original = jwt.decode
+    
+    def decode_contado(*args, **kwargs):
+        chamadas.append(args[0])
+        return decode_original(*args, **kwargs)
+    
+    monkeypatch.setattr(jwt_handler.jwt, "decode", decode_contado)
+    return chamadas
+
+def test_token_repetido_e_servido_do_cache(decodificacoes):
+    # Arrange
+    token = create_access_token({"sub": str(uuid4())})
+    
+    # Act
+    primeiro = decode_token(token)
+    segundo = decode_token(token)
+    
+    # Assert
+    assert primeiro == segundo
+    assert len(decodificacoes) == 1
+
+def test_decode_sem_cache_sempre_verifica(decodificacoes):
+    # Arrange
+    token = create_access_token({"sub": str(uuid4())})
+    
+    # Act
+    decode_token(token, use_cache=False)
+    decode_token(token, use_cache=False)
+    
+    # Assert
+    assert len(decodificacoes) == 2
+
+def test_token_expirado_nao_e_aceito(decodificacoes):
+    # Arrange
+    token = create_access_token({"sub": str(uuid4())}, expires_delta=timedelta(seconds=-1))
+    
+    # Act & Assert
+    assert decode_token(token) is None
+
+def test_revoke_token_remove_do_cache(decodificacoes):
+    # Arrange
+    token = create_access_token({"sub": str(uuid4())})
+    decode_token(token)
+    
+    # Act
+    revoke_token(token)
+    decode_token(token)
+    
+    # Assert
+    assert len(decodificacoes) == 2
+
+def test_revoke_user_tokens_remove_apenas_tokens_do_usuario(decodificacoes):
+    # Arrange
+    usuario_id = uuid4()
+    token_usuario = create_access_token({"sub": str(usuario_id)})
+    token_outro = create_access_token({"sub": str(uuid4())})
+    decode_token(token_usuario)
+    decode_token(token_outro)
+    
+    # Act
+    removidos = revoke_user_tokens(usuario_id)
+    
+    # Assert
+    assert removidos == 1
+    assert len(jwt_handler.get_token_cache()) == 1
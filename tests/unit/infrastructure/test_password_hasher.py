@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from src.application.services.hasher_registry import HasherRegistry
+from src.domain.exceptions.domain_exceptions import TooManyRequestsError
+from src.infrastructure.auth.hash_algorithms import Argon2idHashAlgorithm, BcryptHashAlgorithm
+from src.infrastructure.auth.password_hasher import PasswordHasher
+
+@pytest.mark.asyncio
+async def test_hash_e_verificacao_de_senha():
+    # Arrange
+    hasher = PasswordHasher(rounds=4, max_workers=2)
+    
+    # Act
+    senha_hash = await hasher.hash("senha_secreta")
+    
+    # Assert
+    assert senha_hash.startswith("$2b$04$")
+    assert await hasher.verify("senha_secreta", senha_hash) is True
+    assert await hasher.verify("senha_errada", senha_hash) is False
+    assert hasher.hash_latency.count == 1
+    assert hasher.verify_latency.count == 2
+    hasher.shutdown()
+
+@pytest.mark.asyncio
+async def test_rejeita_quando_fila_esta_cheia():
+    # Arrange
+    hasher = PasswordHasher(rounds=10, max_workers=1, max_pending=0)
+    
+    # Act
+    resultados = await asyncio.gather(
+        hasher.hash("senha_secreta"),
+        hasher.hash("senha_secreta"),
+        return_exceptions=True
+    )
+    
+    # Assert
+    assert isinstance(resultados[0], str)
+    assert isinstance(resultados[1], TooManyRequestsError)
+    assert hasher.rejected == 1
+    assert hasher.queue_depth == 0
+    hasher.shutdown()
+
+@pytest.mark.asyncio
+async def test_hash_em_lote_respeita_o_limite_de_pendentes():
+    # Arrange
+    hasher = PasswordHasher(rounds=10, max_workers=1, max_pending=0)
+    
+    # Act: um hash interativo ocupa a única vaga
+    resultados = await asyncio.gather(
+        hasher.hash("senha_secreta"),
+        hasher.hash_many(["senha_secreta", "outra_senha"]),
+        return_exceptions=True
+    )
+    
+    # Assert
+    assert isinstance(resultados[0], str)
+    assert isinstance(resultados[1], TooManyRequestsError)
+    assert hasher.rejected >= 1
+    hasher.shutdown()
+
+@pytest.mark.asyncio
+async def test_hash_ficticio_e_gerado_uma_unica_vez():
+    # Arrange
+    hasher = PasswordHasher(rounds=4, max_workers=2)
+    
+    # Act
+    resultados = await asyncio.gather(*(hasher.verify_dummy("senha") for _ in range(4)))
+    
+    # Assert
+    assert resultados == [False] * 4
+    assert hasher.hash_latency.count == 1
+    assert hasher.verify_latency.count == 4
+    hasher.shutdown()
+
+def _argon2_rapido() -> Argon2idHashAlgorithm:
+    return Argon2idHashAlgorithm(time_cost=1, memory_cost=8, parallelism=1)
+
+@pytest.mark.asyncio
+async def test_verifica_com_o_algoritmo_do_hash_armazenado():
+    # Arrange
+    bcrypt_antigo = BcryptHashAlgorithm(rounds=4)
+    hasher = PasswordHasher(max_workers=2, registry=HasherRegistry(_argon2_rapido(), [bcrypt_antigo]))
+    hash_bcrypt = bcrypt_antigo.hash("senha_secreta")
+    
+    # Act
+    hash_novo = await hasher.hash("senha_secreta")
+    
+    # Assert
+    assert hash_novo.startswith("$argon2id$")
+    assert await hasher.verify("senha_secreta", hash_novo) is True
+    assert await hasher.verify("senha_secreta", hash_bcrypt) is True
+    assert await hasher.verify("senha_errada", hash_bcrypt) is False
+    assert await hasher.verify("senha_secreta", "formato-desconhecido") is False
+    hasher.shutdown()
+
+def test_detecta_hash_desatualizado():
+    # Arrange
+    registry = HasherRegistry(BcryptHashAlgorithm(rounds=5), [_argon2_rapido()])
+    
+    # Act & Assert
+    assert registry.precisa_rehash(BcryptHashAlgorithm(rounds=4).hash("x")) is True
+    assert registry.precisa_rehash(BcryptHashAlgorithm(rounds=5).hash("x")) is False
+    assert registry.precisa_rehash(_argon2_rapido().hash("x")) is True
+    assert registry.precisa_rehash("formato-desconhecido") is False
+
+def test_argon2_com_parametros_antigos_precisa_rehash():
+    # Arrange
+    atual = Argon2idHashAlgorithm(time_cost=2, memory_cost=8, parallelism=1)
+    
+    # Act & Assert
+    assert atual.precisa_rehash(_argon2_rapido().hash("x")) is True
+    assert atual.precisa_rehash(atual.hash("x")) is False
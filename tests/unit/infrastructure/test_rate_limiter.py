@@ -0,0 +1,91 @@
+import pytest
+
+from src.domain.exceptions.domain_exceptions import TooManyRequestsError
+from src.infrastructure.auth.rate_limiter import CacheRateLimiter, InMemoryRateLimiter, LoginRateLimiter
+from src.infrastructure.cache.memory_cache import InMemoryCache
+
+class RelogioFalso:
+    def __init__(self, agora: float = 0.0):
+        self.agora = agora
+
+    def __call__(self) -> float:
+        return self.agora
+
+class CacheIndisponivel(InMemoryCache):
+    async def incr(self, key, ttl=None):
+        raise ConnectionError("cache fora do ar")
+
+@pytest.mark.asyncio
+async def test_token_bucket_permite_rajada_e_repoe_com_o_tempo():
+    # Arrange
+    relogio = RelogioFalso()
+    limitador = InMemoryRateLimiter(clock=relogio)
+    
+    # Act
+    rajada = [await limitador.consumir("ip:1", 3, 1.0) for _ in range(3)]
+    excedente = await limitador.consumir("ip:1", 3, 1.0)
+    relogio.agora = 1.0
+    apos_reposicao = await limitador.consumir("ip:1", 3, 1.0)
+    
+    # Assert
+    assert rajada == [0, 0, 0]
+    assert excedente == pytest.approx(1.0)
+    assert apos_reposicao == 0
+
+@pytest.mark.asyncio
+async def test_token_bucket_limita_o_numero_de_chaves():
+    # Arrange
+    limitador = InMemoryRateLimiter(max_keys=2, clock=RelogioFalso())
+    
+    # Act
+    for chave in ("a", "b", "c"):
+        await limitador.consumir(chave, 1, 1.0)
+    
+    # Assert: "a" foi descartada e volta com o balde cheio
+    assert await limitador.consumir("a", 1, 1.0) == 0
+    assert await limitador.consumir("c", 1, 1.0) > 0
+
+@pytest.mark.asyncio
+async def test_limitador_compartilhado_usa_janelas_fixas():
+    # Arrange
+    relogio = RelogioFalso(agora=100.0)
+    cache = InMemoryCache()
+    # Dois workers com o mesmo backend
+    limitadores = [CacheRateLimiter(cache, clock=relogio) for _ in range(2)]
+    
+    # Act
+    esperas = [await limitadores[i % 2].consumir("email:a", 2, 0.1) for i in range(3)]
+    relogio.agora = 120.0
+    nova_janela = await limitadores[0].consumir("email:a", 2, 0.1)
+    
+    # Assert: janela de 20 s a partir de 100
+    assert esperas == [0, 0, pytest.approx(20.0)]
+    assert nova_janela == 0
+
+@pytest.mark.asyncio
+async def test_limitador_compartilhado_usa_o_local_se_o_cache_falhar():
+    # Arrange
+    limitador = CacheRateLimiter(CacheIndisponivel(), reserva=InMemoryRateLimiter(clock=RelogioFalso()))
+    
+    # Act
+    esperas = [await limitador.consumir("ip:1", 1, 1.0) for _ in range(2)]
+    
+    # Assert
+    assert esperas[0] == 0
+    assert esperas[1] > 0
+
+@pytest.mark.asyncio
+async def test_login_bloqueado_por_ip_nao_consome_o_email():
+    # Arrange
+    limitador = InMemoryRateLimiter(clock=RelogioFalso())
+    login = LoginRateLimiter(limitador, capacidade_ip=1, capacidade_email=1)
+    await login.verificar("alvo@exemplo.com", "10.0.0.1")
+    
+    # Act
+    with pytest.raises(TooManyRequestsError) as excinfo:
+        await login.verificar("outro@exemplo.com", "10.0.0.1")
+    
+    # Assert
+    assert excinfo.value.retry_after == 3
+    assert login.rejeitadas == 1
+    assert await limitador.consumir("email:outro@exemplo.com", 1, 1.0) == 0
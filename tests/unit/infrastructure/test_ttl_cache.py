@@ -0,0 +1,64 @@
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+class RelogioFalso:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+def test_retorna_valor_antes_de_expirar():
+    # Arrange
+    relogio = RelogioFalso()
+    cache = TTLCache(max_size=10, ttl=5, clock=relogio)
+    cache.set("a", 1)
+    
+    # Act
+    relogio.agora = 4.9
+    valor = cache.get("a")
+    
+    # Assert
+    assert valor == 1
+    assert cache.hits == 1
+
+def test_expira_apos_ttl():
+    # Arrange
+    relogio = RelogioFalso()
+    cache = TTLCache(max_size=10, ttl=5, clock=relogio)
+    cache.set("a", 1)
+    
+    # Act
+    relogio.agora = 5
+    valor = cache.get("a")
+    
+    # Assert
+    assert valor is None
+    assert cache.misses == 1
+    assert len(cache) == 0
+
+def test_descarta_menos_recentemente_usado():
+    # Arrange
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    
+    # Act
+    cache.set("c", 3)
+    
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+def test_invalidate_remove_entrada():
+    # Arrange
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set("a", 1)
+    
+    # Act
+    cache.invalidate("a")
+    
+    # Assert
+    assert cache.get("a") is None